@@ -0,0 +1 @@
+"""Benchmark suite for the message store, consumer and entity store hot paths."""
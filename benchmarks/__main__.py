@@ -0,0 +1,114 @@
+"""Run the benchmark suite or compare two result files.
+
+Usage:
+    python -m benchmarks run --backend memory --output baseline.json
+    MESSAGE_DB_DSN=postgresql://message_store@localhost/message_store \
+        python -m benchmarks run --backend postgres --output results.json
+    python -m benchmarks compare baseline.json results.json --threshold 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from benchmarks.runner import compare, load, measure, regressions, save, to_document
+from benchmarks.suite import build_suite
+from eventide_python.message_db import (
+    InMemoryMessageDBClient,
+    MessageDBClient,
+    PoolConfig,
+    PostgresMessageDBClient,
+)
+
+# In-memory rounds are short, so they need larger workloads to measure reliably.
+DEFAULT_SCALES = {"memory": 10.0, "postgres": 1.0}
+
+
+def run(args: argparse.Namespace) -> int:
+    scale = args.scale or DEFAULT_SCALES[args.backend]
+    if args.backend == "postgres" and not args.dsn:
+        raise SystemExit("--dsn or MESSAGE_DB_DSN is required for the postgres backend")
+
+    results = {}
+    for benchmark in build_suite(scale):
+        if args.only and benchmark.name not in args.only:
+            continue
+        client = new_client(args.backend, args.dsn)
+        try:
+            result = measure(benchmark, client, args.repeat)
+        finally:
+            if isinstance(client, PostgresMessageDBClient):
+                client.close()
+        results[benchmark.name] = result
+        print(
+            f"{benchmark.name:<24} {result.ops_per_second:>14,.0f} ops/s"
+            f"  best {result.best_seconds * 1000:>9.2f} ms"
+        )
+
+    document = to_document(args.backend, scale, results)
+    if args.output:
+        save(Path(args.output), document)
+    if args.baseline:
+        return report(load(Path(args.baseline)), document, args.threshold)
+    return 0
+
+
+def new_client(backend: str, dsn: str | None) -> MessageDBClient:
+    # A fresh client per benchmark keeps data written by earlier benchmarks out of the heap.
+    if backend == "postgres":
+        assert dsn is not None
+        return PostgresMessageDBClient(dsn, pool=PoolConfig(min_size=1, max_size=1))
+    return InMemoryMessageDBClient()
+
+
+def compare_files(args: argparse.Namespace) -> int:
+    return report(load(Path(args.baseline)), load(Path(args.current)), args.threshold)
+
+
+def report(baseline: dict, current: dict, threshold: float) -> int:
+    if baseline["backend"] != current["backend"] or baseline["scale"] != current["scale"]:
+        print("warning: comparing results from different backends or scales", file=sys.stderr)
+    comparisons = compare(baseline, current)
+    regressed = regressions(comparisons, threshold)
+    for comparison in comparisons:
+        flag = "REGRESSION" if comparison in regressed else ""
+        print(
+            f"{comparison.name:<24} {comparison.baseline:>14,.0f} -> {comparison.current:>14,.0f}"
+            f" ops/s {comparison.change:>+8.1%} {flag}"
+        )
+    if regressed:
+        print(f"{len(regressed)} benchmark(s) regressed by more than {threshold:.0%}")
+        return 1
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the suite")
+    run_parser.add_argument("--backend", choices=("memory", "postgres"), default="memory")
+    run_parser.add_argument("--dsn", default=os.getenv("MESSAGE_DB_DSN"))
+    run_parser.add_argument("--scale", type=float, help="multiplier for the workload sizes")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--only", nargs="*", help="benchmark names to run")
+    run_parser.add_argument("--output", help="write results as JSON to this path")
+    run_parser.add_argument("--baseline", help="compare the results against this JSON file")
+    run_parser.add_argument("--threshold", type=float, default=0.1)
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    compare_parser.set_defaults(handler=compare_files)
+
+    args = parser.parse_args()
+    sys.exit(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Report retained bytes per message for a page of read messages.
+
+Usage:
+    python benchmarks/adhoc/bench_memory.py --messages 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from eventide_python.message_db.serialization import READ_MESSAGE_COLUMNS, read_message_row_factory
+
+
+@dataclass(frozen=True)
+class DictReadMessage:
+    """The previous layout: a frozen dataclass with a per-instance __dict__."""
+
+    id: str | None
+    type: str
+    data: Any = None
+    metadata: Any = None
+    stream_name: str = ""
+    position: int = 0
+    global_position: int = 0
+    time: datetime | None = None
+
+
+class Column:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class Cursor:
+    description = [Column(name) for name in READ_MESSAGE_COLUMNS]
+
+
+def make_rows(count: int) -> list[tuple]:
+    # Every row gets a fresh stream_name and type string, as the driver would return them.
+    return [
+        (
+            f"{index:032x}",
+            "".join(["account-", str(index % 100)]),
+            "".join(["Deposit", "ed"]),
+            index // 100,
+            index + 1,
+            '{"amount": 100}',
+            '{"correlationStreamName": "transfer-1"}',
+            datetime(2024, 1, 1),
+        )
+        for index in range(count)
+    ]
+
+
+def legacy(rows: list[tuple]) -> list[DictReadMessage]:
+    messages = []
+    for values in rows:
+        row = dict(zip(READ_MESSAGE_COLUMNS, values, strict=True))
+        messages.append(
+            DictReadMessage(
+                id=row["id"],
+                stream_name=row["stream_name"],
+                type=row["type"],
+                position=row["position"],
+                global_position=row["global_position"],
+                data=json.loads(row["data"]),
+                metadata=json.loads(row["metadata"]),
+                time=row["time"],
+            )
+        )
+    return messages
+
+
+def compact(rows: list[tuple], lazy: bool = False) -> list:
+    make_row = read_message_row_factory(lazy=lazy)(Cursor())
+    return [make_row(values) for values in rows]
+
+
+def bytes_per_message(build, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    rows = make_rows(count)
+    messages = build(rows)
+    del rows
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    assert len(messages) == count
+    return retained / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=100_000)
+    args = parser.parse_args()
+
+    variants = {
+        "dict dataclass": legacy,
+        "slotted": compact,
+        "slotted lazy": lambda rows: compact(rows, lazy=True),
+    }
+    for label, build in variants.items():
+        print(f"{label:<16} {bytes_per_message(build, args.messages):>10.1f} bytes/message")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import statistics
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from eventide_python.message_db.client import MessageDBClient
+
+Run = Callable[[], None]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    operations: int
+    prepare: Callable[[MessageDBClient], Run]
+
+
+@dataclass(frozen=True)
+class Measurement:
+    operations: int
+    best_seconds: float
+    median_seconds: float
+
+    @property
+    def ops_per_second(self) -> float:
+        return self.operations / self.best_seconds if self.best_seconds else 0.0
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return self.current / self.baseline - 1.0 if self.baseline else 0.0
+
+
+def measure(benchmark: Benchmark, client: MessageDBClient, repeat: int) -> Measurement:
+    samples = []
+    for _ in range(repeat):
+        run = benchmark.prepare(client)
+        # Like timeit, keep garbage collection of earlier rounds out of the timing.
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            run()
+            samples.append(time.perf_counter() - started)
+        finally:
+            gc.enable()
+    return Measurement(
+        operations=benchmark.operations,
+        best_seconds=min(samples),
+        median_seconds=statistics.median(samples),
+    )
+
+
+def to_document(backend: str, scale: float, results: dict[str, Measurement]) -> dict[str, Any]:
+    return {
+        "backend": backend,
+        "scale": scale,
+        "created": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {
+            name: {**asdict(result), "ops_per_second": result.ops_per_second}
+            for name, result in results.items()
+        },
+    }
+
+
+def save(path: Path, document: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+
+
+def load(path: Path) -> dict[str, Any]:
+    return json.loads(path.read_text())  # type: ignore[no-any-return]
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> list[Comparison]:
+    baseline_results = baseline["results"]
+    return [
+        Comparison(
+            name=name,
+            baseline=baseline_results[name]["ops_per_second"],
+            current=result["ops_per_second"],
+        )
+        for name, result in current["results"].items()
+        if name in baseline_results
+    ]
+
+
+def regressions(comparisons: Iterable[Comparison], threshold: float) -> list[Comparison]:
+    return [comparison for comparison in comparisons if comparison.change < -threshold]
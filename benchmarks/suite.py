@@ -0,0 +1,378 @@
+from __future__ import annotations
+
+import sqlite3
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from benchmarks.runner import Benchmark, Run
+from eventide_python import stream_name
+from eventide_python.consumer import Consumer, InMemoryPositionStore
+from eventide_python.entity_snapshot import SnapshotStore
+from eventide_python.entity_store import EntityProjection, EntityStore
+from eventide_python.message_db.client import MessageDBClient
+from eventide_python.message_db.codec import CODECS, JsonCodec, get_codec
+from eventide_python.message_db.errors import MessageDBError
+from eventide_python.message_db.message_data import ReadMessage
+from eventide_python.message_db.serialization import READ_MESSAGE_COLUMNS, read_message_row_factory
+
+WRITE_BATCH_SIZE = 100
+CATEGORY_STREAMS = 100
+HYDRATION_STREAM_LENGTHS = (10, 100, 1000)
+SMALL_READ_SIZE = 10
+CODEC_PAYLOAD_BYTES = {"1kb": 1024, "50kb": 50 * 1024}
+
+
+@dataclass
+class Account:
+    balance: int = 0
+
+
+class AccountProjection(EntityProjection):
+    @EntityProjection.apply("Deposited")
+    def apply_deposited(self, message: ReadMessage) -> None:
+        self.entity.balance += message.data["amount"]
+
+
+def build_suite(scale: float) -> list[Benchmark]:
+    messages = max(int(1000 * scale), 1)
+    snapshots = max(int(200 * scale), 1)
+    names = max(int(10000 * scale), 1)
+
+    suite = [
+        Benchmark("write_single", messages, lambda client: write_single(client, messages)),
+        Benchmark("write_batched", messages, lambda client: write_batched(client, messages)),
+        Benchmark("category_scan", messages, lambda client: category_scan(client, messages)),
+        Benchmark(
+            "consumer_run_once", messages, lambda client: consumer_run_once(client, messages)
+        ),
+        Benchmark(
+            "consumer_sink_per_message",
+            messages,
+            lambda client: consumer_sink(client, messages, batched=False),
+        ),
+        Benchmark(
+            "consumer_sink_batch",
+            messages,
+            lambda client: consumer_sink(client, messages, batched=True),
+        ),
+        Benchmark("snapshot_put", snapshots, lambda client: snapshot_put(client, snapshots)),
+        Benchmark("snapshot_get", snapshots, lambda client: snapshot_get(client, snapshots)),
+        Benchmark("stream_name_parse", names, lambda client: stream_name_parse(names)),
+        Benchmark(
+            "stream_read_small", messages, lambda client: stream_read_small(client, messages)
+        ),
+        Benchmark("read_rows", messages, lambda client: read_rows(messages, lazy=False)),
+        Benchmark("read_rows_lazy", messages, lambda client: read_rows(messages, lazy=True)),
+    ]
+    codecs = max(int(200 * scale), 1)
+    for codec in installed_codecs():
+        for label, size in CODEC_PAYLOAD_BYTES.items():
+            suite.append(
+                Benchmark(
+                    f"codec_{codec.name}_encode_{label}",
+                    codecs,
+                    lambda client, codec=codec, size=size: codec_encode(codec, size, codecs),
+                )
+            )
+            suite.append(
+                Benchmark(
+                    f"codec_{codec.name}_decode_{label}",
+                    codecs,
+                    lambda client, codec=codec, size=size: codec_decode(codec, size, codecs),
+                )
+            )
+    for length in HYDRATION_STREAM_LENGTHS:
+        hydrations = max(messages // length, 1)
+        suite.append(
+            Benchmark(
+                f"entity_store_get_{length}",
+                hydrations,
+                lambda client, length=length, hydrations=hydrations: entity_store_get(
+                    client, length, hydrations
+                ),
+            )
+        )
+    entities = max(int(100 * scale), 1)
+    suite.append(
+        Benchmark(
+            "entity_store_get_loop",
+            entities,
+            lambda client: entity_store_hydrate_many(client, entities, bulk=False),
+        )
+    )
+    suite.append(
+        Benchmark(
+            "entity_store_get_many",
+            entities,
+            lambda client: entity_store_hydrate_many(client, entities, bulk=True),
+        )
+    )
+    return suite
+
+
+def write_single(client: MessageDBClient, count: int) -> Run:
+    stream = f"{new_category()}-1"
+    payloads = [deposited(index) for index in range(count)]
+
+    def run() -> None:
+        for payload in payloads:
+            client.write(payload, stream)
+
+    return run
+
+
+def write_batched(client: MessageDBClient, count: int) -> Run:
+    stream = f"{new_category()}-1"
+    payloads = [deposited(index) for index in range(count)]
+
+    def run() -> None:
+        for start in range(0, count, WRITE_BATCH_SIZE):
+            client.write(payloads[start : start + WRITE_BATCH_SIZE], stream)
+
+    return run
+
+
+def category_scan(client: MessageDBClient, count: int) -> Run:
+    category = populate_category(client, count)
+
+    def run() -> None:
+        for _ in client.iter_category_messages(category):
+            pass
+
+    return run
+
+
+def consumer_run_once(client: MessageDBClient, count: int) -> Run:
+    consumer = Consumer(
+        name="benchmark",
+        category=populate_category(client, count),
+        message_db=client,
+        handler=lambda message: None,
+        position_store=InMemoryPositionStore(),
+    )
+
+    def run() -> None:
+        consumer.run_once()
+
+    return run
+
+
+def consumer_sink(client: MessageDBClient, count: int, *, batched: bool) -> Run:
+    # A read model in SQLite: one committed insert per message or one per page.
+    sink = sqlite3.connect(":memory:", check_same_thread=False)
+    sink.execute("CREATE TABLE deposits (position INTEGER PRIMARY KEY, amount INTEGER)")
+
+    def handle(message: ReadMessage) -> None:
+        with sink:
+            sink.execute(
+                "INSERT INTO deposits VALUES (?, ?)",
+                (message.global_position, message.data["amount"]),
+            )
+
+    def handle_batch(batch: Sequence[ReadMessage]) -> None:
+        with sink:
+            sink.executemany(
+                "INSERT INTO deposits VALUES (?, ?)",
+                [(message.global_position, message.data["amount"]) for message in batch],
+            )
+
+    consumer = Consumer(
+        name="benchmark",
+        category=populate_category(client, count),
+        message_db=client,
+        handler=None if batched else handle,
+        batch_handler=handle_batch if batched else None,
+        position_store=InMemoryPositionStore(),
+    )
+
+    def run() -> None:
+        consumer.run_once()
+
+    return run
+
+
+def entity_store_get(client: MessageDBClient, length: int, hydrations: int) -> Run:
+    category = new_category()
+    write_in_batches(client, f"{category}-1", [deposited(index) for index in range(length)])
+
+    def run() -> None:
+        for _ in range(hydrations):
+            store = EntityStore(
+                message_db=client,
+                category=category,
+                projection=AccountProjection,
+                entity_factory=Account,
+            )
+            store.get("1")
+
+    return run
+
+
+def entity_store_hydrate_many(client: MessageDBClient, entities: int, *, bulk: bool) -> Run:
+    category = new_category()
+    for index in range(entities):
+        client.write([deposited(sequence) for sequence in range(10)], f"{category}-{index}")
+    entity_ids = [str(index) for index in range(entities)]
+
+    def run() -> None:
+        store = EntityStore(
+            message_db=client,
+            category=category,
+            projection=AccountProjection,
+            entity_factory=Account,
+        )
+        if bulk:
+            store.get_many(entity_ids)
+        else:
+            for entity_id in entity_ids:
+                store.get(entity_id)
+
+    return run
+
+
+def snapshot_put(client: MessageDBClient, count: int) -> Run:
+    store = SnapshotStore(message_db=client, entity_class=Account)
+    prefix = uuid.uuid4().hex
+
+    def run() -> None:
+        for index in range(count):
+            store.put(f"{prefix}{index}", Account(balance=index), index, None)
+
+    return run
+
+
+def snapshot_get(client: MessageDBClient, count: int) -> Run:
+    store = SnapshotStore(message_db=client, entity_class=Account)
+    prefix = uuid.uuid4().hex
+    for index in range(count):
+        store.put(f"{prefix}{index}", Account(balance=index), index, None)
+
+    def run() -> None:
+        for index in range(count):
+            store.get(f"{prefix}{index}")
+
+    return run
+
+
+def stream_name_parse(count: int) -> Run:
+    names = [
+        stream_name.compose("account", f"{index}+{index % 7}", type="command")
+        for index in range(count)
+    ]
+
+    def run() -> None:
+        for name in names:
+            stream_name.get_category(name)
+            stream_name.get_cardinal_id(name)
+            stream_name.get_types(name)
+
+    return run
+
+
+def stream_read_small(client: MessageDBClient, count: int) -> Run:
+    # Small repeated reads are dominated by per-call overhead such as planning and parsing.
+    stream = f"{new_category()}-1"
+    client.write([deposited(index) for index in range(SMALL_READ_SIZE)], stream)
+
+    def run() -> None:
+        for _ in range(count):
+            client.get_stream_messages(stream, batch_size=SMALL_READ_SIZE)
+
+    return run
+
+
+def read_rows(count: int, *, lazy: bool) -> Run:
+    make_row = read_message_row_factory(lazy=lazy)(_RowCursor())
+    rows = [
+        (
+            f"{index:032x}",
+            f"account-{index % 100}",
+            "Deposited",
+            index // 100,
+            index + 1,
+            '{"amount": 100}',
+            '{"correlationStreamName": "transfer-1"}',
+            datetime(2024, 1, 1, tzinfo=UTC),
+        )
+        for index in range(count)
+    ]
+
+    def run() -> None:
+        for row in rows:
+            make_row(row)
+
+    return run
+
+
+def codec_encode(codec: JsonCodec, size: int, count: int) -> Run:
+    payload = codec_payload(size)
+
+    def run() -> None:
+        for _ in range(count):
+            codec.encode(payload)
+
+    return run
+
+
+def codec_decode(codec: JsonCodec, size: int, count: int) -> Run:
+    encoded = codec.encode(codec_payload(size))
+
+    def run() -> None:
+        for _ in range(count):
+            codec.decode(encoded)
+
+    return run
+
+
+def installed_codecs() -> list[JsonCodec]:
+    codecs = []
+    for name in CODECS:
+        try:
+            codecs.append(get_codec(name))
+        except MessageDBError:
+            continue
+    return codecs
+
+
+def codec_payload(size: int) -> dict:
+    payload: dict = {"recordedAt": datetime(2024, 1, 1, tzinfo=UTC).isoformat(), "items": []}
+    codec = get_codec()
+    while len(codec.encode(payload)) < size:
+        index = len(payload["items"])
+        payload["items"].append(
+            {"sku": f"SKU-{index:06d}", "quantity": index % 7, "price": index * 1.25}
+        )
+    return payload
+
+
+class _Column:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class _RowCursor:
+    description = [_Column(name) for name in READ_MESSAGE_COLUMNS]
+
+
+def populate_category(client: MessageDBClient, count: int) -> str:
+    category = new_category()
+    for stream in range(CATEGORY_STREAMS):
+        payloads = [deposited(index) for index in range(stream, count, CATEGORY_STREAMS)]
+        if payloads:
+            write_in_batches(client, f"{category}-{stream}", payloads)
+    return category
+
+
+def write_in_batches(client: MessageDBClient, stream: str, payloads: list[dict]) -> None:
+    for start in range(0, len(payloads), WRITE_BATCH_SIZE):
+        client.write(payloads[start : start + WRITE_BATCH_SIZE], stream)
+
+
+def new_category() -> str:
+    return f"benchmark{uuid.uuid4().hex[:12]}"
+
+
+def deposited(index: int) -> dict:
+    return {"type": "Deposited", "data": {"amount": index % 100, "sequence": index}}
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+
+@dataclass
+class Backoff:
+    base: float = 0.5
+    maximum: float = 5.0
+    factor: float = 2.0
+    current: float = 0.0
+    jitter: float = 0.0
+
+    def reset(self) -> None:
+        self.current = 0.0
+
+    def next(self) -> float:
+        if self.current == 0.0:
+            self.current = self.base
+        else:
+            self.current = min(self.current * self.factor, self.maximum)
+        # Jitter shortens each delay by up to this fraction so idle pollers drift apart.
+        return self.current * (1.0 - self.jitter * random.random())
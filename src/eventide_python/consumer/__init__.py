@@ -1,6 +1,20 @@
 """Consumer and subscription loop utilities."""
 
-from eventide_python.consumer.consumer import Consumer
-from eventide_python.consumer.position_store import InMemoryPositionStore, PositionStore
+from eventide_python.consumer.consumer import Consumer, PositionUpdateStats
+from eventide_python.consumer.dispatch import ConcurrentDispatcher
+from eventide_python.consumer.position_store import (
+    InMemoryPositionStore,
+    MessageDBPositionStore,
+    PositionStore,
+    PostgresPositionStore,
+)
 
-__all__ = ["Consumer", "InMemoryPositionStore", "PositionStore"]
+__all__ = [
+    "ConcurrentDispatcher",
+    "Consumer",
+    "InMemoryPositionStore",
+    "MessageDBPositionStore",
+    "PositionStore",
+    "PositionUpdateStats",
+    "PostgresPositionStore",
+]
@@ -1,58 +1,160 @@
 from __future__ import annotations
 
 import time
-from typing import Callable
+from dataclasses import dataclass
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Sequence
 
+from eventide_python.backoff import Backoff
+from eventide_python.consumer.dispatch import ConcurrentDispatcher, PartitionKey
 from eventide_python.consumer.position_store import PositionStore
+from eventide_python.message_db.batch_sizing import AdaptiveBatchSize, estimate_page_bytes
 from eventide_python.message_db.client import MessageDBClient
+from eventide_python.message_db.condition import require_sql_condition, type_condition
 from eventide_python.message_db.message_data import ReadMessage
+from eventide_python.message_db.notifications import WakeSignal
+from eventide_python.message_db.params import next_global_position
+from eventide_python.message_db.read_ahead import iter_pages_adaptive
+
+DEFAULT_HANDLER_BATCH_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class PositionUpdateStats:
+    messages: int
+    writes: int
+
+    @property
+    def saved(self) -> int:
+        return self.messages - self.writes
 
 
 class Consumer:
+    """Reads a category from the stored position and hands messages to a handler.
+
+    With ``message_types`` the database returns only matching messages, and the
+    position advances to the last one handled. Message DB has no cheap way to
+    learn where the category ends, so messages of other types written after the
+    last match are scanned again by the database on each pass, until a matching
+    message moves the position past them. They are never returned or handled.
+    """
+
     def __init__(
         self,
         *,
         name: str,
         category: str,
         message_db: MessageDBClient,
-        handler: Callable[[ReadMessage], None],
+        handler: Callable[[ReadMessage], None] | None = None,
         position_store: PositionStore,
         batch_size: int | None = None,
         poll_interval: float = 0.5,
         consumer_group_member: int | None = None,
         consumer_group_size: int | None = None,
         correlation: str | None = None,
+        wakeup: WakeSignal | None = None,
+        position_update_interval: int | None = None,
+        position_update_seconds: float | None = None,
+        workers: int | None = None,
+        max_in_flight: int | None = None,
+        partition_by: str | PartitionKey = "stream_name",
+        batch_handler: Callable[[Sequence[ReadMessage]], None] | None = None,
+        handler_batch_size: int | None = None,
+        idle_backoff: Backoff | None = None,
+        batch_sizing: AdaptiveBatchSize | None = None,
+        message_types: Iterable[str] | None = None,
     ) -> None:
+        if position_update_interval is not None and position_update_interval < 1:
+            raise ValueError("Position update interval must be at least 1")
+        if position_update_seconds is not None and position_update_seconds <= 0:
+            raise ValueError("Position update seconds must be positive")
+        if (handler is None) == (batch_handler is None):
+            raise ValueError("Consumer needs exactly one of handler or batch_handler")
+        if batch_handler is not None and workers is not None:
+            raise ValueError("Concurrent workers require a per-message handler")
+        if handler_batch_size is not None and handler_batch_size < 1:
+            raise ValueError("Handler batch size must be at least 1")
         self._name = name
         self._category = category
         self._message_db = message_db
         self._handler = handler
+        self._batch_handler = batch_handler
+        if handler_batch_size is None:
+            # A non-positive batch_size means "all messages" to Message DB, not a batch length.
+            if batch_size is not None and batch_size > 0:
+                handler_batch_size = batch_size
+            else:
+                handler_batch_size = DEFAULT_HANDLER_BATCH_SIZE
+        self._handler_batch_size = handler_batch_size
         self._position_store = position_store
         self._batch_size = batch_size
         self._poll_interval = poll_interval
         self._consumer_group_member = consumer_group_member
         self._consumer_group_size = consumer_group_size
         self._correlation = correlation
+        self._wakeup = wakeup
+        self._idle_backoff = idle_backoff
+        self._batch_sizing = batch_sizing
+        self._condition = None if message_types is None else type_condition(message_types)
+        # Without either threshold the position is written after every message.
+        if position_update_interval is None and position_update_seconds is None:
+            position_update_interval = 1
+        self._position_update_interval = position_update_interval
+        self._position_update_seconds = position_update_seconds
+        self._pending_position: int | None = None
+        self._pending_messages = 0
+        self._last_position_update = time.monotonic()
+        self._handled_messages = 0
+        self._position_writes = 0
+        self._dispatcher: ConcurrentDispatcher | None = None
+        if handler is not None and workers is not None:
+            self._dispatcher = ConcurrentDispatcher(
+                handler, workers=workers, max_in_flight=max_in_flight, partition_by=partition_by
+            )
 
     def run_once(self) -> int:
         last_position = self._position_store.get(self._name)
         position = 1 if last_position is None else last_position + 1
         processed = 0
 
-        for message in self._message_db.iter_category_messages(
-            self._category,
-            position=position,
-            batch_size=self._batch_size,
-            correlation=self._correlation,
-            consumer_group_member=self._consumer_group_member,
-            consumer_group_size=self._consumer_group_size,
-        ):
-            self._handler(message)
-            self._position_store.set(self._name, message.global_position)
-            processed += 1
+        try:
+            messages = self._iter_messages(position)
+            if self._dispatcher is not None:
+                return self._dispatch(self._dispatcher, messages)
+            if self._batch_handler is not None:
+                for batch in _batches(messages, self._handler_batch_size):
+                    self._batch_handler(batch)
+                    processed += len(batch)
+                    self._handled(batch[-1].global_position, len(batch))
+                return processed
+            assert self._handler is not None
+            for message in messages:
+                self._handler(message)
+                processed += 1
+                self._handled(message.global_position)
+        finally:
+            # Handled messages are never left unrecorded past the end of a batch.
+            self.flush()
 
         return processed
 
+    def flush(self) -> None:
+        if self._pending_position is None:
+            return
+        self._position_store.set(self._name, self._pending_position)
+        self._pending_position = None
+        self._pending_messages = 0
+        self._last_position_update = time.monotonic()
+        self._position_writes += 1
+
+    def close(self) -> None:
+        self.flush()
+        if self._dispatcher is not None:
+            self._dispatcher.shutdown()
+
+    def position_update_stats(self) -> PositionUpdateStats:
+        return PositionUpdateStats(messages=self._handled_messages, writes=self._position_writes)
+
     def run(self, *, max_iterations: int | None = None) -> None:
         iterations = 0
         while True:
@@ -60,5 +162,88 @@ class Consumer:
             iterations += 1
             if max_iterations is not None and iterations >= max_iterations:
                 return
-            if processed == 0:
-                time.sleep(self._poll_interval)
+            if self._idle_backoff is None:
+                if processed == 0:
+                    self._wait(self._poll_interval)
+            elif processed == 0:
+                self._wait(self._idle_backoff.next())
+            else:
+                # Messages are flowing, so poll again at once rather than sleeping.
+                self._idle_backoff.reset()
+
+    def _iter_messages(self, position: int) -> Iterable[ReadMessage]:
+        if self._batch_sizing is None:
+            messages = self._message_db.iter_category_messages(
+                self._category,
+                position=position,
+                batch_size=self._batch_size,
+                correlation=self._correlation,
+                consumer_group_member=self._consumer_group_member,
+                consumer_group_size=self._consumer_group_size,
+                condition=self._condition,
+            )
+        else:
+            # Paging here keeps batch_sizing out of the client protocol.
+            messages = iter_pages_adaptive(
+                self._fetch_page,
+                position,
+                self._batch_sizing,
+                next_global_position,
+                estimate_page_bytes,
+            )
+        if self._condition is None:
+            return messages
+        return require_sql_condition(messages)
+
+    def _fetch_page(self, position: int, batch_size: int) -> Sequence[ReadMessage]:
+        return self._message_db.get_category_messages(
+            self._category,
+            position=position,
+            batch_size=batch_size,
+            correlation=self._correlation,
+            consumer_group_member=self._consumer_group_member,
+            consumer_group_size=self._consumer_group_size,
+            condition=self._condition,
+        )
+
+    def _dispatch(self, dispatcher: ConcurrentDispatcher, messages: Iterable[ReadMessage]) -> int:
+        processed = 0
+        try:
+            for message in messages:
+                if not dispatcher.submit(message):
+                    break
+                processed += 1
+                for global_position in dispatcher.completed_positions():
+                    self._handled(global_position)
+        finally:
+            dispatcher.join()
+            # Only positions below the low-watermark are recorded.
+            for global_position in dispatcher.completed_positions():
+                self._handled(global_position)
+        dispatcher.raise_failure()
+        return processed
+
+    def _handled(self, global_position: int, count: int = 1) -> None:
+        self._pending_position = global_position
+        self._pending_messages += count
+        self._handled_messages += count
+        if (
+            self._position_update_interval is not None
+            and self._pending_messages >= self._position_update_interval
+        ) or (
+            self._position_update_seconds is not None
+            and time.monotonic() - self._last_position_update >= self._position_update_seconds
+        ):
+            self.flush()
+
+    def _wait(self, timeout: float) -> None:
+        if self._wakeup is not None:
+            self._wakeup.wait(timeout)
+        else:
+            time.sleep(timeout)
+
+
+def _batches(messages: Iterable[ReadMessage], size: int) -> Iterator[list[ReadMessage]]:
+    iterator = iter(messages)
+    while batch := list(islice(iterator, size)):
+        yield batch
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from eventide_python.message_db.message_data import ReadMessage
+from eventide_python.stream_name import get_cardinal_id
+
+PartitionKey = Callable[[ReadMessage], str]
+
+
+class ConcurrentDispatcher:
+    """Runs a handler on a pool of ordered lanes, one thread per lane.
+
+    Messages with the same partition key always go to the same lane, so they are
+    handled in order. ``completed_positions`` releases global positions only once
+    every earlier dispatched message has finished (the low-watermark). After a
+    handler fails, messages still queued are skipped rather than handled.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[ReadMessage], None],
+        *,
+        workers: int,
+        max_in_flight: int | None = None,
+        partition_by: str | PartitionKey = "stream_name",
+    ) -> None:
+        if workers < 1:
+            raise ValueError("Dispatcher needs at least one worker")
+        max_in_flight = workers * 16 if max_in_flight is None else max_in_flight
+        if max_in_flight < 1:
+            raise ValueError("Dispatcher max_in_flight must be at least 1")
+        self._handler = handler
+        self._partition_key = _partition_key(partition_by)
+        self._lanes = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"eventide-dispatch-{index}")
+            for index in range(workers)
+        ]
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._outstanding: deque[int] = deque()
+        self._finished: set[int] = set()
+        self._released: list[int] = []
+        self._failure: BaseException | None = None
+
+    def submit(self, message: ReadMessage) -> bool:
+        """Queue ``message`` on its lane; returns False once a handler has failed."""
+        self._slots.acquire()
+        with self._condition:
+            if self._failure is not None:
+                self._slots.release()
+                return False
+            self._outstanding.append(message.global_position)
+            self._in_flight += 1
+        lane = self._lanes[hash(self._partition_key(message)) % len(self._lanes)]
+        lane.submit(self._run, message)
+        return True
+
+    def completed_positions(self) -> list[int]:
+        with self._condition:
+            released, self._released = self._released, []
+            return released
+
+    def join(self) -> None:
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight == 0)
+
+    def raise_failure(self) -> None:
+        with self._condition:
+            failure, self._failure = self._failure, None
+            if failure is None:
+                return
+            self._outstanding.clear()
+            self._finished.clear()
+        raise failure
+
+    def shutdown(self) -> None:
+        for lane in self._lanes:
+            lane.shutdown(wait=True)
+
+    def _run(self, message: ReadMessage) -> None:
+        finished = False
+        try:
+            if self._failure is None:
+                self._handler(message)
+                finished = True
+        except BaseException as exc:  # noqa: BLE001 - re-raised in the consumer thread
+            with self._condition:
+                if self._failure is None:
+                    self._failure = exc
+        finally:
+            with self._condition:
+                if finished:
+                    self._finish(message.global_position)
+                self._in_flight -= 1
+                self._condition.notify_all()
+            self._slots.release()
+
+    def _finish(self, global_position: int) -> None:
+        self._finished.add(global_position)
+        while self._outstanding and self._outstanding[0] in self._finished:
+            position = self._outstanding.popleft()
+            self._finished.discard(position)
+            self._released.append(position)
+
+
+def _partition_key(partition_by: str | PartitionKey) -> PartitionKey:
+    if callable(partition_by):
+        return partition_by
+    if partition_by == "stream_name":
+        return lambda message: message.stream_name
+    if partition_by == "cardinal_id":
+        return lambda message: get_cardinal_id(message.stream_name) or message.stream_name
+    raise ValueError(f"Unknown partition: {partition_by}")
@@ -1,6 +1,26 @@
 from __future__ import annotations
 
-from typing import Dict, Protocol
+import threading
+import time
+from typing import Any, Dict, Protocol
+
+import psycopg
+from psycopg import sql
+
+from eventide_python.message_db.client import MessageDBClient
+from eventide_python.message_db.errors import MessageDBError
+from eventide_python.message_db.logging import get_logger
+from eventide_python.message_db.sql import (
+    GET_POSITION_QUERY,
+    POSITION_TABLE,
+    POSITION_TABLE_DDL,
+    PUT_POSITIONS_QUERY,
+)
+from eventide_python.stream_name import compose as compose_stream_name
+
+POSITION_MESSAGE_TYPE = "Recorded"
+
+_UNKNOWN: Any = object()
 
 
 class PositionStore(Protocol):
@@ -18,3 +38,153 @@ class InMemoryPositionStore:
 
     def set(self, consumer_name: str, position: int) -> None:
         self._positions[consumer_name] = position
+
+
+class MessageDBPositionStore:
+    """Records positions as ``Recorded`` messages in ``<category>:position-<consumer>``."""
+
+    def __init__(self, *, message_db: MessageDBClient, category: str) -> None:
+        self._message_db = message_db
+        self._category = category
+        self._positions: Dict[str, int | None] = {}
+
+    def stream_name(self, consumer_name: str) -> str:
+        return compose_stream_name(self._category, consumer_name, type="position")
+
+    def get(self, consumer_name: str) -> int | None:
+        position = self._positions.get(consumer_name, _UNKNOWN)
+        if position is _UNKNOWN:
+            message = self._message_db.get_last_stream_message(
+                self.stream_name(consumer_name), POSITION_MESSAGE_TYPE
+            )
+            position = None if message is None else int((message.data or {})["position"])
+            self._positions[consumer_name] = position
+        return position  # type: ignore[no-any-return]
+
+    def set(self, consumer_name: str, position: int) -> None:
+        if self._positions.get(consumer_name) == position:
+            return
+        self._message_db.write(
+            {"type": POSITION_MESSAGE_TYPE, "data": {"position": position}},
+            self.stream_name(consumer_name),
+        )
+        self._positions[consumer_name] = position
+
+
+class PostgresPositionStore:
+    """Keeps positions in one upsert table shared by many consumers.
+
+    ``set`` only updates the local cache. Pending positions of every consumer using
+    the store are written together in one statement at most every ``flush_interval``
+    seconds, by the next ``set`` or by a background flusher, and on ``flush``/``close``.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        table: str = POSITION_TABLE,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self._dsn = dsn
+        self._table = sql.Identifier(*table.split("."))
+        self._flush_interval = flush_interval
+        self._logger = get_logger()
+        self._positions: Dict[str, int | None] = {}
+        self._pending: Dict[str, int] = {}
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._conn: psycopg.Connection | None = None
+        self._stopped = threading.Event()
+        self._flusher: threading.Thread | None = None
+        self.flushes = 0
+
+    def __enter__(self) -> PostgresPositionStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def install(self) -> None:
+        with psycopg.connect(self._dsn, autocommit=True) as conn:
+            conn.execute(self._query(POSITION_TABLE_DDL))
+
+    def get(self, consumer_name: str) -> int | None:
+        with self._lock:
+            position = self._positions.get(consumer_name, _UNKNOWN)
+        if position is not _UNKNOWN:
+            return position  # type: ignore[no-any-return]
+        with self._flush_lock:
+            row = self._execute(GET_POSITION_QUERY, (consumer_name,)).fetchone()
+        position = None if row is None else int(row[0])
+        with self._lock:
+            return self._positions.setdefault(consumer_name, position)
+
+    def set(self, consumer_name: str, position: int) -> None:
+        with self._lock:
+            if self._positions.get(consumer_name) == position:
+                return
+            self._positions[consumer_name] = position
+            self._pending[consumer_name] = position
+            due = time.monotonic() - self._last_flush >= self._flush_interval
+        if due:
+            self.flush()
+        else:
+            self._start_flusher()
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._last_flush = time.monotonic()
+            if not pending:
+                return
+            try:
+                self._execute(PUT_POSITIONS_QUERY, (list(pending), list(pending.values())))
+            except MessageDBError:
+                with self._lock:
+                    self._pending = {**pending, **self._pending}
+                raise
+            self.flushes += 1
+
+    def close(self) -> None:
+        self._stopped.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        try:
+            self.flush()
+        finally:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _start_flusher(self) -> None:
+        if self._flusher is not None or self._stopped.is_set():
+            return
+        with self._lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(
+                target=self._run_flusher, name="eventide-position-flusher", daemon=True
+            )
+            self._flusher.start()
+
+    def _run_flusher(self) -> None:
+        while not self._stopped.wait(self._flush_interval):
+            try:
+                self.flush()
+            except MessageDBError as exc:
+                self._logger.warning("Position flush failed: %s", exc)
+
+    def _execute(self, query: str, params: tuple) -> psycopg.Cursor[Any]:
+        try:
+            if self._conn is None or self._conn.closed:
+                self._conn = psycopg.connect(self._dsn, autocommit=True)
+            return self._conn.execute(self._query(query), params)
+        except psycopg.Error as exc:  # pragma: no cover - exercised in integration tests
+            raise MessageDBError(str(exc)) from exc
+
+    def _query(self, query: str) -> sql.Composed:
+        return sql.SQL(query).format(table=self._table)
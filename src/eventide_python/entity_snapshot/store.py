@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
-from typing import Any, Callable, TypeVar
+from typing import Any, Callable, Iterable, TypeVar
 
 from eventide_python.message_db.client import MessageDBClient
+from eventide_python.message_db.types import MessageRecord
 from eventide_python.stream_name import compose as compose_stream_name
 
 EntityType = TypeVar("EntityType")
@@ -46,7 +47,25 @@ class SnapshotStore:
 
     def get(self, entity_id: str) -> tuple[EntityType, int, datetime | None] | None:
         stream_name = self.snapshot_stream_name(entity_id)
-        message = self._message_db.get_last_stream_message(stream_name)
+        return self._from_message(self._message_db.get_last_stream_message(stream_name))
+
+    def get_many(
+        self, entity_ids: Iterable[str]
+    ) -> dict[str, tuple[EntityType, int, datetime | None] | None]:
+        """Latest snapshot per id, read together when the client supports it."""
+        stream_names = {entity_id: self.snapshot_stream_name(entity_id) for entity_id in entity_ids}
+        read_many = getattr(self._message_db, "get_many_last_stream_messages", None)
+        if read_many is None:
+            return {entity_id: self.get(entity_id) for entity_id in stream_names}
+        messages = read_many(list(stream_names.values()))
+        return {
+            entity_id: self._from_message(messages.get(stream_name))
+            for entity_id, stream_name in stream_names.items()
+        }
+
+    def _from_message(
+        self, message: MessageRecord | None
+    ) -> tuple[Any, int, datetime | None] | None:
         if message is None:
             return None
         data = message.data or {}
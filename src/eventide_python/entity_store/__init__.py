@@ -1,8 +1,14 @@
 """Entity store core: projections, caching, and entity hydration."""
 
-from eventide_python.entity_store.cache import EntityCache
+from eventide_python.entity_store.cache import EntityCache, EntityCacheStats
 from eventide_python.entity_store.projection import EntityProjection
 from eventide_python.entity_store.record import EntityRecord
 from eventide_python.entity_store.store import EntityStore
 
-__all__ = ["EntityCache", "EntityProjection", "EntityRecord", "EntityStore"]
+__all__ = [
+    "EntityCache",
+    "EntityCacheStats",
+    "EntityProjection",
+    "EntityRecord",
+    "EntityStore",
+]
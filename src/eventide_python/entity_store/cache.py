@@ -1,19 +1,96 @@
 from __future__ import annotations
 
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Generic, TypeVar
+from typing import Callable, Generic, TypeVar
 
 from eventide_python.entity_store.record import EntityRecord
+from eventide_python.sizing import approximate_size
 
 EntityType = TypeVar("EntityType")
 
 
+@dataclass(frozen=True)
+class EntityCacheStats:
+    hits: int
+    misses: int
+    entries: int
+    bytes: int
+    evictions: int
+    expirations: int
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass(slots=True)
+class _Entry(Generic[EntityType]):
+    record: EntityRecord[EntityType]
+    size: int
+    created: float
+    accessed: float
+
+
 class EntityCache(Generic[EntityType]):
-    def __init__(self) -> None:
-        self._records: Dict[str, EntityRecord[EntityType]] = {}
+    """Entity records by id, unbounded unless a policy is given.
+
+    ``max_entries`` and ``max_bytes`` evict least recently used records. Bytes are
+    measured with ``approximate_size`` only when ``max_bytes`` is set. ``ttl``
+    expires records that long after they were put and ``idle_ttl`` records not
+    read or written for that long. Expired records are dropped when they are read
+    or reach the least recently used end. All operations are O(1) in the number of
+    records and safe to call from several threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+        idle_ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("Cache max_entries must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("Cache max_bytes must be at least 1")
+        if (ttl is not None and ttl <= 0) or (idle_ttl is not None and idle_ttl <= 0):
+            raise ValueError("Cache expiry must be positive")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._idle_ttl = idle_ttl
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry[EntityType]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._lock = threading.Lock()
 
     def get(self, entity_id: str) -> EntityRecord[EntityType] | None:
-        return self._records.get(entity_id)
+        with self._lock:
+            entry = self._entries.get(entity_id)
+            if entry is None:
+                self._misses += 1
+                return None
+            now = self._clock()
+            if self._expired(entry, now):
+                self._remove(entity_id)
+                self._expirations += 1
+                self._misses += 1
+                return None
+            entry.accessed = now
+            self._entries.move_to_end(entity_id)
+            self._hits += 1
+            return entry.record
 
     def put(
         self,
@@ -31,8 +108,75 @@ class EntityCache(Generic[EntityType]):
             persisted_version=persisted_version,
             persisted_time=persisted_time,
         )
-        self._records[entity_id] = record
+        with self._lock:
+            previous = self._entries.get(entity_id)
+            size = self._size(record, previous)
+            now = self._clock()
+            if previous is not None:
+                self._bytes -= previous.size
+                created = previous.created
+            else:
+                created = now
+            self._entries[entity_id] = _Entry(record, size, created, now)
+            self._entries.move_to_end(entity_id)
+            self._bytes += size
+            self._evict(now)
         return record
 
     def delete(self, entity_id: str) -> None:
-        self._records.pop(entity_id, None)
+        with self._lock:
+            self._remove(entity_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> EntityCacheStats:
+        with self._lock:
+            return EntityCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                evictions=self._evictions,
+                expirations=self._expirations,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _size(self, record: EntityRecord[EntityType], previous: _Entry[EntityType] | None) -> int:
+        if self._max_bytes is None:
+            return 0
+        # EntityStore puts the same entity back after every read; only re-measure on change.
+        if (
+            previous is not None
+            and previous.record.entity is record.entity
+            and previous.record.version == record.version
+        ):
+            return previous.size
+        return approximate_size(record.entity)
+
+    def _expired(self, entry: _Entry[EntityType], now: float) -> bool:
+        if self._ttl is not None and now - entry.created >= self._ttl:
+            return True
+        return self._idle_ttl is not None and now - entry.accessed >= self._idle_ttl
+
+    def _evict(self, now: float) -> None:
+        while len(self._entries) > 1:
+            entity_id, entry = next(iter(self._entries.items()))
+            if self._expired(entry, now):
+                self._expirations += 1
+            elif (self._max_entries is not None and len(self._entries) > self._max_entries) or (
+                self._max_bytes is not None and self._bytes > self._max_bytes
+            ):
+                self._evictions += 1
+            else:
+                return
+            self._remove(entity_id)
+
+    def _remove(self, entity_id: str) -> None:
+        entry = self._entries.pop(entity_id, None)
+        if entry is not None:
+            self._bytes -= entry.size
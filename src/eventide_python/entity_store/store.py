@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import copy
+import threading
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from typing import Callable, Generic, Iterable, TypeVar
 
+from eventide_python.entity_snapshot.store import SnapshotStore
 from eventide_python.entity_store.cache import EntityCache
 from eventide_python.entity_store.projection import EntityProjection
 from eventide_python.entity_store.record import EntityRecord
 from eventide_python.message_db.client import MessageDBClient
+from eventide_python.message_db.condition import require_sql_condition, type_condition
 from eventide_python.message_db.message_data import ReadMessage
 from eventide_python.stream_name import compose as compose_stream_name
 
@@ -26,6 +32,11 @@ class EntityStore(Generic[EntityType]):
         entity_factory: Callable[[], EntityType],
         cache: EntityCache[EntityType] | None = None,
         batch_size: int | None = None,
+        filter_types: bool = False,
+        snapshot_store: SnapshotStore | None = None,
+        snapshot_interval: int | None = None,
+        thread_safe: bool = False,
+        copy_entity: Callable[[EntityType], EntityType] | None = None,
     ) -> None:
         if not category:
             raise EntityStoreError("Category is not declared")
@@ -33,13 +44,26 @@ class EntityStore(Generic[EntityType]):
             raise EntityStoreError("Projection is not declared")
         if entity_factory is None:
             raise EntityStoreError("Entity factory is not declared")
+        if (snapshot_store is None) != (snapshot_interval is None):
+            raise EntityStoreError("Snapshot store and snapshot interval must be declared together")
+        if snapshot_interval is not None and snapshot_interval < 1:
+            raise EntityStoreError("Snapshot interval must be at least 1")
+        if filter_types and not projection._handlers:
+            raise EntityStoreError("Projection handles no message types to filter on")
 
         self._message_db = message_db
         self._category = category
         self._projection_class = projection
         self._entity_factory = entity_factory
-        self._cache = cache or EntityCache()
+        self._cache = cache if cache is not None else EntityCache()
         self._batch_size = batch_size
+        self._condition = type_condition(projection._handlers) if filter_types else None
+        self._snapshot_store = snapshot_store
+        self._snapshot_interval = snapshot_interval
+        self._thread_safe = thread_safe
+        self._copy_entity = copy_entity or copy.deepcopy
+        self._flights: dict[str, _Flight[EntityType]] = {}
+        self._flights_lock = threading.Lock()
         self.new_entity_probe: Callable[[EntityType], None] | None = None
 
     def get(
@@ -49,31 +73,47 @@ class EntityStore(Generic[EntityType]):
         include: str | None = None,
         probe_action: Callable[[ReadMessage], None] | None = None,
     ) -> EntityType | tuple[EntityType | None, int | None] | EntityRecord[EntityType] | None:
-        record = self._cache.get(entity_id)
+        if not self._thread_safe:
+            return _destructure(self._hydrate(entity_id, probe_action), include)
 
-        if record:
-            entity = record.entity
-            version = record.version
-            persisted_version = record.persisted_version
-            persisted_time = record.persisted_time
-        else:
-            entity = self._new_entity()
-            version = None
-            persisted_version = None
-            persisted_time = None
+        led, joined = self._claim([entity_id])
+        if joined:
+            return _destructure(joined[entity_id].wait(), include)
+        try:
+            record = self._hydrate(entity_id, probe_action)
+        except BaseException as exc:
+            self._land(led, {}, exc)
+            raise
+        self._land(led, {entity_id: record}, None)
+        return _destructure(record, include)
 
-        current_version = self.refresh(entity, entity_id, version, probe_action=probe_action)
+    def get_many(
+        self, entity_ids: Iterable[str], *, include: str | None = None
+    ) -> list[EntityType | tuple[EntityType | None, int | None] | EntityRecord[EntityType] | None]:
+        """Hydrate several entities at once; results are in the order of ``entity_ids``.
 
-        if current_version is not None:
-            record = self._cache.put(
-                entity_id,
-                entity,
-                current_version,
-                persisted_version=persisted_version,
-                persisted_time=persisted_time,
-            )
+        Clients with ``get_many_stream_messages`` read the tails of all streams
+        together (one pipelined round trip per page on Postgres); others are read
+        one stream at a time.
+        """
+        entity_ids = list(entity_ids)
+        read_many = getattr(self._message_db, "get_many_stream_messages", None)
+        if read_many is None or self._condition is not None:
+            return [self.get(entity_id, include=include) for entity_id in entity_ids]
 
-        return _destructure(record, include)
+        unique_ids = list(dict.fromkeys(entity_ids))
+        if not self._thread_safe:
+            records = self._hydrate_many(unique_ids, read_many)
+        else:
+            led, joined = self._claim(unique_ids)
+            try:
+                records = self._hydrate_many(list(led), read_many) if led else {}
+            except BaseException as exc:
+                self._land(led, {}, exc)
+                raise
+            self._land(led, records, None)
+            records.update((entity_id, flight.wait()) for entity_id, flight in joined.items())
+        return [_destructure(records[entity_id], include) for entity_id in entity_ids]
 
     def fetch(
         self, entity_id: str, *, include: str | None = None
@@ -97,18 +137,14 @@ class EntityStore(Generic[EntityType]):
         *,
         probe_action: Callable[[ReadMessage], None] | None = None,
     ) -> int | None:
-        stream_name = self.stream_name(entity_id)
-        start_position = self._next_position(current_position)
-
-        projection = self._projection_class(entity)
-
-        for event_data in self._read_stream(stream_name, start_position):
-            projection.apply_message(event_data)
-            current_position = event_data.position
-            if probe_action:
-                probe_action(event_data)
-
-        return current_position
+        state = _HydrationState(
+            record=None,
+            entity=entity,
+            version=current_position,
+            persisted_version=None,
+            persisted_time=None,
+        )
+        return self._refresh(state, entity_id, probe_action)
 
     def get_version(self, entity_id: str) -> int | None:
         _, version = self.get(entity_id, include="version")
@@ -126,11 +162,206 @@ class EntityStore(Generic[EntityType]):
             self.new_entity_probe(entity)
         return entity
 
+    def _hydrate(
+        self, entity_id: str, probe_action: Callable[[ReadMessage], None] | None
+    ) -> EntityRecord[EntityType] | None:
+        state = self._start(entity_id)
+        current_version = self._refresh(state, entity_id, probe_action)
+        return self._finish(entity_id, state, current_version)
+
+    def _hydrate_many(
+        self, entity_ids: list[str], read_many: Callable[..., dict[str, list[ReadMessage]]]
+    ) -> dict[str, EntityRecord[EntityType] | None]:
+        records = {entity_id: self._cache.get(entity_id) for entity_id in entity_ids}
+        snapshots = self._load_snapshots(
+            [entity_id for entity_id, record in records.items() if not record]
+        )
+        states = {
+            entity_id: self._state(record, snapshots.get(entity_id))
+            for entity_id, record in records.items()
+        }
+        streams = {
+            self.stream_name(entity_id): self._next_position(state.version)
+            for entity_id, state in states.items()
+        }
+        messages = read_many(streams, batch_size=self._batch_size)
+        return {
+            entity_id: self._finish(
+                entity_id,
+                state,
+                self._apply(state, messages.get(self.stream_name(entity_id), ()), None),
+            )
+            for entity_id, state in states.items()
+        }
+
+    def _refresh(
+        self,
+        state: _HydrationState[EntityType],
+        entity_id: str,
+        probe_action: Callable[[ReadMessage], None] | None,
+    ) -> int | None:
+        stream_name = self.stream_name(entity_id)
+        current_position = state.version
+
+        # With a type filter the last message read need not be the last in the stream,
+        # so the version comes from the stream itself, read before the filtered messages.
+        stream_version: int | None = None
+        if self._condition is not None:
+            last_message = self._message_db.get_last_stream_message(stream_name)
+            if last_message is None or last_message.position == current_position:
+                return current_position
+            stream_version = last_message.position
+
+        messages = self._read_stream(stream_name, self._next_position(current_position))
+        current_position = self._apply(state, messages, probe_action)
+
+        if stream_version is not None and (
+            current_position is None or stream_version > current_position
+        ):
+            return stream_version
+        return current_position
+
+    def _apply(
+        self,
+        state: _HydrationState[EntityType],
+        messages: Iterable[ReadMessage],
+        probe_action: Callable[[ReadMessage], None] | None,
+    ) -> int | None:
+        current_position = state.version
+        projection: EntityProjection | None = None
+        for event_data in messages:
+            if projection is None:
+                if state.shared:
+                    # Readers may hold the cached entity; project onto a private copy.
+                    state.entity = self._copy_entity(state.entity)
+                projection = self._projection_class(state.entity)
+            projection.apply_message(event_data)
+            current_position = event_data.position
+            if probe_action:
+                probe_action(event_data)
+        return current_position
+
+    def _claim(
+        self, entity_ids: Iterable[str]
+    ) -> tuple[dict[str, _Flight[EntityType]], dict[str, _Flight[EntityType]]]:
+        led: dict[str, _Flight[EntityType]] = {}
+        joined: dict[str, _Flight[EntityType]] = {}
+        with self._flights_lock:
+            for entity_id in entity_ids:
+                flight = self._flights.get(entity_id)
+                if flight is None:
+                    led[entity_id] = self._flights[entity_id] = _Flight()
+                else:
+                    joined[entity_id] = flight
+        return led, joined
+
+    def _land(
+        self,
+        flights: dict[str, _Flight[EntityType]],
+        records: dict[str, EntityRecord[EntityType] | None],
+        error: BaseException | None,
+    ) -> None:
+        with self._flights_lock:
+            for entity_id in flights:
+                del self._flights[entity_id]
+        for entity_id, flight in flights.items():
+            flight.record = records.get(entity_id)
+            flight.error = error
+            flight.done.set()
+
+    def _start(self, entity_id: str) -> _HydrationState[EntityType]:
+        record = self._cache.get(entity_id)
+        if record:
+            return self._state(record, None)
+        return self._state(record, self._load_snapshot(entity_id))
+
+    def _state(
+        self,
+        record: EntityRecord[EntityType] | None,
+        snapshot: tuple[EntityType, int | None, datetime | None] | None,
+    ) -> _HydrationState[EntityType]:
+        if record:
+            return _HydrationState(
+                record=record,
+                entity=record.entity,
+                version=record.version,
+                persisted_version=record.persisted_version,
+                persisted_time=record.persisted_time,
+                shared=self._thread_safe,
+            )
+        entity, version, persisted_time = snapshot or (self._new_entity(), None, None)
+        return _HydrationState(
+            record=record,
+            entity=entity,
+            version=version,
+            persisted_version=version,
+            persisted_time=persisted_time,
+        )
+
+    def _finish(
+        self, entity_id: str, state: _HydrationState[EntityType], current_version: int | None
+    ) -> EntityRecord[EntityType] | None:
+        if current_version is None:
+            return state.record
+        persisted_version = state.persisted_version
+        persisted_time = state.persisted_time
+        if self._snapshot_due(current_version, persisted_version):
+            persisted_time = self._write_snapshot(entity_id, state.entity, current_version)
+            persisted_version = current_version
+        return self._cache.put(
+            entity_id,
+            state.entity,
+            current_version,
+            persisted_version=persisted_version,
+            persisted_time=persisted_time,
+        )
+
+    def _load_snapshot(self, entity_id: str) -> tuple[EntityType, int | None, datetime | None]:
+        if self._snapshot_store is not None:
+            snapshot: tuple[EntityType, int, datetime | None] | None = self._snapshot_store.get(
+                entity_id
+            )
+            if snapshot is not None:
+                return snapshot
+        return self._new_entity(), None, None
+
+    def _load_snapshots(
+        self, entity_ids: list[str]
+    ) -> dict[str, tuple[EntityType, int, datetime | None] | None]:
+        if self._snapshot_store is None or not entity_ids:
+            return {}
+        snapshots: dict[str, tuple[EntityType, int, datetime | None] | None] = (
+            self._snapshot_store.get_many(entity_ids)
+        )
+        return snapshots
+
+    def _snapshot_due(self, version: int, persisted_version: int | None) -> bool:
+        if self._snapshot_interval is None:
+            return False
+        since_persisted = version - (-1 if persisted_version is None else persisted_version)
+        return since_persisted >= self._snapshot_interval
+
+    def _write_snapshot(self, entity_id: str, entity: EntityType, version: int) -> datetime:
+        assert self._snapshot_store is not None
+        # Message DB records message times as naive UTC.
+        persisted_time = datetime.now(UTC).replace(tzinfo=None)
+        self._snapshot_store.put(entity_id, entity, version, persisted_time)
+        return persisted_time
+
     def _read_stream(self, stream_name: str, position: int | None) -> Iterable[ReadMessage]:
-        return self._message_db.iter_stream_messages(
-            stream_name,
-            position=position,
-            batch_size=self._batch_size,
+        if self._condition is None:
+            return self._message_db.iter_stream_messages(
+                stream_name,
+                position=position,
+                batch_size=self._batch_size,
+            )
+        return require_sql_condition(
+            self._message_db.iter_stream_messages(
+                stream_name,
+                position=position,
+                batch_size=self._batch_size,
+                condition=self._condition,
+            )
         )
 
     @staticmethod
@@ -140,6 +371,29 @@ class EntityStore(Generic[EntityType]):
         return position + 1
 
 
+@dataclass
+class _HydrationState(Generic[EntityType]):
+    record: EntityRecord[EntityType] | None
+    entity: EntityType
+    version: int | None
+    persisted_version: int | None
+    persisted_time: datetime | None
+    shared: bool = False
+
+
+@dataclass
+class _Flight(Generic[EntityType]):
+    done: threading.Event = field(default_factory=threading.Event)
+    record: EntityRecord[EntityType] | None = None
+    error: BaseException | None = None
+
+    def wait(self) -> EntityRecord[EntityType] | None:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.record
+
+
 def _destructure(
     record: EntityRecord[EntityType] | None, include: str | None
 ) -> EntityType | tuple[EntityType | None, int | None] | EntityRecord[EntityType] | None:
@@ -1,6 +1,10 @@
 """Message DB client contract and types."""
 
-from eventide_python.message_db.client import MessageDBClient
+from eventide_python.message_db.async_postgres import AsyncPostgresMessageDBClient
+from eventide_python.message_db.batch_sizing import AdaptiveBatchSize
+from eventide_python.message_db.cache import CachingMessageDBClient, MessageCacheStats
+from eventide_python.message_db.client import AsyncMessageDBClient, MessageDBClient
+from eventide_python.message_db.condition import type_condition
 from eventide_python.message_db.errors import (
     CategoryError,
     ConsumerGroupError,
@@ -8,19 +12,48 @@ from eventide_python.message_db.errors import (
     SqlConditionError,
     WrongExpectedVersion,
 )
+from eventide_python.message_db.in_memory import InMemoryMessageDBClient
+from eventide_python.message_db.instrumentation import (
+    Instrumentation,
+    MetricsCollector,
+    OperationEvent,
+)
 from eventide_python.message_db.message_data import ReadMessage, WriteMessage
+from eventide_python.message_db.notifications import (
+    CategorySignal,
+    PostgresNotificationListener,
+    WakeSignal,
+)
+from eventide_python.message_db.pool import PoolConfig, PoolStats
 from eventide_python.message_db.postgres import PostgresMessageDBClient
+from eventide_python.message_db.routing import ReadFence
 from eventide_python.message_db.types import MessageRecord
 
 __all__ = [
+    "AdaptiveBatchSize",
+    "AsyncMessageDBClient",
+    "AsyncPostgresMessageDBClient",
+    "CachingMessageDBClient",
     "CategoryError",
+    "CategorySignal",
     "ConsumerGroupError",
     "MessageDBClient",
+    "InMemoryMessageDBClient",
+    "Instrumentation",
+    "MessageCacheStats",
     "MessageDBError",
     "MessageRecord",
+    "MetricsCollector",
+    "OperationEvent",
+    "PoolConfig",
+    "PoolStats",
     "PostgresMessageDBClient",
+    "PostgresNotificationListener",
+    "ReadFence",
     "ReadMessage",
     "SqlConditionError",
+    "WakeSignal",
     "WriteMessage",
     "WrongExpectedVersion",
+    "type_condition",
 ]
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from typing import Any
+
+import psycopg
+
+from eventide_python.message_db.batch_sizing import AdaptiveBatchSize, estimate_page_bytes
+from eventide_python.message_db.codec import JsonCodec, get_codec
+from eventide_python.message_db.errors import MessageDBError, map_error
+from eventide_python.message_db.logging import get_logger
+from eventide_python.message_db.message_data import ReadMessage
+from eventide_python.message_db.params import (
+    bigint,
+    canonize_expected_version,
+    connect_kwargs,
+    prepare_mode,
+    to_write_batch,
+    write_params,
+)
+from eventide_python.message_db.pool import PoolConfig, PoolStats, open_async_pool
+from eventide_python.message_db.serialization import read_message_row_factory
+from eventide_python.message_db.sql import (
+    GET_CATEGORY_MESSAGES_QUERY,
+    GET_LAST_STREAM_MESSAGE_QUERY,
+    GET_STREAM_MESSAGES_QUERY,
+    WRITE_MESSAGE_QUERY,
+)
+
+
+class AsyncPostgresMessageDBClient:
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        pool: PoolConfig | None = None,
+        lazy_decode: bool = False,
+        codec: JsonCodec | str | None = None,
+        prepare: bool | None = None,
+    ) -> None:
+        self._dsn = dsn
+        self._logger = get_logger()
+        self._codec = get_codec(codec)
+        self._row_factory = read_message_row_factory(lazy=lazy_decode, decode=self._codec.decode)
+        self._prepare = prepare_mode(prepare, pooled=pool is not None)
+        self._connect_kwargs = connect_kwargs(self._prepare)
+        self._pool_config = pool
+        self._pool: Any = None
+        self._pool_opened = False
+        self._open_lock = asyncio.Lock()
+        if pool is not None:
+            self._pool = open_async_pool(dsn, pool, self._connect_kwargs)
+
+    async def __aenter__(self) -> AsyncPostgresMessageDBClient:
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        if self._pool is None or self._pool_opened:
+            return
+        # Coroutines that reach a fresh client together must not open the pool twice.
+        async with self._open_lock:
+            if not self._pool_opened:
+                await self._pool.open()
+                self._pool_opened = True
+
+    async def close(self) -> None:
+        if self._pool is None:
+            return
+        async with self._open_lock:
+            await self._pool.close()
+            # A closed psycopg pool cannot be reopened, so the next open() starts a new one.
+            assert self._pool_config is not None
+            self._pool = open_async_pool(self._dsn, self._pool_config, self._connect_kwargs)
+            self._pool_opened = False
+
+    def pool_stats(self) -> PoolStats | None:
+        if self._pool is None:
+            return None
+        return PoolStats.from_psycopg(self._pool.get_stats())
+
+    async def write(
+        self,
+        message_data: dict | Iterable[dict],
+        stream_name: str,
+        expected_version: int | None = None,
+    ) -> int:
+        batch = to_write_batch(message_data)
+        expected_version = canonize_expected_version(expected_version)
+
+        self._logger.debug(
+            "Writing %s messages to %s with expected_version=%s",
+            len(batch),
+            stream_name,
+            expected_version,
+        )
+
+        if not batch:
+            raise MessageDBError("Write failed to return a position")
+
+        params = write_params(batch, stream_name, expected_version, self._codec)
+        context = f"stream_name={stream_name} expected_version={expected_version}"
+        async with self._connection() as conn:
+            async with conn.transaction():
+                positions = await self._write_batch(conn, params, context)
+        return positions[-1]
+
+    async def write_many(
+        self, writes: Iterable[tuple[str, dict | Iterable[dict], int | str | None]]
+    ) -> dict[str, int]:
+        params: list[tuple] = []
+        for stream_name, message_data, expected_version in writes:
+            batch = to_write_batch(message_data)
+            if not batch:
+                raise MessageDBError(f"No messages to write to {stream_name}")
+            params.extend(
+                write_params(
+                    batch,
+                    stream_name,
+                    canonize_expected_version(expected_version),
+                    self._codec,
+                )
+            )
+        if not params:
+            return {}
+
+        stream_names = list(dict.fromkeys(param[1] for param in params))
+        self._logger.debug(
+            "Writing %s messages to %s streams in one transaction", len(params), len(stream_names)
+        )
+
+        context = f"stream_names={','.join(stream_names)}"
+        async with self._connection() as conn:
+            async with conn.transaction():
+                positions = await self._write_batch(conn, params, context)
+        return {param[1]: position for param, position in zip(params, positions, strict=True)}
+
+    async def get_stream_messages(
+        self,
+        stream_name: str,
+        position: int | None = None,
+        batch_size: int | None = None,
+        condition: str | None = None,
+    ) -> list[ReadMessage]:
+        async with self._connection() as conn:
+            return await self._fetch_all(
+                conn,
+                GET_STREAM_MESSAGES_QUERY,
+                (stream_name, bigint(position), bigint(batch_size), condition),
+            )
+
+    async def get_category_messages(
+        self,
+        category: str,
+        position: int | None = None,
+        batch_size: int | None = None,
+        correlation: str | None = None,
+        consumer_group_member: int | None = None,
+        consumer_group_size: int | None = None,
+        condition: str | None = None,
+    ) -> list[ReadMessage]:
+        async with self._connection() as conn:
+            return await self._fetch_all(
+                conn,
+                GET_CATEGORY_MESSAGES_QUERY,
+                (
+                    category,
+                    bigint(position),
+                    bigint(batch_size),
+                    correlation,
+                    bigint(consumer_group_member),
+                    bigint(consumer_group_size),
+                    condition,
+                ),
+            )
+
+    async def get_last_stream_message(
+        self, stream_name: str, type: str | None = None
+    ) -> ReadMessage | None:
+        async with self._connection() as conn:
+            messages = await self._fetch_all(
+                conn,
+                GET_LAST_STREAM_MESSAGE_QUERY,
+                (stream_name, type),
+            )
+        if not messages:
+            return None
+        return messages[0]
+
+    async def iter_stream_messages(
+        self,
+        stream_name: str,
+        position: int | None = None,
+        batch_size: int | None = None,
+        condition: str | None = None,
+        *,
+        batch_sizing: AdaptiveBatchSize | None = None,
+    ) -> AsyncIterator[ReadMessage]:
+        position = 0 if position is None else position
+        batch_size = 1000 if batch_size is None else batch_size
+
+        while True:
+            page_size = batch_size if batch_sizing is None else batch_sizing.current
+            started = time.perf_counter()
+            batch = await self.get_stream_messages(
+                stream_name,
+                position=position,
+                batch_size=page_size,
+                condition=condition,
+            )
+            _observe(batch_sizing, page_size, batch, started)
+            if not batch:
+                return
+            for message in batch:
+                yield message
+            position = batch[-1].position + 1
+            if len(batch) < page_size:
+                return
+
+    async def iter_category_messages(
+        self,
+        category: str,
+        position: int | None = None,
+        batch_size: int | None = None,
+        correlation: str | None = None,
+        consumer_group_member: int | None = None,
+        consumer_group_size: int | None = None,
+        condition: str | None = None,
+        *,
+        batch_sizing: AdaptiveBatchSize | None = None,
+    ) -> AsyncIterator[ReadMessage]:
+        position = 1 if position is None else position
+        batch_size = 1000 if batch_size is None else batch_size
+
+        while True:
+            page_size = batch_size if batch_sizing is None else batch_sizing.current
+            started = time.perf_counter()
+            batch = await self.get_category_messages(
+                category,
+                position=position,
+                batch_size=page_size,
+                correlation=correlation,
+                consumer_group_member=consumer_group_member,
+                consumer_group_size=consumer_group_size,
+                condition=condition,
+            )
+            _observe(batch_sizing, page_size, batch, started)
+            if not batch:
+                return
+            for message in batch:
+                yield message
+            position = batch[-1].global_position + 1
+            if len(batch) < page_size:
+                return
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[psycopg.AsyncConnection[Any]]:
+        if self._pool is not None:
+            await self.open()
+            async with self._pool.connection() as conn:
+                yield conn
+            return
+        async with await psycopg.AsyncConnection.connect(
+            self._dsn, **self._connect_kwargs
+        ) as conn:
+            yield conn
+
+    async def _fetch_all(
+        self, conn: psycopg.AsyncConnection[Any], query: str, params: tuple
+    ) -> list[ReadMessage]:
+        try:
+            async with conn.cursor(row_factory=self._row_factory) as cur:
+                await cur.execute(query, params, prepare=self._prepare, binary=True)
+                return list(await cur.fetchall())
+        except psycopg.Error as exc:  # pragma: no cover - exercised in integration tests
+            raise map_error(exc) from exc
+
+    async def _write_batch(
+        self, conn: psycopg.AsyncConnection[Any], params: list[tuple], context: str
+    ) -> list[int]:
+        positions: list[int] = []
+        try:
+            async with conn.cursor() as cur:
+                await cur.executemany(WRITE_MESSAGE_QUERY, params, returning=True)
+                while True:
+                    row = await cur.fetchone()
+                    if row is None:
+                        raise MessageDBError("Write failed to return a position")
+                    positions.append(int(row[0]))
+                    if not cur.nextset():
+                        break
+        except psycopg.Error as exc:  # pragma: no cover - exercised in integration tests
+            raise map_error(exc, context=context) from exc
+        return positions
+
+
+def _observe(
+    batch_sizing: AdaptiveBatchSize | None,
+    page_size: int,
+    batch: list[ReadMessage],
+    started: float,
+) -> None:
+    if batch_sizing is None:
+        return
+    elapsed = time.perf_counter() - started
+    payload_bytes = 0
+    if batch and batch_sizing.target_bytes is not None:
+        payload_bytes = estimate_page_bytes(batch)
+    batch_sizing.observe(page_size, len(batch), elapsed, payload_bytes)
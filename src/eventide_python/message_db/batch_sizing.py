@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Sequence
+from typing import Any
+
+from eventide_python.sizing import approximate_size
+
+PAGE_SIZE_SAMPLES = 8
+
+
+class AdaptiveBatchSize:
+    """Page size that follows the observed query latency and row size.
+
+    After a full page the size moves toward the number of rows expected to take
+    ``target_latency`` seconds to read and, when ``target_bytes`` is set, to fit in
+    ``target_bytes``. It grows by at most ``max_growth`` per page. A short page can
+    only shrink it, because it says nothing about how a larger page would perform.
+    One instance may be shared by several iterators.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int = 1000,
+        minimum: int = 10,
+        maximum: int = 10000,
+        target_latency: float = 0.05,
+        target_bytes: int | None = None,
+        max_growth: float = 2.0,
+    ) -> None:
+        if not 1 <= minimum <= maximum:
+            raise ValueError("Batch size bounds must satisfy 1 <= minimum <= maximum")
+        if target_latency <= 0:
+            raise ValueError("Target latency must be positive")
+        if target_bytes is not None and target_bytes < 1:
+            raise ValueError("Target bytes must be positive")
+        if max_growth <= 1:
+            raise ValueError("Max growth must be greater than 1")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.target_bytes = target_bytes
+        self.max_growth = max_growth
+        self._size = self._clamp(initial)
+        self._lock = threading.Lock()
+
+    @property
+    def current(self) -> int:
+        return self._size
+
+    def observe(self, requested: int, rows: int, seconds: float, payload_bytes: int = 0) -> int:
+        """Record one page of ``rows`` read in ``seconds`` and return the next page size."""
+        if rows <= 0:
+            return self._size
+        desired = self.target_latency * rows / seconds if seconds > 0 else float(self.maximum)
+        if self.target_bytes is not None and payload_bytes > 0:
+            desired = min(desired, self.target_bytes * rows / payload_bytes)
+        if rows < requested:
+            desired = min(desired, requested)
+        desired = min(desired, requested * self.max_growth)
+        with self._lock:
+            self._size = self._clamp(int(desired))
+            return self._size
+
+    def _clamp(self, size: int) -> int:
+        return max(self.minimum, min(size, self.maximum))
+
+
+def estimate_page_bytes(page: Sequence[Any]) -> int:
+    """Approximate the memory held by ``page`` from a few evenly spaced samples."""
+    if not page:
+        return 0
+    sampled = page[:: max(len(page) // PAGE_SIZE_SAMPLES, 1)]
+    return sum(approximate_size(item) for item in sampled) * len(page) // len(sampled)
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+from eventide_python.message_db.batch_sizing import AdaptiveBatchSize, estimate_page_bytes
+from eventide_python.message_db.client import MessageDBClient
+from eventide_python.message_db.message_data import ReadMessage
+from eventide_python.message_db.read_ahead import iter_pages, iter_pages_adaptive
+from eventide_python.sizing import approximate_size
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_BATCH_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class MessageCacheStats:
+    hits: int
+    misses: int
+    streams: int
+    bytes: int
+    max_bytes: int
+    evictions: int
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class _StreamRange:
+    start: int
+    messages: list[ReadMessage] = field(default_factory=list)
+    size: int = 0
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self.messages)
+
+
+class CachingMessageDBClient:
+    """Read-through cache of contiguous stream message ranges in front of a client.
+
+    Stream messages never change once written, so a read is served from the cached
+    range and only the positions past its end are fetched. Hits and misses count
+    messages, not calls.
+    """
+
+    def __init__(self, message_db: MessageDBClient, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes < 1:
+            raise ValueError("Cache max_bytes must be at least 1")
+        self._message_db = message_db
+        self._max_bytes = max_bytes
+        self._ranges: OrderedDict[str, _StreamRange] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def write(
+        self,
+        message_data: dict | Iterable[dict],
+        stream_name: str,
+        expected_version: int | None = None,
+    ) -> int:
+        return self._message_db.write(message_data, stream_name, expected_version)
+
+    def get_stream_messages(
+        self,
+        stream_name: str,
+        position: int | None = None,
+        batch_size: int | None = None,
+        condition: str | None = None,
+    ) -> list[ReadMessage]:
+        if condition is not None:
+            return self._message_db.get_stream_messages(
+                stream_name, position=position, batch_size=batch_size, condition=condition
+            )
+
+        position = 0 if position is None else position
+        batch_size = DEFAULT_BATCH_SIZE if batch_size is None else batch_size
+
+        cached = self._read_cached(stream_name, position, batch_size)
+        if cached is not None and 0 < batch_size <= len(cached):
+            return cached
+
+        cached = cached or []
+        tail_position = position + len(cached)
+        if batch_size > 0:
+            batch_size -= len(cached)
+        tail = self._message_db.get_stream_messages(
+            stream_name, position=tail_position, batch_size=batch_size
+        )
+        self._store(stream_name, tail)
+        return cached + tail
+
+    def get_category_messages(
+        self,
+        category: str,
+        position: int | None = None,
+        batch_size: int | None = None,
+        correlation: str | None = None,
+        consumer_group_member: int | None = None,
+        consumer_group_size: int | None = None,
+        condition: str | None = None,
+    ) -> list[ReadMessage]:
+        return self._message_db.get_category_messages(
+            category,
+            position=position,
+            batch_size=batch_size,
+            correlation=correlation,
+            consumer_group_member=consumer_group_member,
+            consumer_group_size=consumer_group_size,
+            condition=condition,
+        )
+
+    def get_last_stream_message(
+        self, stream_name: str, type: str | None = None
+    ) -> ReadMessage | None:
+        return self._message_db.get_last_stream_message(stream_name, type)
+
+    def iter_stream_messages(
+        self,
+        stream_name: str,
+        position: int | None = None,
+        batch_size: int | None = None,
+        condition: str | None = None,
+        *,
+        batch_sizing: AdaptiveBatchSize | None = None,
+    ) -> Iterator[ReadMessage]:
+        if batch_sizing is not None:
+
+            def fetch_sized_page(page_position: int, page_size: int) -> list[ReadMessage]:
+                return self.get_stream_messages(
+                    stream_name,
+                    position=page_position,
+                    batch_size=page_size,
+                    condition=condition,
+                )
+
+            return iter_pages_adaptive(
+                fetch_sized_page,
+                0 if position is None else position,
+                batch_sizing,
+                lambda message: message.position + 1,
+                estimate_page_bytes,
+            )
+
+        batch_size = DEFAULT_BATCH_SIZE if batch_size is None else batch_size
+
+        def fetch_page(page_position: int) -> list[ReadMessage]:
+            return self.get_stream_messages(
+                stream_name,
+                position=page_position,
+                batch_size=batch_size,
+                condition=condition,
+            )
+
+        return iter_pages(
+            fetch_page,
+            0 if position is None else position,
+            batch_size,
+            lambda message: message.position + 1,
+        )
+
+    def iter_category_messages(
+        self,
+        category: str,
+        position: int | None = None,
+        batch_size: int | None = None,
+        correlation: str | None = None,
+        consumer_group_member: int | None = None,
+        consumer_group_size: int | None = None,
+        condition: str | None = None,
+    ) -> Iterable[ReadMessage]:
+        return self._message_db.iter_category_messages(
+            category,
+            position=position,
+            batch_size=batch_size,
+            correlation=correlation,
+            consumer_group_member=consumer_group_member,
+            consumer_group_size=consumer_group_size,
+            condition=condition,
+        )
+
+    def stats(self) -> MessageCacheStats:
+        with self._lock:
+            return MessageCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                streams=len(self._ranges),
+                bytes=self._bytes,
+                max_bytes=self._max_bytes,
+                evictions=self._evictions,
+            )
+
+    def invalidate(self, stream_name: str) -> None:
+        with self._lock:
+            cached_range = self._ranges.pop(stream_name, None)
+            if cached_range is not None:
+                self._bytes -= cached_range.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ranges.clear()
+            self._bytes = 0
+
+    def _read_cached(
+        self, stream_name: str, position: int, batch_size: int
+    ) -> list[ReadMessage] | None:
+        with self._lock:
+            cached_range = self._ranges.get(stream_name)
+            if cached_range is None or not cached_range.start <= position <= cached_range.end:
+                return None
+            self._ranges.move_to_end(stream_name)
+            offset = position - cached_range.start
+            if batch_size > 0:
+                messages = cached_range.messages[offset : offset + batch_size]
+            else:
+                messages = cached_range.messages[offset:]
+            self._hits += len(messages)
+            return messages
+
+    def _store(self, stream_name: str, messages: list[ReadMessage]) -> None:
+        with self._lock:
+            self._misses += len(messages)
+            if not messages:
+                return
+            first = messages[0].position
+            cached_range = self._ranges.get(stream_name)
+            if cached_range is not None and not (
+                cached_range.start <= first <= cached_range.end
+                or first < cached_range.start <= messages[-1].position + 1
+            ):
+                # Disjoint from what is cached; the newer read replaces it.
+                self._bytes -= cached_range.size
+                cached_range = None
+            if cached_range is None:
+                cached_range = self._ranges[stream_name] = _StreamRange(first)
+            prepended = [message for message in messages if message.position < cached_range.start]
+            appended = [message for message in messages if message.position >= cached_range.end]
+            size = sum(approximate_size(message) for message in (*prepended, *appended))
+            if prepended:
+                cached_range.messages[:0] = prepended
+                cached_range.start = first
+            cached_range.messages.extend(appended)
+            cached_range.size += size
+            self._bytes += size
+            self._ranges.move_to_end(stream_name)
+            while self._bytes > self._max_bytes and self._ranges:
+                _, evicted = self._ranges.popitem(last=False)
+                self._bytes -= evicted.size
+                self._evictions += 1
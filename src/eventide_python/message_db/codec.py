@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import importlib
+import json
+from datetime import date, datetime, time
+from typing import Any, Protocol
+from uuid import UUID
+
+from eventide_python.message_db.errors import MessageDBError
+
+RAW_JSON_TYPES = (bytes, bytearray, memoryview)
+
+
+class JsonCodec(Protocol):
+    name: str
+
+    def encode(self, value: Any) -> str | bytes: ...
+
+    def decode(self, value: str | bytes) -> Any: ...
+
+
+class StdlibJsonCodec:
+    name = "json"
+
+    def encode(self, value: Any) -> str:
+        return json.dumps(
+            value, separators=(",", ":"), ensure_ascii=False, default=_encode_default
+        )
+
+    def decode(self, value: str | bytes) -> Any:
+        return json.loads(value)
+
+
+class OrjsonCodec:
+    name = "orjson"
+
+    def __init__(self) -> None:
+        orjson = _require("orjson")
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+        self._option = orjson.OPT_UTC_Z
+
+    def encode(self, value: Any) -> bytes:
+        return self._dumps(value, default=_encode_default, option=self._option)  # type: ignore[no-any-return]
+
+    def decode(self, value: str | bytes) -> Any:
+        return self._loads(value)
+
+
+class MsgspecJsonCodec:
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        msgspec = _require("msgspec")
+        self._encoder = msgspec.json.Encoder(enc_hook=_encode_default)
+        self._decoder = msgspec.json.Decoder()
+
+    def encode(self, value: Any) -> bytes:
+        return self._encoder.encode(value)  # type: ignore[no-any-return]
+
+    def decode(self, value: str | bytes) -> Any:
+        return self._decoder.decode(value)
+
+
+CODECS: dict[str, type[JsonCodec]] = {
+    StdlibJsonCodec.name: StdlibJsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecJsonCodec.name: MsgspecJsonCodec,
+}
+
+
+def get_codec(codec: JsonCodec | str | None = None) -> JsonCodec:
+    if codec is None:
+        return StdlibJsonCodec()
+    if isinstance(codec, str):
+        try:
+            return CODECS[codec]()
+        except KeyError:
+            raise MessageDBError(f"Unknown JSON codec: {codec}") from None
+    return codec
+
+
+def is_raw_json(value: Any) -> bool:
+    return isinstance(value, RAW_JSON_TYPES)
+
+
+def _encode_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        text = value.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _require(module_name: str) -> Any:
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as exc:
+        raise MessageDBError(
+            f"The {module_name} JSON codec requires the {module_name} package"
+        ) from exc
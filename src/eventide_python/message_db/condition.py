@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import TypeVar
+
+from eventide_python.message_db.errors import SqlConditionError
+
+T = TypeVar("T")
+
+
+def type_condition(types: Iterable[str]) -> str:
+    """Build a ``condition`` that keeps only messages of the given types."""
+    names = sorted(set(types))
+    if not names:
+        raise ValueError("Type condition needs at least one message type")
+    return f"type IN ({', '.join(_literal(name) for name in names)})"
+
+
+def require_sql_condition(messages: Iterable[T]) -> Iterator[T]:
+    """Re-raise a disabled ``sql_condition`` setting with a hint at the fix."""
+    try:
+        yield from messages
+    except SqlConditionError as exc:
+        raise SqlConditionError(
+            "Type filtering needs SQL conditions, enable them with "
+            f"message_store.sql_condition=on or turn type filtering off ({exc})"
+        ) from exc
+
+
+def _literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
@@ -1,3 +1,11 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import psycopg
+
+
 class MessageDBError(RuntimeError):
     pass
 
@@ -16,3 +24,19 @@ class SqlConditionError(MessageDBError):
 
 class ConsumerGroupError(MessageDBError):
     pass
+
+
+def map_error(exc: psycopg.Error, *, context: str | None = None) -> MessageDBError:
+    message = str(exc)
+    normalized = message.lower()
+    if context:
+        message = f"{message} ({context})"
+    if "wrong expected version" in normalized:
+        return WrongExpectedVersion(message)
+    if "must be a stream name" in normalized or "must be a category" in normalized:
+        return CategoryError(message)
+    if "consumer group" in normalized:
+        return ConsumerGroupError(message)
+    if "sql condition is not activated" in normalized:
+        return SqlConditionError(message)
+    return MessageDBError(message)
@@ -0,0 +1,365 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from datetime import UTC, datetime
+from itertools import islice
+from operator import attrgetter
+from sys import intern
+from typing import Any
+
+from eventide_python.message_db.batch_sizing import AdaptiveBatchSize, estimate_page_bytes
+from eventide_python.message_db.codec import JsonCodec, get_codec, is_raw_json
+from eventide_python.message_db.errors import (
+    CategoryError,
+    ConsumerGroupError,
+    MessageDBError,
+    SqlConditionError,
+    WrongExpectedVersion,
+)
+from eventide_python.message_db.message_data import ReadMessage
+from eventide_python.message_db.params import (
+    canonize_expected_version,
+    next_global_position,
+    next_stream_position,
+    to_write_batch,
+)
+from eventide_python.message_db.read_ahead import FetchSizedPage, iter_pages, iter_pages_adaptive
+from eventide_python.stream_name import get_cardinal_id, get_category, is_category
+
+DEFAULT_BATCH_SIZE = 1000
+
+_global_position = attrgetter("global_position")
+
+
+class InMemoryMessageDBClient:
+    """MessageDBClient kept in process memory with Message DB's read and write semantics.
+
+    Messages are held in a global log indexed by stream and by category. Stream reads
+    are O(1) to locate and category reads O(log n) via bisection on global position.
+    SQL conditions are not supported and raise like a server without
+    ``message_store.sql_condition`` enabled.
+    """
+
+    def __init__(
+        self,
+        *,
+        clock: Callable[[], datetime] | None = None,
+        codec: JsonCodec | str | None = None,
+    ) -> None:
+        self._clock = clock or _utc_now
+        self._codec = get_codec(codec)
+        self._log: list[ReadMessage] = []
+        self._streams: dict[str, list[ReadMessage]] = {}
+        self._categories: dict[str, list[ReadMessage]] = {}
+        self._ids: set[str] = set()
+        self._hashes: dict[str, int | None] = {}
+        self._lock = threading.Lock()
+
+    def write(
+        self,
+        message_data: dict | Iterable[dict],
+        stream_name: str,
+        expected_version: int | None = None,
+    ) -> int:
+        batch = to_write_batch(message_data)
+        if not batch:
+            raise MessageDBError("Write failed to return a position")
+        expected_version = canonize_expected_version(expected_version)
+        return self._write([(stream_name, batch, expected_version)])[stream_name]
+
+    def write_many(
+        self, writes: Iterable[tuple[str, dict | Iterable[dict], int | str | None]]
+    ) -> dict[str, int]:
+        entries = []
+        for stream_name, message_data, expected_version in writes:
+            batch = to_write_batch(message_data)
+            if not batch:
+                raise MessageDBError(f"No messages to write to {stream_name}")
+            entries.append((stream_name, batch, canonize_expected_version(expected_version)))
+        return self._write(entries)
+
+    def get_stream_messages(
+        self,
+        stream_name: str,
+        position: int | None = None,
+        batch_size: int | None = None,
+        condition: str | None = None,
+    ) -> list[ReadMessage]:
+        if is_category(stream_name):
+            raise CategoryError(f"Must be a stream name: {stream_name}")
+        _check_condition(condition)
+        position = 0 if position is None else max(position, 0)
+        stop = _stop(position, batch_size)
+        with self._lock:
+            return self._streams.get(stream_name, [])[position:stop]
+
+    def get_category_messages(
+        self,
+        category: str,
+        position: int | None = None,
+        batch_size: int | None = None,
+        correlation: str | None = None,
+        consumer_group_member: int | None = None,
+        consumer_group_size: int | None = None,
+        condition: str | None = None,
+    ) -> list[ReadMessage]:
+        if not is_category(category):
+            raise CategoryError(f"Must be a category: {category}")
+        if correlation is not None and not is_category(correlation):
+            raise CategoryError(f"Correlation must be a category (Correlation: {correlation})")
+        _check_consumer_group(consumer_group_member, consumer_group_size)
+        _check_condition(condition)
+        position = 1 if position is None else position
+        batch_size = DEFAULT_BATCH_SIZE if batch_size is None else batch_size
+
+        with self._lock:
+            messages = self._categories.get(category, [])
+            start = bisect_left(messages, position, key=_global_position)
+            if correlation is None and consumer_group_size is None:
+                return messages[start:_stop(start, batch_size)]
+            matches = []
+            for message in islice(messages, start, None):
+                if correlation is not None and _correlation(message) != correlation:
+                    continue
+                if consumer_group_size is not None:
+                    member = self._hash(message.stream_name)
+                    if member is None or member % consumer_group_size != consumer_group_member:
+                        continue
+                matches.append(message)
+                if len(matches) == batch_size:
+                    break
+            return matches
+
+    def get_last_stream_message(
+        self, stream_name: str, type: str | None = None
+    ) -> ReadMessage | None:
+        with self._lock:
+            messages = self._streams.get(stream_name)
+            if not messages:
+                return None
+            if type is None:
+                return messages[-1]
+            for message in reversed(messages):
+                if message.type == type:
+                    return message
+        return None
+
+    def get_many_stream_messages(
+        self,
+        streams: Mapping[str, int | None],
+        batch_size: int | None = None,
+        condition: str | None = None,
+    ) -> dict[str, list[ReadMessage]]:
+        return {
+            stream_name: list(
+                self.iter_stream_messages(stream_name, position, batch_size, condition)
+            )
+            for stream_name, position in streams.items()
+        }
+
+    def get_many_last_stream_messages(
+        self, stream_names: Sequence[str], type: str | None = None
+    ) -> dict[str, ReadMessage | None]:
+        return {
+            stream_name: self.get_last_stream_message(stream_name, type)
+            for stream_name in stream_names
+        }
+
+    def iter_stream_messages(
+        self,
+        stream_name: str,
+        position: int | None = None,
+        batch_size: int | None = None,
+        condition: str | None = None,
+        *,
+        batch_sizing: AdaptiveBatchSize | None = None,
+    ) -> Iterator[ReadMessage]:
+        def fetch_page(page_position: int, page_size: int) -> list[ReadMessage]:
+            return self.get_stream_messages(
+                stream_name, position=page_position, batch_size=page_size, condition=condition
+            )
+
+        return _iter_pages(
+            fetch_page,
+            0 if position is None else position,
+            batch_size,
+            next_stream_position,
+            batch_sizing,
+        )
+
+    def iter_category_messages(
+        self,
+        category: str,
+        position: int | None = None,
+        batch_size: int | None = None,
+        correlation: str | None = None,
+        consumer_group_member: int | None = None,
+        consumer_group_size: int | None = None,
+        condition: str | None = None,
+        *,
+        batch_sizing: AdaptiveBatchSize | None = None,
+    ) -> Iterator[ReadMessage]:
+        def fetch_page(page_position: int, page_size: int) -> list[ReadMessage]:
+            return self.get_category_messages(
+                category,
+                position=page_position,
+                batch_size=page_size,
+                correlation=correlation,
+                consumer_group_member=consumer_group_member,
+                consumer_group_size=consumer_group_size,
+                condition=condition,
+            )
+
+        return _iter_pages(
+            fetch_page,
+            1 if position is None else position,
+            batch_size,
+            next_global_position,
+            batch_sizing,
+        )
+
+    def stream_version(self, stream_name: str) -> int | None:
+        with self._lock:
+            messages = self._streams.get(stream_name)
+            return len(messages) - 1 if messages else None
+
+    def _write(self, entries: list[tuple[str, list, int | None]]) -> dict[str, int]:
+        # Round-trip through JSON like Postgres: reads get detached, JSON-shaped values
+        # and values the codec cannot encode fail the write before anything is stored.
+        payloads = [
+            [
+                (_json_value(message.data, self._codec), _json_value(message.metadata, self._codec))
+                for message in batch
+            ]
+            for _, batch, _ in entries
+        ]
+        with self._lock:
+            # Validate the whole write before applying any of it, like one transaction.
+            versions: dict[str, int] = {}
+            ids: set[str] = set()
+            for stream_name, batch, expected_version in entries:
+                version = versions.get(stream_name)
+                if version is None:
+                    version = len(self._streams.get(stream_name, ())) - 1
+                for index, message in enumerate(batch):
+                    if expected_version is not None and expected_version + index != version:
+                        raise WrongExpectedVersion(
+                            f"Wrong expected version: {expected_version + index} "
+                            f"(Stream: {stream_name}, Stream Version: {version})"
+                        )
+                    if message.id in self._ids or message.id in ids:
+                        raise MessageDBError(f"Duplicate message id: {message.id}")
+                    ids.add(message.id)
+                    version += 1
+                versions[stream_name] = version
+
+            positions: dict[str, int] = {}
+            for (stream_name, batch, _), batch_payloads in zip(entries, payloads, strict=True):
+                stream_name = intern(stream_name)
+                stream = self._streams.setdefault(stream_name, [])
+                category = self._categories.setdefault(get_category(stream_name), [])
+                for message, (data, metadata) in zip(batch, batch_payloads, strict=True):
+                    record = ReadMessage(
+                        id=message.id,
+                        type=intern(message.type),
+                        data=data,
+                        metadata=metadata,
+                        stream_name=stream_name,
+                        position=len(stream),
+                        global_position=len(self._log) + 1,
+                        time=self._clock(),
+                    )
+                    self._log.append(record)
+                    stream.append(record)
+                    category.append(record)
+                positions[stream_name] = len(stream) - 1
+            self._ids.update(ids)
+            return positions
+
+    def _hash(self, stream_name: str) -> int | None:
+        if stream_name not in self._hashes:
+            cardinal_id = get_cardinal_id(stream_name)
+            self._hashes[stream_name] = None if cardinal_id is None else abs(hash_64(cardinal_id))
+        return self._hashes[stream_name]
+
+
+def hash_64(value: str) -> int:
+    """Python equivalent of ``message_store.hash_64``: the first 64 bits of MD5, signed."""
+    digest = int.from_bytes(hashlib.md5(value.encode()).digest()[:8], "big")
+    return digest - (1 << 64) if digest >= 1 << 63 else digest
+
+
+def _iter_pages(
+    fetch_page: FetchSizedPage[ReadMessage],
+    position: int,
+    batch_size: int | None,
+    next_position: Callable[[ReadMessage], int],
+    batch_sizing: AdaptiveBatchSize | None,
+) -> Iterator[ReadMessage]:
+    if batch_sizing is not None:
+        return iter_pages_adaptive(
+            fetch_page, position, batch_sizing, next_position, estimate_page_bytes
+        )
+    fixed_size = DEFAULT_BATCH_SIZE if batch_size is None else batch_size
+    return iter_pages(
+        lambda page_position: fetch_page(page_position, fixed_size),
+        position,
+        fixed_size,
+        next_position,
+    )
+
+
+def _check_consumer_group(member: int | None, size: int | None) -> None:
+    if member is None and size is None:
+        return
+    if member is None or size is None:
+        raise ConsumerGroupError(
+            "Consumer group member and size must be specified "
+            f"(Consumer Group Member: {member}, Consumer Group Size: {size})"
+        )
+    if size < 1:
+        raise ConsumerGroupError(
+            "Consumer group size must not be less than 1 "
+            f"(Consumer Group Member: {member}, Consumer Group Size: {size})"
+        )
+    if member < 0:
+        raise ConsumerGroupError(
+            "Consumer group member must not be less than 0 "
+            f"(Consumer Group Member: {member}, Consumer Group Size: {size})"
+        )
+    if member >= size:
+        raise ConsumerGroupError(
+            "Consumer group member must be less than the group size "
+            f"(Consumer Group Member: {member}, Consumer Group Size: {size})"
+        )
+
+
+def _check_condition(condition: str | None) -> None:
+    if condition is not None:
+        raise SqlConditionError("Retrieval with SQL condition is not activated")
+
+
+def _correlation(message: ReadMessage) -> str | None:
+    stream_name = (message.metadata or {}).get("correlationStreamName")
+    return None if stream_name is None else get_category(stream_name)
+
+
+def _json_value(value: Any, codec: JsonCodec) -> Any:
+    if value is None:
+        return None
+    if is_raw_json(value):
+        return codec.decode(bytes(value))
+    return codec.decode(codec.encode(value))
+
+
+def _stop(start: int, batch_size: int | None) -> int | None:
+    if batch_size is None:
+        return start + DEFAULT_BATCH_SIZE
+    return None if batch_size < 0 else start + batch_size
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Protocol
+
+from eventide_python.stream_name import get_category
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class OperationEvent:
+    operation: str
+    target: str
+    duration: float
+    acquire_duration: float
+    rows: int
+    payload_bytes: int
+    error: str | None = None
+
+
+class Instrumentation(Protocol):
+    def record(self, event: OperationEvent) -> None: ...
+
+
+class OperationScope:
+    """Times one client operation and reports it to ``instrumentation`` on exit."""
+
+    __slots__ = (
+        "_instrumentation",
+        "operation",
+        "target",
+        "rows",
+        "payload_bytes",
+        "_started",
+        "_acquired",
+    )
+
+    def __init__(
+        self, instrumentation: Instrumentation | None, operation: str, target: str
+    ) -> None:
+        self._instrumentation = instrumentation
+        self.operation = operation
+        self.target = target
+        self.rows = 0
+        self.payload_bytes = 0
+        self._started = 0.0
+        self._acquired = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self._instrumentation is not None
+
+    def __enter__(self) -> OperationScope:
+        if self._instrumentation is not None:
+            self._started = self._acquired = time.perf_counter()
+        return self
+
+    def acquired(self) -> None:
+        if self._instrumentation is not None:
+            self._acquired = time.perf_counter()
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: object) -> None:
+        if self._instrumentation is None:
+            return
+        finished = time.perf_counter()
+        self._instrumentation.record(
+            OperationEvent(
+                operation=self.operation,
+                target=self.target,
+                duration=finished - self._started,
+                acquire_duration=self._acquired - self._started,
+                rows=self.rows,
+                payload_bytes=self.payload_bytes,
+                error=None if exc_type is None else exc_type.__name__,
+            )
+        )
+
+
+class Counter:
+    def __init__(self, name: str, help: str) -> None:
+        self.name = name
+        self.help = help
+        self._values: dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Labels, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, labels: Labels) -> float:
+        with self._lock:
+            return self._values.get(labels, 0.0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        lines.extend(f"{self.name}{_format_labels(labels)} {value:g}" for labels, value in values)
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.name = name
+        self.help = help
+        self.buckets = tuple(sorted(buckets))
+        self._counts: dict[Labels, list[int]] = {}
+        self._sums: dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Labels, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(labels)
+            if counts is None:
+                counts = self._counts[labels] = [0] * (len(self.buckets) + 1)
+                self._sums[labels] = 0.0
+            counts[index] += 1
+            self._sums[labels] += value
+
+    def count(self, labels: Labels) -> int:
+        with self._lock:
+            return sum(self._counts.get(labels, ()))
+
+    def render(self) -> list[str]:
+        with self._lock:
+            series = sorted(
+                (labels, list(counts), self._sums[labels])
+                for labels, counts in self._counts.items()
+            )
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, counts, total in series:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts, strict=True):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                lines.append(
+                    f"{self.name}_bucket{_format_labels((*labels, ('le', le)))} {cumulative}"
+                )
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {total:g}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+class MetricsCollector:
+    """Instrumentation that aggregates operation events into counters and histograms.
+
+    ``target_label`` maps the stream name or category of an operation to the
+    ``target`` label; the default keeps the category so label cardinality stays bounded.
+    """
+
+    def __init__(
+        self,
+        *,
+        target_label: Callable[[str], str] | None = None,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self._target_label = target_label or _category_label
+        self.operations = Counter(
+            "eventide_message_db_operations_total", "Message DB operations by outcome."
+        )
+        self.rows = Counter(
+            "eventide_message_db_rows_total", "Messages written or returned by Message DB."
+        )
+        self.payload_bytes = Counter(
+            "eventide_message_db_payload_bytes_total",
+            "Bytes of message data and metadata written or returned.",
+        )
+        self.duration = Histogram(
+            "eventide_message_db_operation_seconds", "Message DB operation latency.", buckets
+        )
+        self.acquire_duration = Histogram(
+            "eventide_message_db_connection_acquire_seconds",
+            "Time spent acquiring a connection for an operation.",
+            buckets,
+        )
+
+    def record(self, event: OperationEvent) -> None:
+        operation = (("operation", event.operation),)
+        labels = (*operation, ("target", self._target_label(event.target)))
+        self.operations.inc((*labels, ("outcome", event.error or "ok")))
+        self.rows.inc(labels, event.rows)
+        self.payload_bytes.inc(labels, event.payload_bytes)
+        self.duration.observe(operation, event.duration)
+        self.acquire_duration.observe(operation, event.acquire_duration)
+
+    def metrics(self) -> list[Counter | Histogram]:
+        return [
+            self.operations,
+            self.rows,
+            self.payload_bytes,
+            self.duration,
+            self.acquire_duration,
+        ]
+
+    def render(self) -> str:
+        return prometheus_text(self.metrics())
+
+
+def prometheus_text(metrics: Iterable[Counter | Histogram]) -> str:
+    """Render metrics in the Prometheus text exposition format."""
+    lines = [line for metric in metrics for line in metric.render()]
+    return "\n".join(lines) + "\n"
+
+
+def _category_label(target: str) -> str:
+    return ",".join(sorted({get_category(name) for name in target.split(",")}))
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in labels)
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
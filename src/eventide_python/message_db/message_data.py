@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping
 
 JsonObject = Mapping[str, Any]
+JsonDecoder = Callable[[Any], Any]
 
+_UNDECODED: Any = object()
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class MessageData:
     id: str | None
     type: str
@@ -18,14 +22,101 @@ class MessageData:
         return self.type == value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WriteMessage(MessageData):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReadMessage(MessageData):
     stream_name: str = ""
     position: int = 0
     global_position: int = 0
     time: datetime | None = None
+
+
+class LazyReadMessage(ReadMessage):
+    """ReadMessage that keeps data and metadata as JSON text until first access."""
+
+    __slots__ = ("_raw_data", "_raw_metadata", "_data", "_metadata", "_decode")
+
+    _raw_data: str | bytes | None
+    _raw_metadata: str | bytes | None
+    _data: Any
+    _metadata: Any
+    _decode: JsonDecoder
+
+    def __init__(
+        self,
+        id: str | None,
+        type: str,
+        data: JsonObject | None = None,
+        metadata: JsonObject | None = None,
+        stream_name: str = "",
+        position: int = 0,
+        global_position: int = 0,
+        time: datetime | None = None,
+        *,
+        raw_data: str | bytes | None = None,
+        raw_metadata: str | bytes | None = None,
+        decode: JsonDecoder = json.loads,
+    ) -> None:
+        setattr_ = object.__setattr__
+        setattr_(self, "id", id)
+        setattr_(self, "type", type)
+        setattr_(self, "stream_name", stream_name)
+        setattr_(self, "position", position)
+        setattr_(self, "global_position", global_position)
+        setattr_(self, "time", time)
+        setattr_(self, "_raw_data", raw_data)
+        setattr_(self, "_raw_metadata", raw_metadata)
+        setattr_(self, "_data", data if raw_data is None else _UNDECODED)
+        setattr_(self, "_metadata", metadata if raw_metadata is None else _UNDECODED)
+        setattr_(self, "_decode", decode)
+
+    @property
+    def data(self) -> JsonObject | None:
+        value = self._data
+        if value is _UNDECODED:
+            value = self._decode(self._raw_data)
+            object.__setattr__(self, "_data", value)
+        return value  # type: ignore[no-any-return]
+
+    @property
+    def metadata(self) -> JsonObject | None:
+        value = self._metadata
+        if value is _UNDECODED:
+            value = self._decode(self._raw_metadata)
+            object.__setattr__(self, "_metadata", value)
+        return value  # type: ignore[no-any-return]
+
+    @property
+    def raw_data(self) -> str | bytes | None:
+        return self._raw_data
+
+    @property
+    def raw_metadata(self) -> str | bytes | None:
+        return self._raw_metadata
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ReadMessage):
+            return NotImplemented
+        return _read_message_fields(self) == _read_message_fields(other)
+
+    __hash__ = ReadMessage.__hash__
+
+    def __reduce__(self) -> tuple[type[ReadMessage], tuple[Any, ...]]:
+        return ReadMessage, _read_message_fields(self)
+
+
+def _read_message_fields(message: ReadMessage) -> tuple[Any, ...]:
+    return (
+        message.id,
+        message.type,
+        message.data,
+        message.metadata,
+        message.stream_name,
+        message.position,
+        message.global_position,
+        message.time,
+    )
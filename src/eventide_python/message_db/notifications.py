@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import threading
+from typing import Protocol
+
+import psycopg
+from psycopg import sql
+
+from eventide_python.message_db.logging import get_logger
+from eventide_python.message_db.sql import NOTIFY_CHANNEL, NOTIFY_TRIGGER_DDL
+
+
+class WakeSignal(Protocol):
+    def wait(self, timeout: float) -> bool: ...
+
+
+class CategorySignal:
+    def __init__(self, categories: tuple[str, ...]) -> None:
+        self.categories = categories
+        self._event = threading.Event()
+
+    def notify(self) -> None:
+        self._event.set()
+
+    def wait(self, timeout: float) -> bool:
+        woken = self._event.wait(timeout)
+        self._event.clear()
+        return woken
+
+
+class PostgresNotificationListener:
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        channel: str = NOTIFY_CHANNEL,
+        reconnect_interval: float = 1.0,
+        listen_timeout: float = 1.0,
+    ) -> None:
+        self._dsn = dsn
+        self._channel = channel
+        self._reconnect_interval = reconnect_interval
+        self._listen_timeout = listen_timeout
+        self._logger = get_logger()
+        self._signals: dict[str, list[CategorySignal]] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> PostgresNotificationListener:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def install_trigger(self) -> None:
+        with psycopg.connect(self._dsn, autocommit=True) as conn:
+            conn.execute(NOTIFY_TRIGGER_DDL)
+
+    def subscribe(self, *categories: str) -> CategorySignal:
+        if not categories:
+            raise ValueError("At least one category is required")
+        signal = CategorySignal(categories)
+        with self._lock:
+            for category in categories:
+                self._signals.setdefault(category, []).append(signal)
+        return signal
+
+    def unsubscribe(self, signal: CategorySignal) -> None:
+        with self._lock:
+            for category in signal.categories:
+                subscribers = self._signals.get(category, [])
+                if signal in subscribers:
+                    subscribers.remove(signal)
+                if not subscribers:
+                    self._signals.pop(category, None)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="eventide-notification-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(self._listen_timeout + self._reconnect_interval)
+            self._thread = None
+
+    def dispatch(self, category: str) -> None:
+        with self._lock:
+            subscribers = list(self._signals.get(category, ()))
+        for signal in subscribers:
+            signal.notify()
+
+    def _notify_all(self) -> None:
+        with self._lock:
+            subscribers = {id(s): s for group in self._signals.values() for s in group}
+        for signal in subscribers.values():
+            signal.notify()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                with psycopg.connect(self._dsn, autocommit=True) as conn:
+                    conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(self._channel)))
+                    # Anything written while we were not listening has to be picked up by a poll.
+                    self._notify_all()
+                    while not self._stopped.is_set():
+                        for notify in conn.notifies(timeout=self._listen_timeout):
+                            self.dispatch(notify.payload)
+            except psycopg.Error as exc:
+                self._logger.warning("Notification listener disconnected: %s", exc)
+                self._notify_all()
+                self._stopped.wait(self._reconnect_interval)
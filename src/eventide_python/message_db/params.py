@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable
+from typing import Any
+
+from psycopg.types.json import Jsonb
+from psycopg.types.numeric import Int8
+
+from eventide_python.message_db.codec import JsonCodec, is_raw_json
+from eventide_python.message_db.message_data import ReadMessage, WriteMessage
+from eventide_python.message_db.serialization import to_write_message
+
+NO_STREAM = -1
+
+
+def canonize_expected_version(value: int | str | None) -> int | None:
+    if value is None:
+        return None
+    if isinstance(value, str) and value.lower() == "no_stream":
+        return NO_STREAM
+    return int(value)
+
+
+def to_write_batch(message_data: dict | Iterable[dict]) -> list[WriteMessage]:
+    if isinstance(message_data, Iterable) and not isinstance(message_data, (dict, str, bytes)):
+        batch = message_data
+    else:
+        batch = [message_data]
+    return [to_write_message(item, id_factory=_new_id) for item in batch]
+
+
+def write_params(
+    batch: list[WriteMessage],
+    stream_name: str,
+    expected_version: int | None,
+    codec: JsonCodec,
+) -> list[tuple]:
+    return [
+        (
+            message.id,
+            stream_name,
+            message.type,
+            json_param(message.data, codec),
+            json_param(message.metadata, codec),
+            None if expected_version is None else Int8(expected_version + index),
+        )
+        for index, message in enumerate(batch)
+    ]
+
+
+def json_param(value: Any, codec: JsonCodec) -> Jsonb | None:
+    if value is None:
+        return None
+    if is_raw_json(value):
+        return Jsonb(value, dumps=bytes)
+    # Encode up front so the size of what is sent is known without encoding twice.
+    return Jsonb(codec.encode(value), dumps=_encoded)
+
+
+def _encoded(value: str | bytes) -> str | bytes:
+    return value
+
+
+def bigint(value: int | None) -> Int8 | None:
+    return None if value is None else Int8(value)
+
+
+def prepare_mode(prepare: bool | None, *, pooled: bool) -> bool | None:
+    # Prepared statements live on the connection, so they only pay off when it is reused.
+    if prepare is None:
+        return True if pooled else None
+    return prepare
+
+
+def connect_kwargs(prepare: bool | None) -> dict[str, Any]:
+    if prepare is False:
+        return {"prepare_threshold": None}
+    return {}
+
+
+def next_stream_position(message: ReadMessage) -> int:
+    return message.position + 1
+
+
+def next_global_position(message: ReadMessage) -> int:
+    return message.global_position + 1
+
+
+def _new_id() -> str:
+    return str(uuid.uuid4())
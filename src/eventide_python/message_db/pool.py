@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from eventide_python.message_db.errors import MessageDBError
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    min_size: int = 1
+    max_size: int = 10
+    max_idle: float = 600.0
+    max_lifetime: float = 3600.0
+    timeout: float = 30.0
+    check: bool = True
+    name: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.min_size < 0:
+            raise ValueError("Pool min_size must not be negative")
+        if self.max_size < max(self.min_size, 1):
+            raise ValueError("Pool max_size must be at least min_size and at least 1")
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    min_size: int
+    max_size: int
+    size: int
+    available: int
+    waiting: int
+    requests: int
+    requests_queued: int
+    wait_ms: int
+
+    @property
+    def in_use(self) -> int:
+        return self.size - self.available
+
+    @property
+    def saturation(self) -> float:
+        return self.in_use / self.max_size if self.max_size else 0.0
+
+    @property
+    def average_wait_ms(self) -> float:
+        return self.wait_ms / self.requests_queued if self.requests_queued else 0.0
+
+    @classmethod
+    def from_psycopg(cls, stats: Mapping[str, int]) -> PoolStats:
+        return cls(
+            min_size=stats.get("pool_min", 0),
+            max_size=stats.get("pool_max", 0),
+            size=stats.get("pool_size", 0),
+            available=stats.get("pool_available", 0),
+            waiting=stats.get("requests_waiting", 0),
+            requests=stats.get("requests_num", 0),
+            requests_queued=stats.get("requests_queued", 0),
+            wait_ms=stats.get("requests_wait_ms", 0),
+        )
+
+
+def open_pool(dsn: str, config: PoolConfig, kwargs: dict[str, Any]) -> Any:
+    try:
+        from psycopg_pool import ConnectionPool
+    except ImportError as exc:  # pragma: no cover - depends on installed extras
+        raise MessageDBError(
+            "Connection pooling requires psycopg-pool; install eventide-python[postgres]"
+        ) from exc
+
+    return ConnectionPool(
+        dsn,
+        kwargs=kwargs,
+        min_size=config.min_size,
+        max_size=config.max_size,
+        max_idle=config.max_idle,
+        max_lifetime=config.max_lifetime,
+        timeout=config.timeout,
+        check=ConnectionPool.check_connection if config.check else None,
+        name=config.name,
+        open=True,
+    )
+
+
+def open_async_pool(dsn: str, config: PoolConfig, kwargs: dict[str, Any]) -> Any:
+    try:
+        from psycopg_pool import AsyncConnectionPool
+    except ImportError as exc:  # pragma: no cover - depends on installed extras
+        raise MessageDBError(
+            "Connection pooling requires psycopg-pool; install eventide-python[postgres]"
+        ) from exc
+
+    return AsyncConnectionPool(
+        dsn,
+        kwargs=kwargs,
+        min_size=config.min_size,
+        max_size=config.max_size,
+        max_idle=config.max_idle,
+        max_lifetime=config.max_lifetime,
+        timeout=config.timeout,
+        check=AsyncConnectionPool.check_connection if config.check else None,
+        name=config.name,
+        open=False,
+    )
@@ -1,36 +1,96 @@
 from __future__ import annotations
 
-import json
-import uuid
-from typing import Iterable, Iterator
+import itertools
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence
 
 import psycopg
-from psycopg.rows import dict_row
-
-from eventide_python.message_db.errors import (
-    CategoryError,
-    ConsumerGroupError,
-    MessageDBError,
-    SqlConditionError,
-    WrongExpectedVersion,
-)
+
+from eventide_python.message_db.batch_sizing import AdaptiveBatchSize, estimate_page_bytes
+from eventide_python.message_db.codec import JsonCodec, get_codec
+from eventide_python.message_db.errors import MessageDBError, map_error
+from eventide_python.message_db.instrumentation import Instrumentation, OperationScope
 from eventide_python.message_db.logging import get_logger
-from eventide_python.message_db.message_data import ReadMessage, WriteMessage
-from eventide_python.message_db.serialization import to_read_message, to_write_message
+from eventide_python.message_db.message_data import ReadMessage
+from eventide_python.message_db.params import (
+    bigint,
+    canonize_expected_version,
+    connect_kwargs,
+    next_global_position,
+    next_stream_position,
+    prepare_mode,
+    to_write_batch,
+    write_params,
+)
+from eventide_python.message_db.pool import PoolConfig, PoolStats, open_pool
+from eventide_python.message_db.read_ahead import (
+    FetchSizedPage,
+    iter_pages,
+    iter_pages_adaptive,
+    iter_pages_ahead,
+)
+from eventide_python.message_db.routing import ReadFence, wait_for_fence
+from eventide_python.message_db.serialization import read_message_row_factory
 from eventide_python.message_db.sql import (
-    GET_CATEGORY_MESSAGES,
-    GET_LAST_STREAM_MESSAGE,
-    GET_STREAM_MESSAGES,
-    WRITE_MESSAGE,
+    GET_CATEGORY_MESSAGES_QUERY,
+    GET_LAST_STREAM_MESSAGE_QUERY,
+    GET_STREAM_MESSAGES_QUERY,
+    STREAM_VERSION_QUERY,
+    WRITE_MESSAGE_QUERY,
 )
 
-NO_STREAM = -1
-
 
 class PostgresMessageDBClient:
-    def __init__(self, dsn: str) -> None:
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        pool: PoolConfig | None = None,
+        read_ahead: int = 0,
+        lazy_decode: bool = False,
+        codec: JsonCodec | str | None = None,
+        prepare: bool | None = None,
+        replicas: Sequence[str] = (),
+        fence_timeout: float = 1.0,
+        fence_poll_interval: float = 0.01,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
         self._dsn = dsn
         self._logger = get_logger()
+        self._read_ahead = read_ahead
+        self._codec = get_codec(codec)
+        self._row_factory = read_message_row_factory(lazy=lazy_decode, decode=self._codec.decode)
+        self._prepare = prepare_mode(prepare, pooled=pool is not None)
+        self._connect_kwargs = connect_kwargs(self._prepare)
+        self._pool: Any = None
+        if pool is not None:
+            self._pool = open_pool(dsn, pool, self._connect_kwargs)
+        self._replicas: list[tuple[str, Any]] = [
+            (replica, None if pool is None else open_pool(replica, pool, self._connect_kwargs))
+            for replica in replicas
+        ]
+        self._replica_counter = itertools.count()
+        self._fence_timeout = fence_timeout
+        self._fence_poll_interval = fence_poll_interval
+        self._instrumentation = instrumentation
+
+    def __enter__(self) -> PostgresMessageDBClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+        for _, replica_pool in self._replicas:
+            if replica_pool is not None:
+                replica_pool.close()
+
+    def pool_stats(self) -> PoolStats | None:
+        if self._pool is None:
+            return None
+        return PoolStats.from_psycopg(self._pool.get_stats())
 
     def write(
         self,
@@ -38,8 +98,8 @@ class PostgresMessageDBClient:
         stream_name: str,
         expected_version: int | None = None,
     ) -> int:
-        batch = self._to_write_batch(message_data)
-        expected_version = _canonize_expected_version(expected_version)
+        batch = to_write_batch(message_data)
+        expected_version = canonize_expected_version(expected_version)
 
         self._logger.debug(
             "Writing %s messages to %s with expected_version=%s",
@@ -48,14 +108,49 @@ class PostgresMessageDBClient:
             expected_version,
         )
 
-        with self._connect() as conn:
-            with conn.transaction():
-                position: int | None = None
-                for message in batch:
-                    position = self._write_one(conn, message, stream_name, expected_version)
-        if position is None:
+        if not batch:
             raise MessageDBError("Write failed to return a position")
-        return position
+
+        params = write_params(batch, stream_name, expected_version, self._codec)
+        context = f"stream_name={stream_name} expected_version={expected_version}"
+        with self._scope("write", stream_name) as scope:
+            with self._connection() as conn:
+                scope.acquired()
+                with conn.transaction():
+                    positions = self._write_batch(conn, params, context, scope)
+        return positions[-1]
+
+    def write_many(
+        self, writes: Iterable[tuple[str, dict | Iterable[dict], int | str | None]]
+    ) -> dict[str, int]:
+        params: list[tuple] = []
+        for stream_name, message_data, expected_version in writes:
+            batch = to_write_batch(message_data)
+            if not batch:
+                raise MessageDBError(f"No messages to write to {stream_name}")
+            params.extend(
+                write_params(
+                    batch,
+                    stream_name,
+                    canonize_expected_version(expected_version),
+                    self._codec,
+                )
+            )
+        if not params:
+            return {}
+
+        stream_names = list(dict.fromkeys(param[1] for param in params))
+        self._logger.debug(
+            "Writing %s messages to %s streams in one transaction", len(params), len(stream_names)
+        )
+
+        context = f"stream_names={','.join(stream_names)}"
+        with self._scope("write_many", ",".join(stream_names)) as scope:
+            with self._connection() as conn:
+                scope.acquired()
+                with conn.transaction():
+                    positions = self._write_batch(conn, params, context, scope)
+        return {param[1]: position for param, position in zip(params, positions, strict=True)}
 
     def get_stream_messages(
         self,
@@ -63,14 +158,18 @@ class PostgresMessageDBClient:
         position: int | None = None,
         batch_size: int | None = None,
         condition: str | None = None,
+        *,
+        fence: ReadFence | None = None,
     ) -> list[ReadMessage]:
-        with self._connect() as conn:
-            rows = self._fetch_all(
-                conn,
-                f"SELECT * FROM {GET_STREAM_MESSAGES}(%s, %s, %s, %s)",
-                (stream_name, position, batch_size, condition),
-            )
-        return [to_read_message(row) for row in rows]
+        with self._scope("get_stream_messages", stream_name) as scope:
+            with self._read_connection(fence) as conn:
+                scope.acquired()
+                return self._fetch_all(
+                    conn,
+                    GET_STREAM_MESSAGES_QUERY,
+                    (stream_name, bigint(position), bigint(batch_size), condition),
+                    scope,
+                )
 
     def get_category_messages(
         self,
@@ -81,33 +180,106 @@ class PostgresMessageDBClient:
         consumer_group_member: int | None = None,
         consumer_group_size: int | None = None,
         condition: str | None = None,
+        *,
+        fence: ReadFence | None = None,
     ) -> list[ReadMessage]:
-        with self._connect() as conn:
-            rows = self._fetch_all(
-                conn,
-                f"SELECT * FROM {GET_CATEGORY_MESSAGES}(%s, %s, %s, %s, %s, %s, %s)",
-                (
-                    category,
-                    position,
-                    batch_size,
-                    correlation,
-                    consumer_group_member,
-                    consumer_group_size,
-                    condition,
-                ),
-            )
-        return [to_read_message(row) for row in rows]
-
-    def get_last_stream_message(self, stream_name: str, type: str | None = None) -> ReadMessage | None:
-        with self._connect() as conn:
-            rows = self._fetch_all(
-                conn,
-                f"SELECT * FROM {GET_LAST_STREAM_MESSAGE}(%s, %s)",
-                (stream_name, type),
-            )
-        if not rows:
+        with self._scope("get_category_messages", category) as scope:
+            with self._read_connection(fence) as conn:
+                scope.acquired()
+                return self._fetch_all(
+                    conn,
+                    GET_CATEGORY_MESSAGES_QUERY,
+                    (
+                        category,
+                        bigint(position),
+                        bigint(batch_size),
+                        correlation,
+                        bigint(consumer_group_member),
+                        bigint(consumer_group_size),
+                        condition,
+                    ),
+                    scope,
+                )
+
+    def get_last_stream_message(
+        self, stream_name: str, type: str | None = None, *, fence: ReadFence | None = None
+    ) -> ReadMessage | None:
+        with self._scope("get_last_stream_message", stream_name) as scope:
+            with self._read_connection(fence) as conn:
+                scope.acquired()
+                messages = self._fetch_all(
+                    conn,
+                    GET_LAST_STREAM_MESSAGE_QUERY,
+                    (stream_name, type),
+                    scope,
+                )
+        if not messages:
             return None
-        return to_read_message(rows[0])
+        return messages[0]
+
+    def get_many_stream_messages(
+        self,
+        streams: Mapping[str, int | None],
+        batch_size: int | None = None,
+        condition: str | None = None,
+        *,
+        fence: ReadFence | None = None,
+    ) -> dict[str, list[ReadMessage]]:
+        """Read every stream from its position to the end, all streams per round trip.
+
+        Each round sends one page query per unfinished stream in a libpq pipeline,
+        so hydrating many short streams costs about one round trip.
+        """
+        batch_size = 1000 if batch_size is None else batch_size
+        results: dict[str, list[ReadMessage]] = {stream_name: [] for stream_name in streams}
+        pending = {
+            stream_name: 0 if position is None else position
+            for stream_name, position in streams.items()
+        }
+        with self._scope("get_many_stream_messages", ",".join(streams)) as scope:
+            with self._read_connection(fence) as conn:
+                scope.acquired()
+                while pending:
+                    pages = self._fetch_pipelined(
+                        conn,
+                        GET_STREAM_MESSAGES_QUERY,
+                        [
+                            (stream_name, bigint(position), bigint(batch_size), condition)
+                            for stream_name, position in pending.items()
+                        ],
+                        scope,
+                    )
+                    next_pending = {}
+                    for stream_name, page in zip(pending, pages, strict=True):
+                        results[stream_name].extend(page)
+                        if page and len(page) == batch_size:
+                            next_pending[stream_name] = next_stream_position(page[-1])
+                    pending = next_pending
+        return results
+
+    def get_many_last_stream_messages(
+        self,
+        stream_names: Sequence[str],
+        type: str | None = None,
+        *,
+        fence: ReadFence | None = None,
+    ) -> dict[str, ReadMessage | None]:
+        """Last message of each stream, with every query sent in one libpq pipeline."""
+        if not stream_names:
+            return {}
+        with self._scope("get_many_last_stream_messages", ",".join(stream_names)) as scope:
+            with self._read_connection(fence) as conn:
+                scope.acquired()
+                pages = self._fetch_pipelined(
+                    conn,
+                    GET_LAST_STREAM_MESSAGE_QUERY,
+                    [(stream_name, type) for stream_name in stream_names],
+                    scope,
+                )
+        return {
+            stream_name: page[0] if page else None
+            for stream_name, page in zip(stream_names, pages, strict=True)
+        }
 
     def iter_stream_messages(
         self,
@@ -115,24 +287,30 @@ class PostgresMessageDBClient:
         position: int | None = None,
         batch_size: int | None = None,
         condition: str | None = None,
+        *,
+        read_ahead: int | None = None,
+        fence: ReadFence | None = None,
+        batch_sizing: AdaptiveBatchSize | None = None,
     ) -> Iterator[ReadMessage]:
-        position = 0 if position is None else position
         batch_size = 1000 if batch_size is None else batch_size
 
-        while True:
-            batch = self.get_stream_messages(
+        def fetch_page(page_position: int, page_size: int) -> list[ReadMessage]:
+            return self.get_stream_messages(
                 stream_name,
-                position=position,
-                batch_size=batch_size,
+                position=page_position,
+                batch_size=page_size,
                 condition=condition,
+                fence=fence,
             )
-            if not batch:
-                return
-            for message in batch:
-                yield message
-            position = batch[-1].position + 1
-            if len(batch) < batch_size:
-                return
+
+        return self._iter_pages(
+            fetch_page,
+            0 if position is None else position,
+            batch_size,
+            next_stream_position,
+            read_ahead,
+            batch_sizing,
+        )
 
     def iter_category_messages(
         self,
@@ -143,97 +321,207 @@ class PostgresMessageDBClient:
         consumer_group_member: int | None = None,
         consumer_group_size: int | None = None,
         condition: str | None = None,
+        *,
+        read_ahead: int | None = None,
+        fence: ReadFence | None = None,
+        batch_sizing: AdaptiveBatchSize | None = None,
     ) -> Iterator[ReadMessage]:
-        position = 1 if position is None else position
         batch_size = 1000 if batch_size is None else batch_size
 
-        while True:
-            batch = self.get_category_messages(
+        def fetch_page(page_position: int, page_size: int) -> list[ReadMessage]:
+            return self.get_category_messages(
                 category,
-                position=position,
-                batch_size=batch_size,
+                position=page_position,
+                batch_size=page_size,
                 correlation=correlation,
                 consumer_group_member=consumer_group_member,
                 consumer_group_size=consumer_group_size,
                 condition=condition,
+                fence=fence,
             )
-            if not batch:
-                return
-            for message in batch:
-                yield message
-            position = batch[-1].global_position + 1
-            if len(batch) < batch_size:
+
+        return self._iter_pages(
+            fetch_page,
+            1 if position is None else position,
+            batch_size,
+            next_global_position,
+            read_ahead,
+            batch_sizing,
+        )
+
+    def _iter_pages(
+        self,
+        fetch_page: FetchSizedPage[ReadMessage],
+        position: int,
+        batch_size: int,
+        next_position: Callable[[ReadMessage], int],
+        read_ahead: int | None,
+        batch_sizing: AdaptiveBatchSize | None,
+    ) -> Iterator[ReadMessage]:
+        depth = self._read_ahead if read_ahead is None else read_ahead
+        if batch_sizing is not None:
+            if read_ahead:
+                raise ValueError("Adaptive batch sizing does not support read-ahead")
+            return iter_pages_adaptive(
+                fetch_page, position, batch_sizing, next_position, estimate_page_bytes
+            )
+
+        def fetch_fixed_page(page_position: int) -> Sequence[ReadMessage]:
+            return fetch_page(page_position, batch_size)
+
+        if depth > 0:
+            return iter_pages_ahead(fetch_fixed_page, position, batch_size, next_position, depth)
+        return iter_pages(fetch_fixed_page, position, batch_size, next_position)
+
+    @contextmanager
+    def _connection(self) -> Iterator[psycopg.Connection]:
+        with _pooled_or_new(self._pool, self._dsn, self._connect_kwargs) as conn:
+            yield conn
+
+    @contextmanager
+    def _read_connection(self, fence: ReadFence | None) -> Iterator[psycopg.Connection]:
+        if not self._replicas:
+            with self._connection() as conn:
+                yield conn
+            return
+
+        dsn, replica_pool = self._replicas[next(self._replica_counter) % len(self._replicas)]
+        with _pooled_or_new(replica_pool, dsn, self._connect_kwargs) as conn:
+            if fence is None or self._wait_for_fence(conn, fence):
+                yield conn
                 return
 
-    def _connect(self) -> psycopg.Connection:
-        return psycopg.connect(self._dsn, row_factory=dict_row)
+        self._logger.debug(
+            "Replica did not reach %s position %s within %ss; reading from primary",
+            fence.stream_name,
+            fence.position,
+            self._fence_timeout,
+        )
+        with self._connection() as conn:
+            yield conn
+
+    def _wait_for_fence(self, conn: psycopg.Connection, fence: ReadFence) -> bool:
+        def stream_version(stream_name: str) -> int | None:
+            cur = conn.execute(STREAM_VERSION_QUERY, (stream_name,), prepare=self._prepare)
+            row = cur.fetchone()
+            return None if row is None else row[0]
 
-    def _fetch_all(self, conn: psycopg.Connection, query: str, params: tuple) -> list[dict]:
         try:
-            with conn.cursor() as cur:
-                cur.execute(query, params)
-                return list(cur.fetchall())
+            return wait_for_fence(
+                stream_version,
+                fence,
+                timeout=self._fence_timeout,
+                poll_interval=self._fence_poll_interval,
+            )
         except psycopg.Error as exc:  # pragma: no cover - exercised in integration tests
-            raise _map_error(exc) from exc
+            raise map_error(exc) from exc
 
-    def _write_one(
+    def _scope(self, operation: str, target: str) -> OperationScope:
+        return OperationScope(self._instrumentation, operation, target)
+
+    def _fetch_all(
+        self, conn: psycopg.Connection, query: str, params: tuple, scope: OperationScope
+    ) -> list[ReadMessage]:
+        try:
+            with conn.cursor(row_factory=self._row_factory) as cur:
+                cur.execute(query, params, prepare=self._prepare, binary=True)
+                messages = list(cur.fetchall())
+                if scope.enabled:
+                    scope.rows = len(messages)
+                    scope.payload_bytes = _result_payload_bytes(cur)
+                return messages
+        except psycopg.Error as exc:  # pragma: no cover - exercised in integration tests
+            raise map_error(exc) from exc
+
+    def _fetch_pipelined(
         self,
         conn: psycopg.Connection,
-        message: WriteMessage,
-        stream_name: str,
-        expected_version: int | None,
-    ) -> int:
-        data = json.dumps(message.data) if message.data is not None else None
-        metadata = json.dumps(message.metadata) if message.metadata is not None else None
+        query: str,
+        params_seq: list[tuple],
+        scope: OperationScope,
+    ) -> list[list[ReadMessage]]:
+        cursors = [conn.cursor(row_factory=self._row_factory) for _ in params_seq]
+        try:
+            if psycopg.Pipeline.is_supported():
+                with conn.pipeline():
+                    for cur, params in zip(cursors, params_seq, strict=True):
+                        cur.execute(query, params, prepare=self._prepare, binary=True)
+            else:  # pragma: no cover - libpq older than 14
+                for cur, params in zip(cursors, params_seq, strict=True):
+                    cur.execute(query, params, prepare=self._prepare, binary=True)
+            pages = []
+            for cur in cursors:
+                page = list(cur.fetchall())
+                if scope.enabled:
+                    scope.rows += len(page)
+                    scope.payload_bytes += _result_payload_bytes(cur)
+                pages.append(page)
+            return pages
+        except psycopg.Error as exc:  # pragma: no cover - exercised in integration tests
+            raise map_error(exc) from exc
+        finally:
+            for cur in cursors:
+                cur.close()
+
+    def _write_batch(
+        self, conn: psycopg.Connection, params: list[tuple], context: str, scope: OperationScope
+    ) -> list[int]:
+        if scope.enabled:
+            scope.rows = len(params)
+            scope.payload_bytes = _params_payload_bytes(params)
+        positions: list[int] = []
         try:
             with conn.cursor() as cur:
-                cur.execute(
-                    f"SELECT {WRITE_MESSAGE}(%s, %s, %s, %s, %s, %s)",
-                    (message.id, stream_name, message.type, data, metadata, expected_version),
-                )
-                return int(cur.fetchone()[0])
+                cur.executemany(WRITE_MESSAGE_QUERY, params, returning=True)
+                while True:
+                    row = cur.fetchone()
+                    if row is None:
+                        raise MessageDBError("Write failed to return a position")
+                    positions.append(int(row[0]))
+                    if not cur.nextset():
+                        break
         except psycopg.Error as exc:  # pragma: no cover - exercised in integration tests
-            context = f"stream_name={stream_name} expected_version={expected_version}"
-            raise _map_error(exc, context=context) from exc
-
-    def _to_write_batch(self, message_data: dict | Iterable[dict]) -> list[WriteMessage]:
-        if isinstance(message_data, Iterable) and not isinstance(message_data, (dict, str, bytes)):
-            batch = message_data
-        else:
-            batch = [message_data]
-        messages: list[WriteMessage] = []
-        for item in batch:
-            message = to_write_message(item)
-            if message.id is None:
-                message = WriteMessage(
-                    id=str(uuid.uuid4()),
-                    type=message.type,
-                    data=message.data,
-                    metadata=message.metadata,
-                )
-            messages.append(message)
-        return messages
-
-
-def _canonize_expected_version(value: int | str | None) -> int | None:
-    if value is None:
-        return None
-    if isinstance(value, str) and value.lower() == "no_stream":
-        return NO_STREAM
-    return int(value)
-
-
-def _map_error(exc: psycopg.Error, *, context: str | None = None) -> MessageDBError:
-    message = str(exc)
-    normalized = message.lower()
-    if context:
-        message = f"{message} ({context})"
-    if "wrong expected version" in normalized:
-        return WrongExpectedVersion(message)
-    if "must be a stream name" in normalized or "must be a category" in normalized:
-        return CategoryError(message)
-    if "consumer group" in normalized:
-        return ConsumerGroupError(message)
-    if "sql condition is not activated" in normalized:
-        return SqlConditionError(message)
-    return MessageDBError(message)
+            raise map_error(exc, context=context) from exc
+        return positions
+
+
+@contextmanager
+def _pooled_or_new(pool: Any, dsn: str, kwargs: dict[str, Any]) -> Iterator[psycopg.Connection]:
+    with ExitStack() as stack:
+        # Only acquisition is mapped here; errors from the caller's block pass through as-is.
+        try:
+            if pool is not None:
+                conn = stack.enter_context(pool.connection())
+            else:
+                conn = stack.enter_context(psycopg.connect(dsn, **kwargs))
+        except psycopg.Error as exc:
+            raise map_error(exc) from exc
+        yield conn
+
+
+def _params_payload_bytes(params: list[tuple]) -> int:
+    total = 0
+    for param in params:
+        for json_param in (param[3], param[4]):
+            if json_param is not None:
+                encoded = json_param.obj
+                total += len(encoded.encode() if isinstance(encoded, str) else encoded)
+    return total
+
+
+def _result_payload_bytes(cur: psycopg.Cursor[Any]) -> int:
+    result = cur.pgresult
+    if result is None or cur.description is None:
+        return 0
+    columns = [
+        index
+        for index, column in enumerate(cur.description)
+        if column.name in ("data", "metadata")
+    ]
+    total = 0
+    for row in range(result.ntuples):
+        for column in columns:
+            value = result.get_value(row, column)
+            if value is not None:
+                total += len(value)
+    return total
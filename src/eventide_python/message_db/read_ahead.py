@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from typing import TypeVar
+
+from eventide_python.message_db.batch_sizing import AdaptiveBatchSize
+
+T = TypeVar("T")
+
+FetchPage = Callable[[int], Sequence[T]]
+FetchSizedPage = Callable[[int, int], Sequence[T]]
+
+
+def iter_pages(
+    fetch_page: FetchPage[T],
+    position: int,
+    batch_size: int,
+    next_position: Callable[[T], int],
+) -> Iterator[T]:
+    while True:
+        page = fetch_page(position)
+        if not page:
+            return
+        yield from page
+        position = next_position(page[-1])
+        if len(page) < batch_size:
+            return
+
+
+def iter_pages_adaptive(
+    fetch_page: FetchSizedPage[T],
+    position: int,
+    sizing: AdaptiveBatchSize,
+    next_position: Callable[[T], int],
+    page_bytes: Callable[[Sequence[T]], int] | None = None,
+) -> Iterator[T]:
+    while True:
+        batch_size = sizing.current
+        started = time.perf_counter()
+        page = fetch_page(position, batch_size)
+        elapsed = time.perf_counter() - started
+        payload_bytes = 0
+        if page and page_bytes is not None and sizing.target_bytes is not None:
+            payload_bytes = page_bytes(page)
+        sizing.observe(batch_size, len(page), elapsed, payload_bytes)
+        if not page:
+            return
+        yield from page
+        position = next_position(page[-1])
+        if len(page) < batch_size:
+            return
+
+
+def iter_pages_ahead(
+    fetch_page: FetchPage[T],
+    position: int,
+    batch_size: int,
+    next_position: Callable[[T], int],
+    depth: int,
+) -> Iterator[T]:
+    if depth < 1:
+        raise ValueError("Read-ahead depth must be at least 1")
+
+    pages: queue.Queue[Sequence[T] | BaseException | None] = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+
+    def fetch() -> None:
+        nonlocal position
+        try:
+            while not stopped.is_set():
+                page = fetch_page(position)
+                pages.put(page)
+                if not page or len(page) < batch_size:
+                    break
+                position = next_position(page[-1])
+        except BaseException as exc:  # noqa: BLE001 - re-raised in the consuming thread
+            if not stopped.is_set():
+                pages.put(exc)
+            return
+        if not stopped.is_set():
+            pages.put(None)
+
+    fetcher = threading.Thread(target=fetch, name="eventide-read-ahead", daemon=True)
+    fetcher.start()
+    try:
+        while True:
+            item = pages.get()
+            if item is None:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield from item
+    finally:
+        stopped.set()
+        while True:
+            try:
+                pages.get_nowait()
+            except queue.Empty:
+                break
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ReadFence:
+    """A write that a read must observe: ``stream_name`` has reached ``position``.
+
+    Replicas apply commits in order, so once the fenced write is visible every
+    earlier write is too, whichever stream or category is read afterwards.
+    """
+
+    stream_name: str
+    position: int
+
+
+def wait_for_fence(
+    stream_version: Callable[[str], int | None],
+    fence: ReadFence,
+    *,
+    timeout: float,
+    poll_interval: float,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], None] = time.sleep,
+) -> bool:
+    deadline = clock() + timeout
+    while True:
+        version = stream_version(fence.stream_name)
+        if version is not None and version >= fence.position:
+            return True
+        remaining = deadline - clock()
+        if remaining <= 0:
+            return False
+        sleep(min(poll_interval, remaining))
@@ -2,15 +2,36 @@ from __future__ import annotations
 
 import json
 from datetime import datetime
-from typing import Any, Mapping
+from operator import itemgetter
+from sys import intern
+from typing import Any, Callable, Mapping, Sequence
 
-from eventide_python.message_db.message_data import ReadMessage, WriteMessage
+from eventide_python.message_db.errors import MessageDBError
+from eventide_python.message_db.message_data import (
+    JsonDecoder,
+    LazyReadMessage,
+    ReadMessage,
+    WriteMessage,
+)
 
+READ_MESSAGE_COLUMNS = (
+    "id",
+    "stream_name",
+    "type",
+    "position",
+    "global_position",
+    "data",
+    "metadata",
+    "time",
+)
 
-def _parse_json(value: str | None) -> Mapping[str, Any] | None:
+
+def _parse_json(
+    value: str | bytes | None, decode: JsonDecoder = json.loads
+) -> Mapping[str, Any] | None:
     if value is None:
         return None
-    return json.loads(value)
+    return decode(value)  # type: ignore[no-any-return]
 
 
 def _format_time(value: Any) -> datetime | None:
@@ -19,23 +40,88 @@ def _format_time(value: Any) -> datetime | None:
     return datetime.fromisoformat(str(value))
 
 
-def to_write_message(value: dict) -> WriteMessage:
+def to_write_message(value: dict, *, id_factory: Callable[[], str] | None = None) -> WriteMessage:
+    message_id = value.get("id")
+    if message_id is None and id_factory is not None:
+        message_id = id_factory()
     return WriteMessage(
-        id=value.get("id"),
+        id=message_id,
         type=value["type"],
         data=value.get("data"),
         metadata=value.get("metadata"),
     )
 
 
-def to_read_message(row: Mapping[str, Any]) -> ReadMessage:
+def to_read_message(
+    row: Mapping[str, Any], *, lazy: bool = False, decode: JsonDecoder = json.loads
+) -> ReadMessage:
+    return _build_read_message(
+        row["id"],
+        row["stream_name"],
+        row["type"],
+        row["position"],
+        row["global_position"],
+        row.get("data"),
+        row.get("metadata"),
+        row.get("time"),
+        lazy=lazy,
+        decode=decode,
+    )
+
+
+def read_message_row_factory(
+    *, lazy: bool = False, decode: JsonDecoder = json.loads
+) -> Callable[[Any], Callable[[Sequence[Any]], ReadMessage]]:
+    def row_factory(cursor: Any) -> Callable[[Sequence[Any]], ReadMessage]:
+        if cursor.description is None:
+            return _no_rows
+        columns = {column.name: index for index, column in enumerate(cursor.description)}
+        values_of = itemgetter(*(columns[name] for name in READ_MESSAGE_COLUMNS))
+
+        def make_row(values: Sequence[Any]) -> ReadMessage:
+            return _build_read_message(*values_of(values), lazy=lazy, decode=decode)
+
+        return make_row
+
+    return row_factory
+
+
+def _build_read_message(
+    id: str,
+    stream_name: str,
+    type: str,
+    position: int,
+    global_position: int,
+    data: str | bytes | None,
+    metadata: str | bytes | None,
+    time: Any,
+    *,
+    lazy: bool,
+    decode: JsonDecoder,
+) -> ReadMessage:
+    if lazy:
+        return LazyReadMessage(
+            id=id,
+            stream_name=intern(stream_name),
+            type=intern(type),
+            position=position,
+            global_position=global_position,
+            raw_data=data,
+            raw_metadata=metadata,
+            decode=decode,
+            time=_format_time(time),
+        )
     return ReadMessage(
-        id=row["id"],
-        stream_name=row["stream_name"],
-        type=row["type"],
-        position=row["position"],
-        global_position=row["global_position"],
-        data=_parse_json(row.get("data")),
-        metadata=_parse_json(row.get("metadata")),
-        time=_format_time(row.get("time")),
+        id=id,
+        stream_name=intern(stream_name),
+        type=intern(type),
+        position=position,
+        global_position=global_position,
+        data=_parse_json(data, decode),
+        metadata=_parse_json(metadata, decode),
+        time=_format_time(time),
     )
+
+
+def _no_rows(values: Sequence[Any]) -> ReadMessage:
+    raise MessageDBError("Query did not return message rows")
@@ -10,3 +10,42 @@ CARDINAL_ID = "message_store.cardinal_id"
 CATEGORY = "message_store.category"
 IS_CATEGORY = "message_store.is_category"
 HASH_64 = "message_store.hash_64"
+
+WRITE_MESSAGE_QUERY = f"SELECT {WRITE_MESSAGE}(%s, %s, %s, %b, %b, %s)"
+GET_STREAM_MESSAGES_QUERY = f"SELECT * FROM {GET_STREAM_MESSAGES}(%s, %s, %s, %s)"
+GET_CATEGORY_MESSAGES_QUERY = f"SELECT * FROM {GET_CATEGORY_MESSAGES}(%s, %s, %s, %s, %s, %s, %s)"
+GET_LAST_STREAM_MESSAGE_QUERY = f"SELECT * FROM {GET_LAST_STREAM_MESSAGE}(%s, %s)"
+STREAM_VERSION_QUERY = f"SELECT {STREAM_VERSION}(%s)"
+
+NOTIFY_CHANNEL = "eventide_message_written"
+NOTIFY_TRIGGER_DDL = f"""
+CREATE OR REPLACE FUNCTION message_store.notify_message_written() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+  PERFORM pg_notify('{NOTIFY_CHANNEL}', {CATEGORY}(NEW.stream_name));
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS notify_message_written ON message_store.messages;
+
+CREATE TRIGGER notify_message_written
+AFTER INSERT ON message_store.messages
+FOR EACH ROW EXECUTE FUNCTION message_store.notify_message_written();
+"""
+
+POSITION_TABLE = "eventide_consumer_positions"
+POSITION_TABLE_DDL = """
+CREATE TABLE IF NOT EXISTS {table} (
+  consumer text PRIMARY KEY,
+  position bigint NOT NULL,
+  updated_time timestamp NOT NULL DEFAULT (now() AT TIME ZONE 'utc')
+)
+"""
+GET_POSITION_QUERY = "SELECT position FROM {table} WHERE consumer = %s"
+PUT_POSITIONS_QUERY = """
+INSERT INTO {table} (consumer, position)
+SELECT * FROM unnest(%s::text[], %s::bigint[])
+ON CONFLICT (consumer) DO UPDATE
+SET position = EXCLUDED.position, updated_time = now() AT TIME ZONE 'utc'
+"""
@@ -1,6 +1,7 @@
 """Service host and supervision utilities."""
 
+from eventide_python.backoff import Backoff
 from eventide_python.service_host.host import ServiceHost
 from eventide_python.service_host.service import Service
 
-__all__ = ["ServiceHost", "Service"]
+__all__ = ["Backoff", "ServiceHost", "Service"]
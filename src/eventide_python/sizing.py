@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, complex, bool, type(None))
+
+
+def approximate_size(value: Any) -> int:
+    """Approximate the memory held by ``value`` and everything it references, in bytes."""
+    seen: set[int] = set()
+    stack = [value]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or callable(item):
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, _ATOMIC_TYPES):
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        else:
+            stack.extend(_attribute_values(item))
+    return total
+
+
+def _attribute_values(item: Any) -> list[Any]:
+    values = []
+    if hasattr(item, "__dict__"):
+        values.append(vars(item))
+    # Read slots through their descriptors so properties shadowing a slot are not evaluated.
+    for cls in type(item).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            descriptor = cls.__dict__.get(name)
+            if descriptor is None or not hasattr(descriptor, "__get__"):
+                continue
+            try:
+                values.append(descriptor.__get__(item, cls))
+            except AttributeError:
+                continue
+    return values
@@ -1,8 +1,17 @@
+import asyncio
 import os
+import uuid
 
 import pytest
 
-from eventide_python.message_db import PostgresMessageDBClient
+from eventide_python.consumer import MessageDBPositionStore, PostgresPositionStore
+from eventide_python.message_db import (
+    AsyncPostgresMessageDBClient,
+    PoolConfig,
+    PostgresMessageDBClient,
+    ReadFence,
+    WrongExpectedVersion,
+)
 
 
 MESSAGE_DB_DSN = os.getenv("MESSAGE_DB_DSN")
@@ -37,3 +46,197 @@ def test_category_read_with_consumer_group() -> None:
     )
 
     assert isinstance(messages, list)
+
+
+@pytest.mark.skipif(MESSAGE_DB_DSN is None, reason="MESSAGE_DB_DSN is not set")
+def test_pooled_client_reuses_connections() -> None:
+    with PostgresMessageDBClient(MESSAGE_DB_DSN, pool=PoolConfig(min_size=1, max_size=2)) as client:
+        stream_name = "integration_test-pool"
+        client.write({"type": "Tested", "data": {"value": 4}}, stream_name)
+        for _ in range(5):
+            assert client.get_stream_messages(stream_name)
+
+        stats = client.pool_stats()
+
+    assert stats is not None
+    assert stats.size <= 2
+    assert stats.requests >= 6
+
+
+@pytest.mark.skipif(MESSAGE_DB_DSN is None, reason="MESSAGE_DB_DSN is not set")
+def test_batch_write_checks_expected_version_and_returns_last_position() -> None:
+    client = PostgresMessageDBClient(MESSAGE_DB_DSN)
+    stream_name = f"integration_test-{uuid.uuid4().hex}"
+    batch = [{"type": "Tested", "data": {"value": index}} for index in range(3)]
+
+    position = client.write(batch, stream_name, expected_version="no_stream")
+
+    assert position == 2
+    assert [m.data["value"] for m in client.get_stream_messages(stream_name)] == [0, 1, 2]
+    with pytest.raises(WrongExpectedVersion):
+        client.write(batch, stream_name, expected_version=0)
+    assert len(client.get_stream_messages(stream_name)) == 3
+
+
+@pytest.mark.skipif(MESSAGE_DB_DSN is None, reason="MESSAGE_DB_DSN is not set")
+def test_async_client_shares_small_pool() -> None:
+    stream_name = f"integration_test-{uuid.uuid4().hex}"
+
+    async def scenario() -> None:
+        async with AsyncPostgresMessageDBClient(
+            MESSAGE_DB_DSN, pool=PoolConfig(min_size=1, max_size=2)
+        ) as client:
+            await client.write([{"type": "Tested"}, {"type": "Tested"}], stream_name)
+            reads = await asyncio.gather(
+                *(client.get_stream_messages(stream_name) for _ in range(50))
+            )
+            assert all(len(messages) == 2 for messages in reads)
+            assert [m.position async for m in client.iter_stream_messages(stream_name)] == [0, 1]
+            last = await client.get_last_stream_message(stream_name)
+            assert last is not None and last.position == 1
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.skipif(MESSAGE_DB_DSN is None, reason="MESSAGE_DB_DSN is not set")
+def test_async_client_reads_categories_in_pages() -> None:
+    category = f"integration{uuid.uuid4().hex}"
+
+    async def scenario() -> None:
+        async with AsyncPostgresMessageDBClient(
+            MESSAGE_DB_DSN, pool=PoolConfig(min_size=1, max_size=2)
+        ) as client:
+            for index in range(5):
+                await client.write(
+                    {"type": "Tested", "data": {"index": index}}, f"{category}-{index}"
+                )
+            page = await client.get_category_messages(category, batch_size=2)
+            assert [m.data["index"] for m in page] == [0, 1]
+            rest = await client.get_category_messages(
+                category, position=page[-1].global_position + 1
+            )
+            assert [m.data["index"] for m in rest] == [2, 3, 4]
+            messages = [m async for m in client.iter_category_messages(category, batch_size=2)]
+            assert [m.data["index"] for m in messages] == [0, 1, 2, 3, 4]
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.skipif(MESSAGE_DB_DSN is None, reason="MESSAGE_DB_DSN is not set")
+def test_async_write_many_is_atomic_across_streams() -> None:
+    entity_stream = f"integration_test-{uuid.uuid4().hex}"
+    reply_stream = f"integration_reply-{uuid.uuid4().hex}"
+
+    async def scenario() -> None:
+        async with AsyncPostgresMessageDBClient(MESSAGE_DB_DSN) as client:
+            positions = await client.write_many(
+                [
+                    (entity_stream, [{"type": "Opened"}, {"type": "Deposited"}], "no_stream"),
+                    (reply_stream, {"type": "Replied"}, None),
+                ]
+            )
+            assert positions == {entity_stream: 1, reply_stream: 0}
+
+            with pytest.raises(WrongExpectedVersion):
+                await client.write_many(
+                    [
+                        (reply_stream, {"type": "Replied"}, None),
+                        (entity_stream, {"type": "Deposited"}, 0),
+                    ]
+                )
+            assert len(await client.get_stream_messages(reply_stream)) == 1
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.skipif(MESSAGE_DB_DSN is None, reason="MESSAGE_DB_DSN is not set")
+def test_async_pooled_client_can_be_reopened() -> None:
+    stream_name = f"integration_test-{uuid.uuid4().hex}"
+
+    async def scenario() -> None:
+        client = AsyncPostgresMessageDBClient(
+            MESSAGE_DB_DSN, pool=PoolConfig(min_size=1, max_size=2)
+        )
+        async with client:
+            await client.write({"type": "Tested"}, stream_name)
+        async with client:
+            assert len(await client.get_stream_messages(stream_name)) == 1
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.skipif(MESSAGE_DB_DSN is None, reason="MESSAGE_DB_DSN is not set")
+def test_write_many_is_atomic_across_streams() -> None:
+    client = PostgresMessageDBClient(MESSAGE_DB_DSN)
+    entity_stream = f"integration_test-{uuid.uuid4().hex}"
+    reply_stream = f"integration_reply-{uuid.uuid4().hex}"
+
+    positions = client.write_many(
+        [
+            (entity_stream, [{"type": "Opened"}, {"type": "Deposited"}], "no_stream"),
+            (reply_stream, {"type": "Replied"}, None),
+        ]
+    )
+
+    assert positions == {entity_stream: 1, reply_stream: 0}
+
+    with pytest.raises(WrongExpectedVersion):
+        client.write_many(
+            [
+                (reply_stream, {"type": "Replied"}, None),
+                (entity_stream, {"type": "Deposited"}, 0),
+            ]
+        )
+    assert len(client.get_stream_messages(reply_stream)) == 1
+
+
+@pytest.mark.skipif(MESSAGE_DB_DSN is None, reason="MESSAGE_DB_DSN is not set")
+def test_fenced_replica_read_sees_the_write() -> None:
+    replica_dsn = os.getenv("MESSAGE_DB_REPLICA_DSN", MESSAGE_DB_DSN)
+    client = PostgresMessageDBClient(MESSAGE_DB_DSN, replicas=[replica_dsn], fence_timeout=5.0)
+    stream_name = f"integrationFence-{uuid.uuid4().hex}"
+
+    position = client.write({"type": "Tested"}, stream_name)
+    messages = client.get_stream_messages(stream_name, fence=ReadFence(stream_name, position))
+
+    assert [message.position for message in messages] == [position]
+
+
+@pytest.mark.skipif(MESSAGE_DB_DSN is None, reason="MESSAGE_DB_DSN is not set")
+def test_durable_position_stores_survive_a_new_instance() -> None:
+    consumer_name = f"integration{uuid.uuid4().hex}"
+    client = PostgresMessageDBClient(MESSAGE_DB_DSN)
+    MessageDBPositionStore(message_db=client, category="integrationTest").set(consumer_name, 3)
+
+    with PostgresPositionStore(MESSAGE_DB_DSN) as store:
+        store.install()
+        store.set(consumer_name, 9)
+
+    assert MessageDBPositionStore(message_db=client, category="integrationTest").get(
+        consumer_name
+    ) == 3
+    with PostgresPositionStore(MESSAGE_DB_DSN) as store:
+        assert store.get(consumer_name) == 9
+
+
+@pytest.mark.skipif(MESSAGE_DB_DSN is None, reason="MESSAGE_DB_DSN is not set")
+def test_many_stream_reads_return_every_stream_tail() -> None:
+    client = PostgresMessageDBClient(MESSAGE_DB_DSN)
+    category = f"integration{uuid.uuid4().hex[:8]}"
+    for index in range(3):
+        client.write(
+            [{"type": "Tested", "data": {"value": value}} for value in range(index + 2)],
+            f"{category}-{index}",
+        )
+
+    messages = client.get_many_stream_messages(
+        {f"{category}-0": None, f"{category}-1": 1, f"{category}-2": 3, f"{category}-9": None},
+        batch_size=2,
+    )
+
+    assert {name: [m.position for m in page] for name, page in messages.items()} == {
+        f"{category}-0": [0, 1],
+        f"{category}-1": [1, 2],
+        f"{category}-2": [3],
+        f"{category}-9": [],
+    }
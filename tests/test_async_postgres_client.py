@@ -0,0 +1,52 @@
+import asyncio
+
+from eventide_python.message_db import AsyncPostgresMessageDBClient, PoolConfig, async_postgres
+
+
+class FakeAsyncPool:
+    def __init__(self) -> None:
+        self.opens = 0
+        self.closed = False
+
+    async def open(self) -> None:
+        # Yield to the loop so concurrent callers overlap here.
+        await asyncio.sleep(0)
+        self.opens += 1
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def test_concurrent_first_use_opens_the_pool_once(monkeypatch) -> None:
+    monkeypatch.setattr(
+        async_postgres, "open_async_pool", lambda dsn, config, kwargs: FakeAsyncPool()
+    )
+    client = AsyncPostgresMessageDBClient("unused", pool=PoolConfig())
+
+    async def scenario() -> None:
+        await asyncio.gather(*(client.open() for _ in range(10)))
+
+    asyncio.run(scenario())
+
+    assert client._pool.opens == 1
+
+
+def test_closed_client_opens_a_new_pool(monkeypatch) -> None:
+    pools: list[FakeAsyncPool] = []
+
+    def new_pool(dsn, config, kwargs) -> FakeAsyncPool:
+        pools.append(FakeAsyncPool())
+        return pools[-1]
+
+    monkeypatch.setattr(async_postgres, "open_async_pool", new_pool)
+    client = AsyncPostgresMessageDBClient("unused", pool=PoolConfig())
+
+    async def scenario() -> None:
+        async with client:
+            pass
+        async with client:
+            pass
+
+    asyncio.run(scenario())
+
+    assert [(pool.opens, pool.closed) for pool in pools] == [(1, True), (1, True), (0, False)]
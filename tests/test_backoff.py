@@ -0,0 +1,18 @@
+from eventide_python.backoff import Backoff
+
+
+def test_backoff_grows_to_maximum_and_resets() -> None:
+    backoff = Backoff(base=1.0, maximum=4.0)
+
+    assert [backoff.next() for _ in range(4)] == [1.0, 2.0, 4.0, 4.0]
+    backoff.reset()
+    assert backoff.next() == 1.0
+
+
+def test_backoff_jitter_shortens_delays_within_bounds() -> None:
+    backoff = Backoff(base=1.0, maximum=4.0, jitter=0.5)
+
+    delays = [backoff.next() for _ in range(4)]
+
+    for delay, current in zip(delays, [1.0, 2.0, 4.0, 4.0], strict=True):
+        assert current * 0.5 <= delay <= current
@@ -0,0 +1,49 @@
+import pytest
+
+from eventide_python.message_db.batch_sizing import AdaptiveBatchSize, estimate_page_bytes
+
+
+def test_batch_size_grows_toward_latency_target_on_full_pages() -> None:
+    sizing = AdaptiveBatchSize(initial=100, maximum=1000, target_latency=0.1)
+
+    # 100 rows in 10ms: 1000 rows would meet the target, growth is capped at 2x.
+    assert sizing.observe(100, 100, 0.01) == 200
+    assert sizing.observe(200, 200, 0.02) == 400
+    assert sizing.observe(400, 400, 0.04) == 800
+    assert sizing.observe(800, 800, 0.08) == 1000
+
+
+def test_batch_size_shrinks_when_pages_are_slow() -> None:
+    sizing = AdaptiveBatchSize(initial=1000, minimum=10, target_latency=0.05)
+
+    assert sizing.observe(1000, 1000, 0.5) == 100
+
+
+def test_short_pages_do_not_grow_batch_size() -> None:
+    sizing = AdaptiveBatchSize(initial=100, target_latency=0.1)
+
+    assert sizing.observe(100, 5, 0.0001) == 100
+    assert sizing.observe(100, 0, 0.0001) == 100
+
+
+def test_batch_size_respects_memory_target() -> None:
+    sizing = AdaptiveBatchSize(initial=1000, target_latency=10.0, target_bytes=50_000)
+
+    # 1000 rows of 1KB each: the memory target allows 50 rows.
+    assert sizing.observe(1000, 1000, 0.01, payload_bytes=1_000_000) == 50
+
+
+def test_batch_size_validates_bounds() -> None:
+    with pytest.raises(ValueError):
+        AdaptiveBatchSize(minimum=10, maximum=5)
+    with pytest.raises(ValueError):
+        AdaptiveBatchSize(target_latency=0)
+
+
+def test_page_bytes_are_estimated_from_samples() -> None:
+    page = [{"data": "x" * 100} for _ in range(100)]
+
+    estimate = estimate_page_bytes(page)
+
+    assert estimate == estimate_page_bytes(page[:1]) * 100
+    assert estimate_page_bytes([]) == 0
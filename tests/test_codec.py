@@ -0,0 +1,60 @@
+from datetime import UTC, date, datetime
+from uuid import UUID
+
+import pytest
+
+from eventide_python.message_db.codec import StdlibJsonCodec, get_codec
+from eventide_python.message_db.errors import MessageDBError
+from eventide_python.message_db.params import json_param
+
+PAYLOAD = {
+    "at": datetime(2024, 1, 1, 12, 30, tzinfo=UTC),
+    "local": datetime(2024, 1, 1, 12, 30, 0, 500),
+    "on": date(2024, 1, 2),
+    "id": UUID(int=1),
+    "name": "café",
+    "values": [1, 2.5, None, True],
+}
+
+EXPECTED = {
+    "at": "2024-01-01T12:30:00Z",
+    "local": "2024-01-01T12:30:00.000500",
+    "on": "2024-01-02",
+    "id": "00000000-0000-0000-0000-000000000001",
+    "name": "café",
+    "values": [1, 2.5, None, True],
+}
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_codecs_encode_datetime_and_uuid_consistently(name: str) -> None:
+    if name != "json":
+        pytest.importorskip(name)
+    codec = get_codec(name)
+
+    encoded = codec.encode(PAYLOAD)
+
+    assert codec.decode(encoded) == EXPECTED
+    assert StdlibJsonCodec().decode(encoded) == EXPECTED
+
+
+def test_get_codec_defaults_to_stdlib_and_rejects_unknown_names() -> None:
+    assert isinstance(get_codec(), StdlibJsonCodec)
+    with pytest.raises(MessageDBError):
+        get_codec("yaml")
+
+
+def test_raw_json_is_passed_through_without_encoding() -> None:
+    class FailingCodec:
+        name = "failing"
+
+        def encode(self, value):
+            raise AssertionError("raw JSON must not be re-encoded")
+
+        def decode(self, value):
+            raise AssertionError("raw JSON must not be decoded")
+
+    param = json_param(b'{"a": 1}', FailingCodec())
+
+    assert param is not None
+    assert param.dumps(param.obj) == b'{"a": 1}'
@@ -0,0 +1,15 @@
+import pytest
+
+from eventide_python.message_db import type_condition
+
+
+def test_type_condition_quotes_and_deduplicates_types() -> None:
+    assert type_condition(["Withdrawn", "Deposited", "Withdrawn"]) == (
+        "type IN ('Deposited', 'Withdrawn')"
+    )
+    assert type_condition(["O'Brien"]) == "type IN ('O''Brien')"
+
+
+def test_type_condition_needs_a_type() -> None:
+    with pytest.raises(ValueError):
+        type_condition([])
@@ -1,4 +1,15 @@
+import time
+
+import pytest
+
+from eventide_python.backoff import Backoff
 from eventide_python.consumer import Consumer, InMemoryPositionStore
+from eventide_python.message_db import (
+    CachingMessageDBClient,
+    InMemoryMessageDBClient,
+    SqlConditionError,
+)
+from eventide_python.message_db.batch_sizing import AdaptiveBatchSize
 from eventide_python.message_db.message_data import ReadMessage
 
 
@@ -62,3 +73,338 @@ def test_consumer_tracks_position() -> None:
     assert processed == 2
     assert handled == [10, 11]
     assert store.get("order-consumer") == 11
+
+
+class RecordingSignal:
+    def __init__(self) -> None:
+        self.timeouts: list[float] = []
+
+    def wait(self, timeout: float) -> bool:
+        self.timeouts.append(timeout)
+        return True
+
+
+def test_consumer_waits_on_wakeup_signal_when_idle() -> None:
+    signal = RecordingSignal()
+    consumer = Consumer(
+        name="order-consumer",
+        category="order",
+        message_db=FakeMessageDBClient([]),
+        handler=lambda msg: None,
+        position_store=InMemoryPositionStore(),
+        poll_interval=30.0,
+        wakeup=signal,
+    )
+
+    consumer.run(max_iterations=3)
+
+    assert signal.timeouts == [30.0, 30.0]
+
+
+class RecordingPositionStore(InMemoryPositionStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes: list[int] = []
+
+    def set(self, consumer_name: str, position: int) -> None:
+        self.writes.append(position)
+        super().set(consumer_name, position)
+
+
+def make_messages(count: int) -> list[ReadMessage]:
+    return [
+        ReadMessage(id=str(p), stream_name="order-1", type="Tested", position=p, global_position=p)
+        for p in range(1, count + 1)
+    ]
+
+
+def test_position_updates_are_coalesced_and_flushed_at_end_of_batch() -> None:
+    store = RecordingPositionStore()
+    consumer = Consumer(
+        name="order-consumer",
+        category="order",
+        message_db=FakeMessageDBClient(make_messages(7)),
+        handler=lambda msg: None,
+        position_store=store,
+        position_update_interval=3,
+    )
+
+    assert consumer.run_once() == 7
+
+    assert store.writes == [3, 6, 7]
+    stats = consumer.position_update_stats()
+    assert (stats.messages, stats.writes, stats.saved) == (7, 3, 4)
+
+
+def test_position_of_handled_messages_is_saved_when_handler_fails() -> None:
+    store = RecordingPositionStore()
+
+    def handler(message: ReadMessage) -> None:
+        if message.global_position == 5:
+            raise RuntimeError("boom")
+
+    consumer = Consumer(
+        name="order-consumer",
+        category="order",
+        message_db=FakeMessageDBClient(make_messages(7)),
+        handler=handler,
+        position_store=store,
+        position_update_interval=10,
+    )
+
+    with pytest.raises(RuntimeError):
+        consumer.run_once()
+
+    assert store.writes == [4]
+
+
+def test_seconds_only_position_updates_ignore_the_message_count() -> None:
+    store = RecordingPositionStore()
+
+    def handler(message: ReadMessage) -> None:
+        if message.global_position == 3:
+            time.sleep(0.06)
+
+    consumer = Consumer(
+        name="order-consumer",
+        category="order",
+        message_db=FakeMessageDBClient(make_messages(6)),
+        handler=handler,
+        position_store=store,
+        position_update_seconds=0.05,
+    )
+
+    assert consumer.run_once() == 6
+    assert store.writes == [3, 6]
+
+
+def test_concurrent_consumer_handles_streams_in_parallel() -> None:
+    messages = [
+        ReadMessage(id=str(p), stream_name=f"order-{p}", type="Tested", global_position=p)
+        for p in range(1, 9)
+    ]
+    store = RecordingPositionStore()
+    consumer = Consumer(
+        name="order-consumer",
+        category="order",
+        message_db=FakeMessageDBClient(messages),
+        handler=lambda msg: time.sleep(0.05),
+        position_store=store,
+        position_update_interval=100,
+        workers=8,
+    )
+
+    started = time.perf_counter()
+    assert consumer.run_once() == 8
+    elapsed = time.perf_counter() - started
+    consumer.close()
+
+    assert elapsed < 0.3
+    assert store.writes == [8]
+
+
+def test_concurrent_consumer_records_low_watermark_when_handler_fails() -> None:
+    store = RecordingPositionStore()
+
+    def handler(message: ReadMessage) -> None:
+        if message.global_position == 3:
+            raise RuntimeError("boom")
+
+    consumer = Consumer(
+        name="order-consumer",
+        category="order",
+        message_db=FakeMessageDBClient(make_messages(6)),
+        handler=handler,
+        position_store=store,
+        workers=2,
+        partition_by=lambda message: str(message.global_position),
+    )
+
+    with pytest.raises(RuntimeError):
+        consumer.run_once()
+    consumer.close()
+
+    assert store.get("order-consumer") == 2
+
+
+def test_batch_handler_receives_sub_batches_and_records_position_after_each() -> None:
+    store = RecordingPositionStore()
+    batches: list[list[int]] = []
+    consumer = Consumer(
+        name="order-consumer",
+        category="order",
+        message_db=FakeMessageDBClient(make_messages(7)),
+        batch_handler=lambda batch: batches.append([m.global_position for m in batch]),
+        handler_batch_size=3,
+        position_store=store,
+    )
+
+    assert consumer.run_once() == 7
+    assert batches == [[1, 2, 3], [4, 5, 6], [7]]
+    assert store.writes == [3, 6, 7]
+    assert consumer.position_update_stats().messages == 7
+
+
+def test_batch_handler_failure_leaves_position_before_the_batch() -> None:
+    store = RecordingPositionStore()
+
+    def batch_handler(batch) -> None:
+        if batch[0].global_position == 3:
+            raise RuntimeError("boom")
+
+    consumer = Consumer(
+        name="order-consumer",
+        category="order",
+        message_db=FakeMessageDBClient(make_messages(6)),
+        batch_handler=batch_handler,
+        handler_batch_size=2,
+        position_store=store,
+    )
+
+    with pytest.raises(RuntimeError):
+        consumer.run_once()
+    assert store.get("order-consumer") == 2
+
+
+def test_batch_handler_with_unlimited_batch_size_uses_default_sub_batches() -> None:
+    client = InMemoryMessageDBClient()
+    for index in range(3):
+        client.write({"type": "Placed", "data": {}}, f"order-{index}")
+    batches: list[int] = []
+    consumer = Consumer(
+        name="order-consumer",
+        category="order",
+        message_db=client,
+        batch_handler=lambda batch: batches.append(len(batch)),
+        batch_size=-1,
+        position_store=InMemoryPositionStore(),
+    )
+
+    assert consumer.run_once() == 3
+    assert batches == [3]
+
+
+def test_consumer_rejects_non_positive_handler_batch_size() -> None:
+    with pytest.raises(ValueError, match="Handler batch size"):
+        Consumer(
+            name="order-consumer",
+            category="order",
+            message_db=FakeMessageDBClient([]),
+            batch_handler=lambda batch: None,
+            handler_batch_size=0,
+            position_store=InMemoryPositionStore(),
+        )
+
+
+def test_consumer_requires_exactly_one_handler() -> None:
+    common = dict(
+        name="order-consumer",
+        category="order",
+        message_db=FakeMessageDBClient([]),
+        position_store=InMemoryPositionStore(),
+    )
+    with pytest.raises(ValueError):
+        Consumer(**common)
+    with pytest.raises(ValueError):
+        Consumer(**common, handler=lambda message: None, batch_handler=lambda batch: None)
+    with pytest.raises(ValueError):
+        Consumer(**common, batch_handler=lambda batch: None, workers=2)
+
+
+def test_idle_backoff_grows_while_idle_and_resets_when_messages_arrive() -> None:
+    messages: list[ReadMessage] = []
+    signal = RecordingSignal()
+    consumer = Consumer(
+        name="order-consumer",
+        category="order",
+        message_db=FakeMessageDBClient(messages),
+        handler=lambda message: None,
+        position_store=InMemoryPositionStore(),
+        wakeup=signal,
+        idle_backoff=Backoff(base=0.01, maximum=0.04),
+    )
+
+    consumer.run(max_iterations=4)
+    assert signal.timeouts == [0.01, 0.02, 0.04]
+
+    messages.extend(make_messages(2))
+    signal.timeouts.clear()
+    consumer.run(max_iterations=3)
+    assert signal.timeouts == [0.01]
+
+
+def test_message_types_are_pushed_into_the_category_condition() -> None:
+    conditions: list[str | None] = []
+
+    class RecordingClient(FakeMessageDBClient):
+        def iter_category_messages(self, category, position=None, condition=None, **kwargs):
+            conditions.append(condition)
+            return super().iter_category_messages(category, position=position)
+
+    consumer = Consumer(
+        name="order-consumer",
+        category="order",
+        message_db=RecordingClient(make_messages(2)),
+        handler=lambda message: None,
+        position_store=InMemoryPositionStore(),
+        message_types=["Placed", "Shipped", "Placed"],
+    )
+
+    assert consumer.run_once() == 2
+    assert conditions == ["type IN ('Placed', 'Shipped')"]
+
+
+def test_message_types_require_sql_conditions() -> None:
+    client = InMemoryMessageDBClient()
+    client.write({"type": "Placed", "data": {}}, "order-1")
+    consumer = Consumer(
+        name="order-consumer",
+        category="order",
+        message_db=client,
+        handler=lambda message: None,
+        position_store=InMemoryPositionStore(),
+        message_types=["Placed"],
+    )
+
+    with pytest.raises(SqlConditionError, match="sql_condition"):
+        consumer.run_once()
+
+
+def test_adaptive_batch_sizing_passes_through_the_caching_client() -> None:
+    client = InMemoryMessageDBClient()
+    for index in range(25):
+        client.write({"type": "Placed", "data": {"index": index}}, f"order-{index}")
+    sizing = AdaptiveBatchSize(initial=10, minimum=10, maximum=10)
+    handled: list[int] = []
+    consumer = Consumer(
+        name="order-consumer",
+        category="order",
+        message_db=CachingMessageDBClient(client),
+        handler=lambda message: handled.append(message.global_position),
+        position_store=InMemoryPositionStore(),
+        batch_sizing=sizing,
+    )
+
+    assert consumer.run_once() == 25
+    assert handled == list(range(1, 26))
+
+
+def test_adaptive_batch_sizing_reads_pages_through_get_category_messages() -> None:
+    page_sizes: list[int] = []
+
+    class PagingClient(FakeMessageDBClient):
+        def get_category_messages(self, category, position=None, batch_size=None, **kwargs):
+            page_sizes.append(batch_size)
+            return list(self.iter_category_messages(category, position=position))[:batch_size]
+
+    consumer = Consumer(
+        name="order-consumer",
+        category="order",
+        message_db=PagingClient(make_messages(25)),
+        handler=lambda message: None,
+        position_store=InMemoryPositionStore(),
+        batch_sizing=AdaptiveBatchSize(initial=10, minimum=10, maximum=10),
+    )
+
+    assert consumer.run_once() == 25
+    assert page_sizes == [10, 10, 10]
@@ -0,0 +1,74 @@
+import threading
+import time
+
+import pytest
+
+from eventide_python.consumer.dispatch import ConcurrentDispatcher
+from eventide_python.message_db.message_data import ReadMessage
+
+
+def message(global_position: int, stream_name: str) -> ReadMessage:
+    return ReadMessage(
+        id=str(global_position),
+        type="Tested",
+        stream_name=stream_name,
+        global_position=global_position,
+    )
+
+
+def test_messages_of_a_stream_are_handled_in_order() -> None:
+    handled: dict[str, list[int]] = {}
+    lock = threading.Lock()
+
+    def handler(msg: ReadMessage) -> None:
+        time.sleep(0.001 * (msg.global_position % 3))
+        with lock:
+            handled.setdefault(msg.stream_name, []).append(msg.global_position)
+
+    dispatcher = ConcurrentDispatcher(handler, workers=4, max_in_flight=5)
+    for position in range(1, 41):
+        assert dispatcher.submit(message(position, f"order-{position % 6}"))
+    dispatcher.join()
+
+    for stream_name, positions in handled.items():
+        assert positions == sorted(positions), stream_name
+    assert dispatcher.completed_positions() == list(range(1, 41))
+    dispatcher.shutdown()
+
+
+def test_completed_positions_wait_for_the_low_watermark() -> None:
+    release = threading.Event()
+
+    def handler(msg: ReadMessage) -> None:
+        if msg.global_position == 1:
+            release.wait(1)
+
+    dispatcher = ConcurrentDispatcher(handler, workers=2, partition_by=lambda msg: msg.id)
+    dispatcher.submit(message(1, "order-1"))
+    dispatcher.submit(message(2, "order-2"))
+    time.sleep(0.05)
+
+    assert dispatcher.completed_positions() == []
+    release.set()
+    dispatcher.join()
+    assert dispatcher.completed_positions() == [1, 2]
+    dispatcher.shutdown()
+
+
+def test_handler_failure_stops_dispatch_and_is_reraised() -> None:
+    def handler(msg: ReadMessage) -> None:
+        if msg.global_position == 2:
+            raise RuntimeError("boom")
+
+    dispatcher = ConcurrentDispatcher(handler, workers=1)
+    dispatcher.submit(message(1, "order-1"))
+    dispatcher.submit(message(2, "order-1"))
+    dispatcher.join()
+
+    assert not dispatcher.submit(message(3, "order-1"))
+    assert dispatcher.completed_positions() == [1]
+    with pytest.raises(RuntimeError):
+        dispatcher.raise_failure()
+    assert dispatcher.submit(message(3, "order-1"))
+    dispatcher.join()
+    dispatcher.shutdown()
@@ -0,0 +1,114 @@
+import threading
+from dataclasses import dataclass, field
+
+import pytest
+
+from eventide_python.entity_store import EntityCache
+from eventide_python.sizing import approximate_size
+
+
+@dataclass
+class Account:
+    balance: int = 0
+    history: list[int] = field(default_factory=list)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_unbounded_cache_keeps_every_record() -> None:
+    cache: EntityCache[Account] = EntityCache()
+    for index in range(100):
+        cache.put(str(index), Account(), index)
+
+    assert len(cache) == 100
+    assert cache.get("0") is not None
+    assert cache.stats().bytes == 0
+
+
+def test_max_entries_evicts_least_recently_used() -> None:
+    cache: EntityCache[Account] = EntityCache(max_entries=2)
+    cache.put("a", Account(), 0)
+    cache.put("b", Account(), 0)
+    cache.get("a")
+    cache.put("c", Account(), 0)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    stats = cache.stats()
+    assert (stats.entries, stats.evictions, stats.hits, stats.misses) == (2, 1, 3, 1)
+
+
+def test_max_bytes_evicts_until_under_budget() -> None:
+    size = approximate_size(Account(history=list(range(1000))))
+    cache: EntityCache[Account] = EntityCache(max_bytes=size * 3 // 2)
+    cache.put("a", Account(history=list(range(1000))), 0)
+    cache.put("b", Account(history=list(range(1000))), 0)
+
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert cache.stats().bytes == size
+
+    cache.delete("b")
+    assert cache.stats().bytes == 0
+
+
+def test_ttl_and_idle_expiry() -> None:
+    clock = FakeClock()
+    cache: EntityCache[Account] = EntityCache(ttl=10.0, idle_ttl=3.0, clock=clock)
+    cache.put("a", Account(), 0)
+    cache.put("b", Account(), 0)
+
+    clock.now = 2.0
+    assert cache.get("a") is not None
+    clock.now = 4.0
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+    clock.now = 6.0
+    cache.put("a", Account(), 1)
+    clock.now = 10.0
+    assert cache.get("a") is None
+    assert cache.stats().expirations == 2
+
+
+def test_expired_records_are_dropped_from_the_lru_end_on_put() -> None:
+    clock = FakeClock()
+    cache: EntityCache[Account] = EntityCache(idle_ttl=1.0, clock=clock)
+    cache.put("a", Account(), 0)
+    clock.now = 2.0
+    cache.put("b", Account(), 0)
+
+    assert len(cache) == 1
+
+
+def test_concurrent_puts_respect_max_entries() -> None:
+    cache: EntityCache[Account] = EntityCache(max_entries=50, max_bytes=1_000_000)
+
+    def work(offset: int) -> None:
+        for index in range(500):
+            cache.put(f"{offset}-{index}", Account(balance=index), index)
+            cache.get(f"{offset}-{index // 2}")
+
+    threads = [threading.Thread(target=work, args=(offset,)) for offset in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert stats.entries == 50
+    assert stats.evictions == 2000 - 50
+
+
+def test_policies_are_validated() -> None:
+    with pytest.raises(ValueError):
+        EntityCache(max_entries=0)
+    with pytest.raises(ValueError):
+        EntityCache(ttl=0)
@@ -1,7 +1,16 @@
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
+import pytest
+
+from eventide_python.entity_snapshot import SnapshotStore
 from eventide_python.entity_store import EntityStore
 from eventide_python.entity_store.projection import EntityProjection
+from eventide_python.entity_store.store import EntityStoreError
+from eventide_python.message_db import InMemoryMessageDBClient, SqlConditionError, type_condition
 from eventide_python.message_db.message_data import ReadMessage
 
 
@@ -76,3 +85,300 @@ def test_fetch_returns_new_entity_when_empty() -> None:
 
     entity = store.fetch("missing")
     assert entity.value == 0
+
+
+class TypeFilteringMessageDBClient(InMemoryMessageDBClient):
+    """Evaluates conditions built by type_condition, like a server with sql_condition on."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.conditions: list[str | None] = []
+
+    def get_stream_messages(self, stream_name, position=None, batch_size=None, condition=None):
+        self.conditions.append(condition)
+        messages = super().get_stream_messages(stream_name, position, batch_size=-1)
+        if condition is not None:
+            types = set(re.findall(r"'([^']*)'", condition))
+            messages = [message for message in messages if message.type in types]
+        return messages[:batch_size] if batch_size is not None else messages[:1000]
+
+
+def test_type_filtering_reads_handled_types_and_keeps_stream_version() -> None:
+    client = TypeFilteringMessageDBClient()
+    client.write(
+        [
+            {"type": "Incremented", "data": {"amount": 2}},
+            {"type": "Renamed", "data": {"name": "a"}},
+            {"type": "Incremented", "data": {"amount": 5}},
+            {"type": "Renamed", "data": {"name": "b"}},
+        ],
+        "counter-123",
+    )
+    store = EntityStore(
+        message_db=client,
+        category="counter",
+        projection=CounterProjection,
+        entity_factory=Counter,
+        filter_types=True,
+    )
+
+    entity, version = store.get("123", include="version")
+
+    assert entity.value == 7
+    assert version == 3
+    assert client.conditions == [type_condition(CounterProjection._handlers)]
+
+    client.write({"type": "Renamed", "data": {"name": "c"}}, "counter-123")
+    entity, version = store.get("123", include="version")
+    assert entity.value == 7
+    assert version == 4
+
+    client.conditions.clear()
+    assert store.get_version("123") == 4
+    assert client.conditions == []
+
+
+def test_type_filtering_explains_disabled_sql_conditions() -> None:
+    client = InMemoryMessageDBClient()
+    client.write({"type": "Incremented", "data": {"amount": 2}}, "counter-123")
+    store = EntityStore(
+        message_db=client,
+        category="counter",
+        projection=CounterProjection,
+        entity_factory=Counter,
+        filter_types=True,
+    )
+
+    with pytest.raises(SqlConditionError, match="sql_condition"):
+        store.get("123")
+
+
+def write_increments(client: InMemoryMessageDBClient, count: int) -> None:
+    client.write(
+        [{"type": "Incremented", "data": {"amount": 1}} for _ in range(count)], "counter-123"
+    )
+
+
+def test_snapshots_are_written_every_interval_and_loaded_on_cache_miss() -> None:
+    client = InMemoryMessageDBClient()
+    snapshots = SnapshotStore(message_db=client, entity_class=Counter)
+    write_increments(client, 10)
+
+    def new_store() -> EntityStore[Counter]:
+        return EntityStore(
+            message_db=client,
+            category="counter",
+            projection=CounterProjection,
+            entity_factory=Counter,
+            snapshot_store=snapshots,
+            snapshot_interval=5,
+        )
+
+    store = new_store()
+    record = store.get("123", include="record")
+    assert (record.version, record.persisted_version) == (9, 9)
+    assert record.persisted_time is not None
+    assert snapshots.get("123")[1:2] == (9,)
+
+    write_increments(client, 2)
+    replayed: list[int] = []
+    cold_store = new_store()
+    record = cold_store.get(
+        "123", include="record", probe_action=lambda m: replayed.append(m.position)
+    )
+    assert replayed == [10, 11]
+    assert (record.entity.value, record.version, record.persisted_version) == (12, 11, 9)
+
+    write_increments(client, 3)
+    record = cold_store.get("123", include="record")
+    assert (record.entity.value, record.version, record.persisted_version) == (15, 14, 14)
+    assert client.stream_version(snapshots.snapshot_stream_name("123")) == 1
+
+
+def test_snapshot_store_and_interval_are_declared_together() -> None:
+    client = InMemoryMessageDBClient()
+    with pytest.raises(EntityStoreError):
+        EntityStore(
+            message_db=client,
+            category="counter",
+            projection=CounterProjection,
+            entity_factory=Counter,
+            snapshot_interval=5,
+        )
+
+
+class BulkReadCountingClient(InMemoryMessageDBClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.bulk_reads: list[dict] = []
+
+    def get_many_stream_messages(self, streams, batch_size=None, condition=None):
+        self.bulk_reads.append(dict(streams))
+        return super().get_many_stream_messages(streams, batch_size, condition)
+
+
+def test_get_many_hydrates_all_entities_with_one_bulk_read() -> None:
+    client = BulkReadCountingClient()
+    for index in range(3):
+        client.write(
+            [{"type": "Incremented", "data": {"amount": index + 1}}] * (index + 1),
+            f"counter-{index}",
+        )
+    store = EntityStore(
+        message_db=client,
+        category="counter",
+        projection=CounterProjection,
+        entity_factory=Counter,
+    )
+    store.get("1")
+    client.write({"type": "Incremented", "data": {"amount": 10}}, "counter-1")
+
+    results = store.get_many(["2", "missing", "1", "0", "2"], include="version")
+
+    assert [(entity and entity.value, version) for entity, version in results] == [
+        (9, 2),
+        (None, None),
+        (14, 2),
+        (1, 0),
+        (9, 2),
+    ]
+    assert client.bulk_reads == [
+        {"counter-2": None, "counter-missing": None, "counter-1": 2, "counter-0": None}
+    ]
+
+
+class BlockingClient(InMemoryMessageDBClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+        self.reading = threading.Semaphore(0)
+        self.stream_reads: list[str] = []
+        self.fail = False
+
+    def iter_stream_messages(self, stream_name, *args, **kwargs):
+        self.stream_reads.append(stream_name)
+        self.reading.release()
+        assert self.release.wait(2)
+        if self.fail:
+            raise RuntimeError("read failed")
+        return super().iter_stream_messages(stream_name, *args, **kwargs)
+
+
+def thread_safe_store(client: InMemoryMessageDBClient) -> EntityStore[Counter]:
+    return EntityStore(
+        message_db=client,
+        category="counter",
+        projection=CounterProjection,
+        entity_factory=Counter,
+        thread_safe=True,
+    )
+
+
+def test_concurrent_gets_for_one_id_share_a_single_read() -> None:
+    client = BlockingClient()
+    write_increments(client, 3)
+    store = thread_safe_store(client)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(store.get, "123") for _ in range(8)]
+        assert client.reading.acquire(timeout=2)
+        time.sleep(0.05)
+        client.release.set()
+        entities = [future.result() for future in futures]
+
+    assert client.stream_reads == ["counter-123"]
+    assert all(entity is entities[0] for entity in entities)
+    assert entities[0].value == 3
+
+
+def test_different_ids_hydrate_in_parallel() -> None:
+    client = BlockingClient()
+    store = thread_safe_store(client)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(store.get, entity_id) for entity_id in ("1", "2")]
+        assert client.reading.acquire(timeout=2)
+        assert client.reading.acquire(timeout=2)
+        client.release.set()
+        for future in futures:
+            future.result()
+
+    assert sorted(client.stream_reads) == ["counter-1", "counter-2"]
+
+
+def test_failed_read_is_raised_in_every_waiting_thread() -> None:
+    client = BlockingClient()
+    client.fail = True
+    store = thread_safe_store(client)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(store.get, "123") for _ in range(3)]
+        assert client.reading.acquire(timeout=2)
+        time.sleep(0.05)
+        client.release.set()
+        for future in futures:
+            with pytest.raises(RuntimeError):
+                future.result()
+
+    client.fail = False
+    assert store.get("123") is None
+
+
+def test_thread_safe_store_projects_onto_a_copy_of_the_cached_entity() -> None:
+    client = InMemoryMessageDBClient()
+    write_increments(client, 2)
+    store = thread_safe_store(client)
+
+    first = store.get("123", include="record")
+    assert store.get("123", include="record").entity is first.entity
+
+    write_increments(client, 1)
+    second = store.get("123", include="record")
+
+    assert (first.entity.value, first.version) == (2, 1)
+    assert (second.entity.value, second.version) == (3, 2)
+    assert store.get_many(["123"])[0] is second.entity
+
+
+class RoundTripCountingClient(InMemoryMessageDBClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.round_trips: list[str] = []
+
+    def get_last_stream_message(self, stream_name, type=None):
+        self.round_trips.append("get_last_stream_message")
+        return super().get_last_stream_message(stream_name, type)
+
+    def get_many_last_stream_messages(self, stream_names, type=None):
+        self.round_trips.append("get_many_last_stream_messages")
+        return {
+            name: super(RoundTripCountingClient, self).get_last_stream_message(name, type)
+            for name in stream_names
+        }
+
+    def get_many_stream_messages(self, streams, batch_size=None, condition=None):
+        self.round_trips.append("get_many_stream_messages")
+        return super().get_many_stream_messages(streams, batch_size, condition)
+
+
+def test_get_many_reads_snapshots_of_cold_entities_together() -> None:
+    client = RoundTripCountingClient()
+    snapshots = SnapshotStore(message_db=client, entity_class=Counter)
+    for index in range(10):
+        client.write([{"type": "Incremented", "data": {"amount": 1}}] * 3, f"counter-{index}")
+        if index % 2:
+            snapshots.put(str(index), Counter(value=2), 1, None)
+    store = EntityStore(
+        message_db=client,
+        category="counter",
+        projection=CounterProjection,
+        entity_factory=Counter,
+        snapshot_store=snapshots,
+        snapshot_interval=1000,
+    )
+    client.round_trips.clear()
+
+    results = store.get_many([str(index) for index in range(10)], include="version")
+
+    assert [(entity.value, version) for entity, version in results] == [(3, 2)] * 10
+    assert client.round_trips == ["get_many_last_stream_messages", "get_many_stream_messages"]
@@ -0,0 +1,196 @@
+import hashlib
+import uuid
+from datetime import datetime
+
+import pytest
+
+from eventide_python.consumer import Consumer, InMemoryPositionStore
+from eventide_python.message_db import (
+    AdaptiveBatchSize,
+    CategoryError,
+    ConsumerGroupError,
+    InMemoryMessageDBClient,
+    SqlConditionError,
+    WrongExpectedVersion,
+)
+from eventide_python.message_db.in_memory import hash_64
+
+
+def test_write_assigns_stream_and_global_positions() -> None:
+    client = InMemoryMessageDBClient(clock=lambda: datetime(2024, 1, 1))
+
+    assert client.write({"type": "Opened", "data": {"a": 1}}, "account-1") == 0
+    assert client.write([{"type": "Deposited"}, {"type": "Withdrawn"}], "account-1") == 2
+    assert client.write({"type": "Opened"}, "account-2") == 0
+
+    messages = client.get_stream_messages("account-1")
+    assert [(m.position, m.global_position) for m in messages] == [(0, 1), (1, 2), (2, 3)]
+    assert messages[0].data == {"a": 1}
+    assert messages[0].time == datetime(2024, 1, 1)
+    assert client.stream_version("account-1") == 2
+    assert client.stream_version("account-3") is None
+
+
+def test_expected_version_is_enforced_per_message() -> None:
+    client = InMemoryMessageDBClient()
+
+    client.write([{"type": "A"}, {"type": "B"}], "account-1", expected_version="no_stream")
+    with pytest.raises(WrongExpectedVersion):
+        client.write({"type": "C"}, "account-1", expected_version=0)
+    assert client.write({"type": "C"}, "account-1", expected_version=1) == 2
+
+
+def test_write_many_is_all_or_nothing() -> None:
+    client = InMemoryMessageDBClient()
+    client.write({"type": "Opened"}, "account-1")
+
+    with pytest.raises(WrongExpectedVersion):
+        client.write_many(
+            [("account-2", {"type": "Opened"}, None), ("account-1", {"type": "X"}, 5)]
+        )
+
+    assert client.get_stream_messages("account-2") == []
+    assert client.write_many(
+        [("account-2", {"type": "Opened"}, -1), ("account-1", [{"type": "X"}], 0)]
+    ) == {"account-2": 0, "account-1": 1}
+
+
+def test_category_reads_start_at_global_position() -> None:
+    client = InMemoryMessageDBClient()
+    for index in range(5):
+        client.write({"type": "Tested"}, f"order-{index}")
+        client.write({"type": "Tested"}, f"other-{index}")
+
+    messages = client.get_category_messages("order", position=4, batch_size=2)
+
+    assert [m.global_position for m in messages] == [5, 7]
+    assert [m.global_position for m in client.iter_category_messages("order", batch_size=2)] == [
+        1,
+        3,
+        5,
+        7,
+        9,
+    ]
+
+
+def test_consumer_groups_partition_by_cardinal_id_hash() -> None:
+    client = InMemoryMessageDBClient()
+    for index in range(20):
+        client.write({"type": "Tested"}, f"order-{index}")
+        client.write({"type": "Tested"}, f"order-{index}+extra")
+
+    members = [
+        client.get_category_messages("order", consumer_group_member=m, consumer_group_size=3)
+        for m in range(3)
+    ]
+
+    assert sorted(m.global_position for group in members for m in group) == list(range(1, 41))
+    for member, group in enumerate(members):
+        for message in group:
+            cardinal_id = message.stream_name.split("-", 1)[1].split("+")[0]
+            assert abs(hash_64(cardinal_id)) % 3 == member
+
+
+def test_hash_64_matches_message_store_definition() -> None:
+    digest = hashlib.md5(b"abc").hexdigest()
+    expected = int(digest[:16], 16)
+    assert hash_64("abc") == (expected - 2**64 if expected >= 2**63 else expected)
+    assert hash_64("abc") < 0
+
+
+def test_correlation_filters_on_correlation_stream_category() -> None:
+    client = InMemoryMessageDBClient()
+    client.write({"type": "A", "metadata": {"correlationStreamName": "thing-1"}}, "order-1")
+    client.write({"type": "B", "metadata": {"correlationStreamName": "other-1"}}, "order-1")
+    client.write({"type": "C"}, "order-2")
+
+    messages = client.get_category_messages("order", correlation="thing")
+
+    assert [m.type for m in messages] == ["A"]
+    with pytest.raises(CategoryError):
+        client.get_category_messages("order", correlation="thing-1")
+
+
+def test_argument_errors_match_message_db() -> None:
+    client = InMemoryMessageDBClient()
+
+    with pytest.raises(CategoryError):
+        client.get_stream_messages("order")
+    with pytest.raises(CategoryError):
+        client.get_category_messages("order-1")
+    with pytest.raises(ConsumerGroupError):
+        client.get_category_messages("order", consumer_group_member=0)
+    with pytest.raises(ConsumerGroupError):
+        client.get_category_messages("order", consumer_group_member=2, consumer_group_size=2)
+    with pytest.raises(SqlConditionError):
+        client.get_stream_messages("order-1", condition="type = 'A'")
+
+
+def test_last_stream_message_can_filter_by_type() -> None:
+    client = InMemoryMessageDBClient()
+    client.write([{"type": "A"}, {"type": "B"}, {"type": "A"}, {"type": "C"}], "order-1")
+
+    assert client.get_last_stream_message("order-1").position == 3
+    assert client.get_last_stream_message("order-1", "A").position == 2
+    assert client.get_last_stream_message("order-1", "D") is None
+    assert client.get_last_stream_message("order-2") is None
+
+
+def test_consumer_runs_against_in_memory_client() -> None:
+    client = InMemoryMessageDBClient()
+    client.write([{"type": "Tested"}] * 3, "order-1")
+    handled = []
+    consumer = Consumer(
+        name="order-consumer",
+        category="order",
+        message_db=client,
+        handler=lambda message: handled.append(message.position),
+        position_store=InMemoryPositionStore(),
+    )
+
+    assert consumer.run_once() == 3
+    assert handled == [0, 1, 2]
+
+
+def test_iterators_accept_adaptive_batch_sizing() -> None:
+    client = InMemoryMessageDBClient()
+    for index in range(30):
+        client.write({"type": "Deposited", "data": {"index": index}}, f"account-{index % 3}")
+    sizing = AdaptiveBatchSize(initial=4, minimum=4, maximum=16)
+
+    messages = list(client.iter_category_messages("account", batch_sizing=sizing))
+
+    assert [message.global_position for message in messages] == list(range(1, 31))
+    assert sizing.current > 4
+    assert len(list(client.iter_stream_messages("account-1", batch_sizing=sizing))) == 10
+
+
+def test_stored_messages_are_detached_from_written_dictionaries() -> None:
+    client = InMemoryMessageDBClient()
+    data = {"items": [1, 2]}
+    metadata = {"causationMessageStreamName": "order-1"}
+    client.write({"type": "Placed", "data": data, "metadata": metadata}, "order-1")
+
+    data["items"].append(3)
+    metadata["causationMessageStreamName"] = "order-2"
+
+    message = client.get_stream_messages("order-1")[0]
+    assert message.data == {"items": [1, 2]}
+    assert message.metadata == {"causationMessageStreamName": "order-1"}
+
+
+def test_non_json_values_are_stored_as_postgres_would_return_them() -> None:
+    client = InMemoryMessageDBClient()
+    order_id = uuid.UUID("12345678-1234-5678-1234-567812345678")
+    client.write(
+        {"type": "Placed", "data": {"id": order_id, "at": datetime(2024, 1, 2, 3, 4, 5)}},
+        "order-1",
+    )
+
+    assert client.get_stream_messages("order-1")[0].data == {
+        "id": "12345678-1234-5678-1234-567812345678",
+        "at": "2024-01-02T03:04:05",
+    }
+    with pytest.raises(TypeError):
+        client.write({"type": "Placed", "data": {"value": object()}}, "order-2")
+    assert client.stream_version("order-2") is None
@@ -0,0 +1,140 @@
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import psycopg
+import pytest
+
+from eventide_python.message_db import (
+    MessageDBError,
+    MetricsCollector,
+    PostgresMessageDBClient,
+    WrongExpectedVersion,
+    postgres,
+)
+from eventide_python.message_db.codec import StdlibJsonCodec
+from eventide_python.message_db.instrumentation import OperationEvent, OperationScope
+from eventide_python.message_db.message_data import WriteMessage
+from eventide_python.message_db.params import write_params
+
+
+class RecordingInstrumentation:
+    def __init__(self) -> None:
+        self.events: list[OperationEvent] = []
+
+    def record(self, event: OperationEvent) -> None:
+        self.events.append(event)
+
+
+def test_scope_reports_timings_and_mapped_error_class() -> None:
+    instrumentation = RecordingInstrumentation()
+
+    with pytest.raises(WrongExpectedVersion):
+        with OperationScope(instrumentation, "write", "account-1") as scope:
+            scope.acquired()
+            scope.rows = 2
+            raise WrongExpectedVersion("Wrong expected version")
+
+    [event] = instrumentation.events
+    assert (event.operation, event.target, event.rows) == ("write", "account-1", 2)
+    assert event.error == "WrongExpectedVersion"
+    assert 0 <= event.acquire_duration <= event.duration
+
+
+def test_collector_aggregates_by_operation_and_category() -> None:
+    collector = MetricsCollector()
+    for stream_name in ("account-1", "account-2"):
+        collector.record(OperationEvent("get_stream_messages", stream_name, 0.002, 0.0001, 3, 90))
+    collector.record(
+        OperationEvent("write", "account-1", 0.004, 0.0001, 1, 30, error="WrongExpectedVersion")
+    )
+
+    labels = (("operation", "get_stream_messages"), ("target", "account"))
+    assert collector.rows.value(labels) == 6
+    assert collector.payload_bytes.value(labels) == 180
+    assert collector.duration.count((("operation", "get_stream_messages"),)) == 2
+
+    text = collector.render()
+    assert (
+        'eventide_message_db_operations_total{operation="write",target="account",'
+        'outcome="WrongExpectedVersion"} 1'
+    ) in text
+    bucket = "eventide_message_db_operation_seconds_bucket"
+    assert f'{bucket}{{operation="get_stream_messages",le="0.0025"}} 2' in text
+    assert 'eventide_message_db_operation_seconds_count{operation="write"} 1' in text
+
+
+def test_write_payload_bytes_count_encoded_data_and_metadata() -> None:
+    message = WriteMessage(id="1", type="A", data={"a": "é"}, metadata={"b": 1})
+    params = write_params([message], "account-1", None, StdlibJsonCodec())
+
+    assert postgres._params_payload_bytes(params) == len('{"a":"é"}'.encode()) + len('{"b":1}')
+
+
+def test_client_reports_stream_reads(monkeypatch) -> None:
+    rows = [b'{"a":1}', b'{"b":2}']
+
+    class FakeCursor:
+        description = [SimpleNamespace(name=name) for name in ("id", "data", "metadata")]
+        pgresult = SimpleNamespace(
+            ntuples=2, get_value=lambda row, column: None if column == 2 else rows[row]
+        )
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return None
+
+        def execute(self, query, params, prepare=None, binary=False):
+            return self
+
+        def fetchall(self):
+            return ["message-1", "message-2"]
+
+    @contextmanager
+    def fake_connection(pool, dsn, kwargs):
+        yield SimpleNamespace(cursor=lambda row_factory: FakeCursor())
+
+    monkeypatch.setattr(postgres, "_pooled_or_new", fake_connection)
+    instrumentation = RecordingInstrumentation()
+    client = PostgresMessageDBClient("unused", instrumentation=instrumentation)
+
+    assert client.get_stream_messages("account-1") == ["message-1", "message-2"]
+
+    [event] = instrumentation.events
+    assert (event.operation, event.target) == ("get_stream_messages", "account-1")
+    assert (event.rows, event.payload_bytes, event.error) == (2, 14, None)
+
+
+def test_connection_failures_are_mapped_and_reported(monkeypatch) -> None:
+    def refuse(dsn, **kwargs):
+        raise psycopg.OperationalError("connection refused")
+
+    monkeypatch.setattr(postgres.psycopg, "connect", refuse)
+    instrumentation = RecordingInstrumentation()
+    client = PostgresMessageDBClient("unused", instrumentation=instrumentation)
+
+    with pytest.raises(MessageDBError, match="connection refused") as raised:
+        client.get_stream_messages("account-1")
+
+    assert not isinstance(raised.value, psycopg.Error)
+    [event] = instrumentation.events
+    assert (event.operation, event.error) == ("get_stream_messages", "MessageDBError")
+
+
+def test_pool_checkout_timeouts_are_mapped_and_reported() -> None:
+    pool = pytest.importorskip("psycopg_pool")
+
+    class ExhaustedPool:
+        def connection(self):
+            raise pool.PoolTimeout("couldn't get a connection after 30.00 sec")
+
+    instrumentation = RecordingInstrumentation()
+    client = PostgresMessageDBClient("unused", instrumentation=instrumentation)
+    client._pool = ExhaustedPool()
+
+    with pytest.raises(MessageDBError, match="couldn't get a connection"):
+        client.write({"type": "Opened", "data": {}}, "account-1")
+
+    [event] = instrumentation.events
+    assert (event.operation, event.error) == ("write", "MessageDBError")
@@ -0,0 +1,133 @@
+from eventide_python.message_db import CachingMessageDBClient
+from eventide_python.message_db.batch_sizing import AdaptiveBatchSize
+from eventide_python.message_db.message_data import LazyReadMessage, ReadMessage
+from eventide_python.sizing import approximate_size
+
+
+class CountingClient:
+    def __init__(self, streams: dict[str, list[ReadMessage]]) -> None:
+        self.streams = streams
+        self.reads: list[tuple[str, int, int]] = []
+
+    def get_stream_messages(self, stream_name, position=None, batch_size=None, condition=None):
+        self.reads.append((stream_name, position, batch_size))
+        messages = [m for m in self.streams.get(stream_name, []) if m.position >= position]
+        return messages if batch_size < 1 else messages[:batch_size]
+
+
+def make_stream(stream_name: str, count: int) -> list[ReadMessage]:
+    return [
+        ReadMessage(
+            id=str(p),
+            type="Incremented",
+            stream_name=stream_name,
+            position=p,
+            global_position=p + 1,
+            data={"amount": p},
+        )
+        for p in range(count)
+    ]
+
+
+def test_cached_prefix_is_served_and_only_the_tail_is_fetched() -> None:
+    client = CountingClient({"counter-1": make_stream("counter-1", 3)})
+    cache = CachingMessageDBClient(client)
+
+    assert [m.position for m in cache.get_stream_messages("counter-1")] == [0, 1, 2]
+    client.streams["counter-1"] = make_stream("counter-1", 5)
+
+    assert [m.position for m in cache.get_stream_messages("counter-1")] == [0, 1, 2, 3, 4]
+    assert client.reads == [("counter-1", 0, 1000), ("counter-1", 3, 997)]
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.streams) == (3, 5, 1)
+    assert stats.bytes > 0
+
+
+def test_full_batch_from_cache_does_not_read_the_database() -> None:
+    client = CountingClient({"counter-1": make_stream("counter-1", 10)})
+    cache = CachingMessageDBClient(client)
+    list(cache.iter_stream_messages("counter-1", batch_size=4))
+    client.reads.clear()
+
+    messages = cache.get_stream_messages("counter-1", position=2, batch_size=4)
+
+    assert [m.position for m in messages] == [2, 3, 4, 5]
+    assert client.reads == []
+
+
+def test_condition_reads_bypass_the_cache() -> None:
+    client = CountingClient({"counter-1": make_stream("counter-1", 2)})
+    cache = CachingMessageDBClient(client)
+
+    cache.get_stream_messages("counter-1", position=0, batch_size=10, condition="position > 0")
+
+    assert cache.stats().streams == 0
+
+
+def test_least_recently_used_streams_are_evicted_over_max_bytes() -> None:
+    streams = {f"counter-{i}": make_stream(f"counter-{i}", 2) for i in range(3)}
+    stream_size = sum(approximate_size(m) for m in streams["counter-0"])
+    cache = CachingMessageDBClient(CountingClient(streams), max_bytes=stream_size * 2 + 100)
+
+    cache.get_stream_messages("counter-0")
+    cache.get_stream_messages("counter-1")
+    cache.get_stream_messages("counter-0", position=2)
+    cache.get_stream_messages("counter-2")
+
+    stats = cache.stats()
+    assert stats.streams == 2
+    assert stats.evictions == 1
+    assert stats.bytes <= stats.max_bytes
+    cache.get_stream_messages("counter-0")
+    assert cache.stats().hits == 2
+
+
+def test_approximate_size_does_not_decode_lazy_messages() -> None:
+    decoded = []
+
+    def decode(value):
+        decoded.append(value)
+        return {}
+
+    message = LazyReadMessage(id="1", type="Tested", raw_data='{"a": 1}', decode=decode)
+
+    assert approximate_size(message) > approximate_size('{"a": 1}')
+    assert decoded == []
+
+
+def test_earlier_read_extends_the_cached_range_backwards() -> None:
+    client = CountingClient({"counter-1": make_stream("counter-1", 5)})
+    cache = CachingMessageDBClient(client)
+
+    cache.get_stream_messages("counter-1", position=2)
+    assert [m.position for m in cache.get_stream_messages("counter-1")] == [0, 1, 2, 3, 4]
+    misses = cache.stats().misses
+
+    assert [m.position for m in cache.get_stream_messages("counter-1")] == [0, 1, 2, 3, 4]
+    stats = cache.stats()
+    assert (stats.misses, stats.hits) == (misses, 5)
+    assert stats.bytes == sum(approximate_size(m) for m in make_stream("counter-1", 5))
+
+
+def test_disjoint_read_replaces_the_cached_range() -> None:
+    client = CountingClient({"counter-1": make_stream("counter-1", 10)})
+    cache = CachingMessageDBClient(client)
+
+    cache.get_stream_messages("counter-1", position=0, batch_size=2)
+    cache.get_stream_messages("counter-1", position=6, batch_size=2)
+    cache.get_stream_messages("counter-1", position=6, batch_size=2)
+
+    assert cache.stats().hits == 2
+    assert len(client.reads) == 2
+
+
+def test_stream_iterator_reads_pages_of_the_adaptive_size() -> None:
+    backing = CountingClient({"account-1": make_stream("account-1", 25)})
+    client = CachingMessageDBClient(backing)
+    sizing = AdaptiveBatchSize(initial=10, minimum=10, maximum=10)
+
+    messages = list(client.iter_stream_messages("account-1", batch_sizing=sizing))
+
+    assert [m.position for m in messages] == list(range(25))
+    assert [batch_size for _, _, batch_size in backing.reads] == [10, 10, 10]
@@ -1,7 +1,14 @@
+import dataclasses
+import json
+import pickle
 from datetime import datetime
 
-from eventide_python.message_db.message_data import ReadMessage, WriteMessage
-from eventide_python.message_db.serialization import to_read_message, to_write_message
+from eventide_python.message_db.message_data import LazyReadMessage, ReadMessage, WriteMessage
+from eventide_python.message_db.serialization import (
+    read_message_row_factory,
+    to_read_message,
+    to_write_message,
+)
 
 
 def test_to_write_message() -> None:
@@ -31,3 +38,113 @@ def test_to_read_message() -> None:
         metadata={"b": 2},
         time=datetime(2024, 1, 1, 0, 0, 0),
     )
+
+
+def test_to_write_message_assigns_missing_id() -> None:
+    msg = to_write_message({"type": "Test"}, id_factory=lambda: "generated")
+    assert msg.id == "generated"
+
+    msg = to_write_message({"id": "given", "type": "Test"}, id_factory=lambda: "generated")
+    assert msg.id == "given"
+
+
+def test_lazy_read_message_decodes_on_first_access() -> None:
+    decoded = []
+
+    def decode(value):
+        decoded.append(value)
+        return json.loads(value)
+
+    row = {
+        "id": "123",
+        "stream_name": "stream-1",
+        "type": "Test",
+        "position": 0,
+        "global_position": 1,
+        "data": '{"a": 1}',
+        "metadata": None,
+        "time": None,
+    }
+    msg = LazyReadMessage(
+        id=row["id"],
+        stream_name=row["stream_name"],
+        type=row["type"],
+        raw_data=row["data"],
+        decode=decode,
+    )
+
+    assert msg.type == "Test"
+    assert decoded == []
+    assert msg.data == {"a": 1}
+    assert msg.data == {"a": 1}
+    assert msg.metadata is None
+    assert decoded == ['{"a": 1}']
+
+
+def test_lazy_read_message_behaves_like_read_message() -> None:
+    row = {
+        "id": "123",
+        "stream_name": "stream-1",
+        "type": "Test",
+        "position": 0,
+        "global_position": 1,
+        "data": '{"a": 1}',
+        "metadata": '{"b": 2}',
+        "time": datetime(2024, 1, 1, 0, 0, 0),
+    }
+    lazy = to_read_message(row, lazy=True)
+    eager = to_read_message(row)
+
+    assert isinstance(lazy, ReadMessage)
+    assert lazy == eager
+    assert eager == lazy
+    assert lazy.raw_data == '{"a": 1}'
+    assert pickle.loads(pickle.dumps(lazy)) == eager
+    assert dataclasses.replace(lazy, position=5).position == 5
+
+
+class FakeColumn:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class FakeCursor:
+    description = [
+        FakeColumn(name)
+        for name in (
+            "id",
+            "stream_name",
+            "type",
+            "position",
+            "global_position",
+            "data",
+            "metadata",
+            "time",
+        )
+    ]
+
+
+def test_row_factory_builds_read_messages_from_tuples() -> None:
+    make_row = read_message_row_factory()(FakeCursor())
+    values = ("123", "stream-1", "Test", 0, 1, '{"a": 1}', None, datetime(2024, 1, 1))
+
+    first = make_row(values)
+    second = make_row(("124", "".join(["stream", "-1"]), "Test", 1, 2, None, None, None))
+
+    assert first == ReadMessage(
+        id="123",
+        stream_name="stream-1",
+        type="Test",
+        position=0,
+        global_position=1,
+        data={"a": 1},
+        metadata=None,
+        time=datetime(2024, 1, 1),
+    )
+    assert second.stream_name is first.stream_name
+    assert isinstance(read_message_row_factory(lazy=True)(FakeCursor())(values), LazyReadMessage)
+
+
+def test_read_message_has_no_instance_dict() -> None:
+    message = ReadMessage(id="1", type="Test")
+    assert not hasattr(message, "__dict__")
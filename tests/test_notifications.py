@@ -0,0 +1,32 @@
+from eventide_python.message_db.notifications import CategorySignal, PostgresNotificationListener
+
+
+def test_signal_wait_consumes_notification() -> None:
+    signal = CategorySignal(("order",))
+    signal.notify()
+
+    assert signal.wait(0) is True
+    assert signal.wait(0) is False
+
+
+def test_listener_dispatches_by_category() -> None:
+    listener = PostgresNotificationListener("postgresql://unused")
+    orders = listener.subscribe("order")
+    everything = listener.subscribe("order", "account")
+    accounts = listener.subscribe("account")
+
+    listener.dispatch("order")
+
+    assert orders.wait(0) is True
+    assert everything.wait(0) is True
+    assert accounts.wait(0) is False
+
+
+def test_unsubscribed_signal_is_not_notified() -> None:
+    listener = PostgresNotificationListener("postgresql://unused")
+    signal = listener.subscribe("order")
+    listener.unsubscribe(signal)
+
+    listener.dispatch("order")
+
+    assert signal.wait(0) is False
@@ -0,0 +1,27 @@
+import pytest
+
+from eventide_python.message_db.pool import PoolConfig, PoolStats
+
+
+def test_pool_config_rejects_max_below_min() -> None:
+    with pytest.raises(ValueError):
+        PoolConfig(min_size=4, max_size=2)
+
+
+def test_pool_stats_from_psycopg() -> None:
+    stats = PoolStats.from_psycopg(
+        {
+            "pool_min": 1,
+            "pool_max": 4,
+            "pool_size": 4,
+            "pool_available": 1,
+            "requests_waiting": 2,
+            "requests_num": 10,
+            "requests_queued": 4,
+            "requests_wait_ms": 20,
+        }
+    )
+
+    assert stats.in_use == 3
+    assert stats.saturation == 0.75
+    assert stats.average_wait_ms == 5.0
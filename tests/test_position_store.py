@@ -0,0 +1,85 @@
+from eventide_python.consumer import MessageDBPositionStore, PostgresPositionStore
+from eventide_python.message_db import InMemoryMessageDBClient
+
+
+class CountingClient(InMemoryMessageDBClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.last_message_reads = 0
+
+    def get_last_stream_message(self, stream_name, type=None):
+        self.last_message_reads += 1
+        return super().get_last_stream_message(stream_name, type)
+
+
+def test_message_db_position_store_records_position_stream() -> None:
+    client = CountingClient()
+    store = MessageDBPositionStore(message_db=client, category="account")
+
+    assert store.get("projector") is None
+    store.set("projector", 10)
+    store.set("projector", 10)
+    store.set("projector", 12)
+
+    messages = client.get_stream_messages("account:position-projector")
+    assert [(m.type, m.data) for m in messages] == [
+        ("Recorded", {"position": 10}),
+        ("Recorded", {"position": 12}),
+    ]
+    assert store.get("projector") == 12
+    assert client.last_message_reads == 1
+
+
+def test_message_db_position_store_reads_back_after_restart() -> None:
+    client = CountingClient()
+    MessageDBPositionStore(message_db=client, category="account").set("projector", 7)
+
+    assert MessageDBPositionStore(message_db=client, category="account").get("projector") == 7
+
+
+class RecordingPostgresPositionStore(PostgresPositionStore):
+    def __init__(self, rows: dict[str, int], **kwargs) -> None:
+        super().__init__("postgresql://unused", **kwargs)
+        self.rows = rows
+        self.statements: list[tuple] = []
+
+    def _execute(self, query, params):
+        self.statements.append(params)
+        if len(params) == 2:
+            self.rows.update(zip(*params, strict=True))
+            return None
+        position = self.rows.get(params[0])
+
+        class Result:
+            def fetchone(self):
+                return None if position is None else (position,)
+
+        return Result()
+
+
+def test_postgres_position_store_batches_pending_positions() -> None:
+    store = RecordingPostgresPositionStore({"a": 5}, flush_interval=60.0)
+
+    assert store.get("a") == 5
+    assert store.get("a") == 5
+    assert store.get("b") is None
+    store.set("a", 6)
+    store.set("b", 1)
+    store.set("a", 8)
+    assert len(store.statements) == 2
+
+    store.close()
+
+    assert store.statements[-1] == (["a", "b"], [8, 1])
+    assert store.rows == {"a": 8, "b": 1}
+    assert store.flushes == 1
+
+
+def test_postgres_position_store_flushes_when_interval_has_elapsed() -> None:
+    store = RecordingPostgresPositionStore({}, flush_interval=0.0)
+
+    store.set("a", 1)
+    store.set("a", 2)
+
+    assert store.statements == [(["a"], [1]), (["a"], [2])]
+    store.close()
@@ -0,0 +1,127 @@
+from contextlib import contextmanager
+
+import pytest
+from psycopg.types.json import Jsonb
+from psycopg.types.numeric import Int8
+
+from eventide_python.message_db import PostgresMessageDBClient, ReadFence, postgres
+from eventide_python.message_db.codec import StdlibJsonCodec
+from eventide_python.message_db.message_data import ReadMessage, WriteMessage
+from eventide_python.message_db.params import connect_kwargs, prepare_mode, write_params
+from eventide_python.message_db.routing import wait_for_fence
+
+
+def test_statements_are_prepared_only_on_reused_connections() -> None:
+    assert prepare_mode(None, pooled=True) is True
+    assert prepare_mode(None, pooled=False) is None
+    assert prepare_mode(False, pooled=True) is False
+
+
+def test_disabling_prepare_turns_off_automatic_preparation() -> None:
+    assert connect_kwargs(False) == {"prepare_threshold": None}
+    assert connect_kwargs(True) == {}
+
+
+def test_write_params_use_stable_parameter_types() -> None:
+    batch = [WriteMessage(id="1", type="A", data={"a": 1}), WriteMessage(id="2", type="B")]
+
+    params = write_params(batch, "order-1", 4, StdlibJsonCodec())
+
+    assert [type(param[5]) for param in params] == [Int8, Int8]
+    assert [param[5] for param in params] == [4, 5]
+    assert isinstance(params[0][3], Jsonb)
+    assert params[1][3] is None
+
+
+def test_wait_for_fence_polls_until_position_is_visible() -> None:
+    versions = iter([None, 0, 2])
+    sleeps: list[float] = []
+
+    reached = wait_for_fence(
+        lambda stream_name: next(versions),
+        ReadFence("account-1", 2),
+        timeout=1.0,
+        poll_interval=0.01,
+        sleep=sleeps.append,
+    )
+
+    assert reached
+    assert sleeps == [0.01, 0.01]
+
+
+def test_wait_for_fence_gives_up_after_timeout() -> None:
+    now = [0.0]
+
+    def sleep(seconds: float) -> None:
+        now[0] += seconds
+
+    reached = wait_for_fence(
+        lambda stream_name: 0,
+        ReadFence("account-1", 1),
+        timeout=0.05,
+        poll_interval=0.02,
+        clock=lambda: now[0],
+        sleep=sleep,
+    )
+
+    assert not reached
+    assert now[0] == pytest.approx(0.05)
+
+
+def test_reads_rotate_across_replicas_and_fall_back_to_primary(monkeypatch) -> None:
+    opened: list[str] = []
+
+    @contextmanager
+    def fake_connection(pool, dsn, kwargs):
+        opened.append(dsn)
+        yield dsn
+
+    monkeypatch.setattr(postgres, "_pooled_or_new", fake_connection)
+    client = PostgresMessageDBClient("primary", replicas=["replica-1", "replica-2"])
+    monkeypatch.setattr(client, "_wait_for_fence", lambda conn, fence: conn == "replica-1")
+
+    for _ in range(3):
+        with client._read_connection(None) as conn:
+            pass
+    with client._read_connection(ReadFence("account-1", 0)) as conn:
+        assert conn == "primary"
+
+    assert opened == ["replica-1", "replica-2", "replica-1", "replica-2", "primary"]
+
+
+def test_many_stream_reads_pipeline_one_round_per_page(monkeypatch) -> None:
+    lengths = {"account-1": 5, "account-2": 1, "account-3": 0}
+    rounds: list[list[tuple]] = []
+
+    @contextmanager
+    def fake_connection(pool, dsn, kwargs):
+        yield dsn
+
+    def fetch_pipelined(conn, query, params_seq, scope):
+        rounds.append([(params[0], int(params[1])) for params in params_seq])
+        return [
+            [
+                ReadMessage(id=f"{name}/{p}", type="Tested", stream_name=name, position=p)
+                for p in range(int(position), min(int(position) + int(size), lengths[name]))
+            ]
+            for name, position, size, _ in params_seq
+        ]
+
+    monkeypatch.setattr(postgres, "_pooled_or_new", fake_connection)
+    client = PostgresMessageDBClient("primary")
+    monkeypatch.setattr(client, "_fetch_pipelined", fetch_pipelined)
+
+    messages = client.get_many_stream_messages(
+        {"account-1": None, "account-2": 0, "account-3": None}, batch_size=2
+    )
+
+    assert {name: [m.position for m in page] for name, page in messages.items()} == {
+        "account-1": [0, 1, 2, 3, 4],
+        "account-2": [0],
+        "account-3": [],
+    }
+    assert rounds == [
+        [("account-1", 0), ("account-2", 0), ("account-3", 0)],
+        [("account-1", 2)],
+        [("account-1", 4)],
+    ]
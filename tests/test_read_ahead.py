@@ -0,0 +1,138 @@
+import threading
+
+import pytest
+
+from eventide_python.message_db import PostgresMessageDBClient
+from eventide_python.message_db.batch_sizing import AdaptiveBatchSize
+from eventide_python.message_db.message_data import ReadMessage
+from eventide_python.message_db.read_ahead import iter_pages, iter_pages_adaptive, iter_pages_ahead
+
+
+def make_fetch(total: int, batch_size: int, calls: list[int]):
+    def fetch_page(position: int) -> list[int]:
+        calls.append(position)
+        return list(range(position, min(position + batch_size, total + 1)))
+
+    return fetch_page
+
+
+def test_iter_pages_stops_on_short_page() -> None:
+    calls: list[int] = []
+    items = list(iter_pages(make_fetch(7, 3, calls), 1, 3, lambda item: item + 1))
+
+    assert items == [1, 2, 3, 4, 5, 6, 7]
+    assert calls == [1, 4, 7]
+
+
+def test_iter_pages_ahead_yields_same_sequence() -> None:
+    calls: list[int] = []
+    items = list(iter_pages_ahead(make_fetch(10, 3, calls), 1, 3, lambda item: item + 1, 2))
+
+    assert items == list(range(1, 11))
+    assert calls == [1, 4, 7, 10]
+
+
+def test_iter_pages_ahead_stops_fetching_when_consumer_stops() -> None:
+    fetched = threading.Event()
+    calls: list[int] = []
+
+    def fetch_page(position: int) -> list[int]:
+        calls.append(position)
+        fetched.set()
+        return list(range(position, position + 2))
+
+    iterator = iter_pages_ahead(fetch_page, 1, 2, lambda item: item + 1, 1)
+    assert next(iterator) == 1
+    iterator.close()
+
+    count = len(calls)
+    fetched.clear()
+    fetched.wait(0.2)
+    assert len(calls) <= count + 1
+
+
+def test_iter_pages_ahead_reraises_fetch_errors() -> None:
+    def fetch_page(position: int) -> list[int]:
+        if position > 1:
+            raise RuntimeError("boom")
+        return [1, 2]
+
+    iterator = iter_pages_ahead(fetch_page, 1, 2, lambda item: item + 1, 2)
+    assert next(iterator) == 1
+    assert next(iterator) == 2
+    with pytest.raises(RuntimeError):
+        next(iterator)
+
+
+def test_client_category_iterator_reads_ahead() -> None:
+    client = PostgresMessageDBClient("postgresql://unused", read_ahead=2)
+
+    def get_category_messages(category, position=None, batch_size=None, **kwargs):
+        return [
+            ReadMessage(id=str(p), type="Tested", stream_name="order-1", global_position=p)
+            for p in range(position, min(position + batch_size, 6))
+        ]
+
+    client.get_category_messages = get_category_messages  # type: ignore[method-assign]
+
+    positions = [m.global_position for m in client.iter_category_messages("order", batch_size=2)]
+
+    assert positions == [1, 2, 3, 4, 5]
+
+
+def test_iter_pages_adaptive_requests_current_batch_size() -> None:
+    sizes: list[int] = []
+
+    def fetch_page(position: int, batch_size: int) -> list[int]:
+        sizes.append(batch_size)
+        return list(range(position, min(position + batch_size, 51)))
+
+    sizing = AdaptiveBatchSize(initial=5, minimum=1, maximum=20, target_latency=10.0)
+    items = list(iter_pages_adaptive(fetch_page, 1, sizing, lambda item: item + 1))
+
+    assert items == list(range(1, 51))
+    assert sizes == [5, 10, 20, 20]
+
+
+def test_client_category_iterator_uses_adaptive_batch_sizing() -> None:
+    client = PostgresMessageDBClient("postgresql://unused", read_ahead=2)
+    sizes: list[int] = []
+
+    def get_category_messages(category, position=None, batch_size=None, **kwargs):
+        sizes.append(batch_size)
+        return [
+            ReadMessage(id=str(p), type="Tested", stream_name="order-1", global_position=p)
+            for p in range(position, min(position + batch_size, 8))
+        ]
+
+    client.get_category_messages = get_category_messages  # type: ignore[method-assign]
+    sizing = AdaptiveBatchSize(initial=2, minimum=1, maximum=4, target_latency=10.0)
+
+    positions = [
+        m.global_position for m in client.iter_category_messages("order", batch_sizing=sizing)
+    ]
+
+    assert positions == list(range(1, 8))
+    assert sizes == [2, 4, 4]
+    with pytest.raises(ValueError):
+        client.iter_category_messages("order", read_ahead=2, batch_sizing=sizing)
+
+
+def test_iter_pages_ahead_stops_on_empty_unlimited_page() -> None:
+    calls: list[int] = []
+
+    def fetch_page(position: int) -> list[int]:
+        calls.append(position)
+        return [1, 2, 3] if position == 1 else []
+
+    items = list(iter_pages_ahead(fetch_page, 1, -1, lambda item: item + 1, 2))
+
+    assert items == [1, 2, 3]
+    assert calls == [1, 4]
+
+
+def test_client_stream_iterator_reads_ahead_without_limit_on_empty_stream() -> None:
+    client = PostgresMessageDBClient("postgresql://unused", read_ahead=2)
+    client.get_stream_messages = lambda *args, **kwargs: []  # type: ignore[method-assign]
+
+    assert list(client.iter_stream_messages("a-1", batch_size=-1)) == []
@@ -33,3 +33,21 @@ def test_service_host_handles_errors() -> None:
     host.register(service)
     host.run(max_iterations=2)
     assert service.calls == 2
+
+
+class RecordingSignal:
+    def __init__(self) -> None:
+        self.timeouts: list[float] = []
+
+    def wait(self, timeout: float) -> bool:
+        self.timeouts.append(timeout)
+        return False
+
+
+def test_service_host_waits_on_wakeup_signal() -> None:
+    signal = RecordingSignal()
+    host = ServiceHost(poll_interval=5.0, wakeup=signal)
+    host.register(CounterService())
+    host.run(max_iterations=3)
+    assert signal.timeouts == [5.0, 5.0]
+